@@ -9,4 +9,10 @@ if sys.implementation.name == "micropython":
     SAVE_PATH = "/bmon_gr_saves/"
 else:
     ASSET_PATH = "./apps/badgemon/assets/"
-    SAVE_PATH = "./apps/badgemon/saves/"
\ No newline at end of file
+    SAVE_PATH = "./apps/badgemon/saves/"
+
+# Shows frame timings over the game, and logs them on desktop. See util/profiler.py
+PROFILE = False
+
+# How many scenes (of the cacheable ones) are kept after being left, so that going back to them is instant
+SCENE_CACHE_SIZE = 2
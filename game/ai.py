@@ -0,0 +1,176 @@
+from sys import implementation as _sys_implementation
+if _sys_implementation.name != "micropython":
+    from typing import List, Tuple, Union
+
+from . import calculation, constants, mons, moves
+from .player import Cpu
+from ..util.misc import ticks_us, ticks_diff
+
+# How long a decision may search for, in microseconds. About a frame on the badge, much more on desktop.
+BUDGET_US = 10000 if _sys_implementation.name == "micropython" else 200000
+# Plies (one side's move) to search at most, if there's time.
+MAX_DEPTH = 12
+
+_WIN = 1000000
+# The state's layout: both HPs, then each side's pp
+_HP = 0
+_PP = 2
+
+
+class _OutOfTime(Exception):
+    pass
+
+
+class SearchState:
+    """
+    Just the parts of a battle that a search changes, as one flat list of ints so that cloning is a single copy:
+     [hp of side 0, hp of side 1, side 0's pp * 4, side 1's pp * 4]. Side 0 is the mon making the decision.
+    Stats, types and moves don't change during a search, so they're not copied and live in the searcher instead.
+    """
+    def __init__(self, values: List[int]):
+        self.values = values
+
+    @staticmethod
+    def from_mons(me: mons.Mon, them: mons.Mon) -> 'SearchState':
+        values = [me.hp, them.hp, 0, 0, 0, 0, 0, 0, 0, 0]
+        for side, mon in enumerate((me, them)):
+            for slot in range(min(4, len(mon.moves), len(mon.pp))):
+                values[_PP + side * 4 + slot] = mon.pp[slot]
+        return SearchState(values)
+
+    def clone(self) -> 'SearchState':
+        return SearchState(self.values[:])
+
+
+def _move_options(user: mons.Mon, target: mons.Mon) -> List[Tuple[int, int, int]]:
+    """
+    Each of user's moves as (slot, expected damage, hit chance in percent), best first.
+    Only damage and accuracy are modelled, so moves that only have effects score 0.
+    """
+    options = []
+    for slot, move in enumerate(user.moves[:4]):
+        if move.special_override == moves.MoveOverrideSpecial.NO_OVERRIDE:
+            attack, defense = user.stats[constants.STAT_ATK], target.stats[constants.STAT_DEF]
+        else:
+            attack, defense = user.stats[constants.STAT_SPATK], target.stats[constants.STAT_SPDEF]
+        damage = calculation.expected_damage(
+            user.level, move.power, attack, defense, move.move_type,
+            user.template.type1, user.template.type2, target.template.type1, target.template.type2)
+        chance = min(calculation.hit_threshold(move.accuracy, user.accuracy, target.evasion) + 1, 100)
+        options.append((slot, damage, chance))
+    # Ordering: most expected damage first. Searching the likely best move first means it's the one that
+    # finishes if time runs out, and gives the opponent's replies a good bound to be compared against.
+    options.sort(key=lambda o: o[1] * o[2], reverse=True)
+    return options
+
+
+class Searcher:
+    """
+    Expectimax over the two active mons. The side to move picks the move that's best for it, each move is a chance
+     node (hit or miss), and a hit does the expected damage (averaged over crits and rolls with
+     calculation.expected_damage), so the only branching is which move and whether it hits.
+    Leaves are scored on the difference in HP fraction. Search deepens one ply at a time until BUDGET_US runs out,
+     and the deepest finished answer is used.
+    """
+    def __init__(self, me: mons.Mon, them: mons.Mon, budget_us: int = BUDGET_US):
+        self._options = (_move_options(me, them), _move_options(them, me))
+        self._max_hp = (max(1, me.stats[constants.STAT_HP]), max(1, them.stats[constants.STAT_HP]))
+        self._budget = budget_us
+        self._start = 0
+        self.nodes = 0
+        self.depth = 0
+        self._cut = False
+
+    def _evaluate(self, values: List[int]) -> int:
+        return (values[0] * 1000) // self._max_hp[0] - (values[1] * 1000) // self._max_hp[1]
+
+    def _search(self, values: List[int], depth: int, side: int) -> int:
+        if values[0] <= 0:
+            return -_WIN - depth  # lose as late as possible
+        if values[1] <= 0:
+            return _WIN + depth  # win as soon as possible
+        if depth == 0:
+            self._cut = True
+            return self._evaluate(values)
+        self.nodes += 1
+        if self.nodes & 31 == 0 and ticks_diff(ticks_us(), self._start) > self._budget:
+            raise _OutOfTime()
+
+        other = 1 - side
+        best = None
+        for slot, damage, chance in self._options[side]:
+            pp = _PP + side * 4 + slot
+            if values[pp] <= 0:
+                continue
+            values[pp] -= 1
+            hp = values[other]
+            values[other] = hp - damage
+            value = self._search(values, depth - 1, other) * chance
+            values[other] = hp
+            if chance < 100:
+                value += self._search(values, depth - 1, other) * (100 - chance)
+            values[pp] += 1
+            value //= 100
+            if best is None or (value > best if side == 0 else value < best):
+                best = value
+
+        if best is None:
+            if side == 0:
+                return -_WIN  # Out of pp, which forfeits
+            return self._search(values, depth - 1, other)
+        return best
+
+    def best_slot(self, state: SearchState) -> Union[int, None]:
+        """
+        :return: The slot of the best move for side 0, or None if it has no pp left.
+        """
+        self._start = ticks_us()
+        root = [o for o in self._options[0] if state.values[_PP + o[0]] > 0]
+        if not root:
+            return None
+        best = root[0][0]
+        for depth in range(1, MAX_DEPTH + 1):
+            self._cut = False
+            values = state.clone().values
+            scores = []
+            try:
+                for option in root:
+                    slot, damage, chance = option
+                    pp = _PP + slot
+                    values[pp] -= 1
+                    values[1] -= damage
+                    value = self._search(values, depth - 1, 1) * chance
+                    values[1] += damage
+                    if chance < 100:
+                        value += self._search(values, depth - 1, 1) * (100 - chance)
+                    values[pp] += 1
+                    scores.append((value // 100, option))
+            except _OutOfTime:
+                # The first move is last iteration's best, so if it finished it can still be compared against.
+                if scores:
+                    best = max(scores, key=lambda s: s[0])[1][0]
+                break
+            self.depth = depth
+            scores.sort(key=lambda s: s[0], reverse=True)
+            root = [s[1] for s in scores]
+            best = root[0][0]
+            if not self._cut:
+                break  # Every line ends in a faint, so searching deeper won't change anything
+        return best
+
+
+class SearchCpu(Cpu):
+    """
+    A CPU that thinks ahead with Searcher, rather than picking a move at random. It doesn't switch mons or use items.
+    """
+    def __init__(self, *args, budget_us: int = BUDGET_US, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.budget_us = budget_us
+
+    async def get_move(self, mon: mons.Mon) -> Union[moves.Move, None]:
+        battle = self.battle_context
+        them = battle.mon1 if battle.player2 is self else battle.mon2
+        slot = Searcher(mon, them, self.budget_us).best_slot(SearchState.from_mons(mon, them))
+        if slot is None:
+            return None
+        return mon.moves[slot]
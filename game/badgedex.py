@@ -1,19 +1,81 @@
 from .mons import mons_list
-from struct import pack, unpack_from, calcsize
+
+# Set bits in each byte value
+_POPCOUNT = bytes(bin(i).count("1") for i in range(256))
+
+def _popcount(bits: bytearray) -> int:
+    count = 0
+    for b in bits:
+        count += _POPCOUNT[b]
+    return count
 
 class Badgedex:
+    """
+    Which mons the player has seen (in battle), and which they've caught (or evolved, or picked to start with).
+    Caught mons are always seen too.
+
+    Each is a bitmap, a bit per mon, and how many are set is kept up to date as they're set, so seen_count and
+    caught_count cost nothing to read (e.g. every frame on the field).
+    """
     def __init__(self):
-        self.found = [False]*len(mons_list)
-    
-    def find(self, index):
-        self.found[index] = True
-    
-    def serialise(self):
-        return pack(f'{len(self.found)}B', *self.found)
+        size = (len(mons_list) + 7) >> 3
+        self._seen = bytearray(size)
+        self._caught = bytearray(size)
+        self.seen_count = 0
+        self.caught_count = 0
+
+    def seen(self, index: int) -> bool:
+        return bool(self._seen[index >> 3] & (1 << (index & 7)))
+
+    def caught(self, index: int) -> bool:
+        return bool(self._caught[index >> 3] & (1 << (index & 7)))
+
+    def see(self, index: int):
+        bit = 1 << (index & 7)
+        if not self._seen[index >> 3] & bit:
+            self._seen[index >> 3] |= bit
+            self.seen_count += 1
+
+    def find(self, index: int):
+        """
+        Marks the mon as caught.
+        """
+        self.see(index)
+        bit = 1 << (index & 7)
+        if not self._caught[index >> 3] & bit:
+            self._caught[index >> 3] |= bit
+            self.caught_count += 1
+
+    def record(self) -> bytes:
+        """
+        The seen bitmap, then the caught one, the same size.
+        """
+        return bytes(self._seen) + bytes(self._caught)
+
+    @staticmethod
+    def from_record(record: bytes) -> 'Badgedex':
+        b = Badgedex()
+        # Saves from before mons were added have smaller bitmaps, ones from after have bigger
+        half = len(record) >> 1
+        for i in range(min(half, len(b._seen))):
+            b._seen[i] = record[i]
+            b._caught[i] = record[half + i]
+        # Bits past the last mon there is now, from a bigger bitmap, aren't counted
+        extra = len(mons_list) & 7
+        if extra and half >= len(b._seen):
+            b._seen[-1] &= (1 << extra) - 1
+            b._caught[-1] &= (1 << extra) - 1
+        b.seen_count = _popcount(b._seen)
+        b.caught_count = _popcount(b._caught)
+        return b
 
     @staticmethod
-    def deserialise(data):
+    def from_found(found) -> 'Badgedex':
+        """
+        From one flag per mon, as saves before version 4 had it (where found meant caught, and seen wasn't kept).
+        """
         b = Badgedex()
-        b.found = [bool(unpack_from('B', data, m * calcsize("B"))[0]) for m in range(0, len(mons_list))]
+        for i in range(min(len(found), len(mons_list))):
+            if found[i]:
+                b.find(i)
         return b
-    
\ No newline at end of file
@@ -0,0 +1,148 @@
+from sys import implementation as _sys_implementation
+if _sys_implementation.name != "micropython":
+    from typing import List, Tuple, Union
+
+from . import constants, calculation, moves
+
+# Every event is (kind, user, target, value, amount, extra, log). What each field means depends on the kind:
+#  user/target are mons (or players, for money and wins), value and amount are ints, extra is a move, item, status
+#  or type, and log is a custom format string (None for the default).
+EV_TEXT = 0           # log: literal text
+EV_MOVE = 1           # user used extra (a move) on target
+EV_HIT = 2            # value: 1 if it was a critical hit
+EV_MISS = 3
+EV_EFFECTIVENESS = 4  # value: calculation.EFF_*
+EV_STATUS = 5         # target got extra (a status), value: 1 if it took
+EV_DAMAGE = 6         # target took value damage out of amount, extra: the type
+EV_HEAL = 7           # target regained value HP out of amount
+EV_EXP = 8            # user gained value exp for beating target
+EV_FAINT = 9          # target fainted
+EV_MONEY = 10         # user (a player) got value monies
+EV_WIN = 11           # user (a player) won, value: 1 if by default
+EV_ITEM = 12          # extra (an item) was used
+EV_DOLL = 13          # user admired the doll
+EV_NO_CATCH = 14
+EV_CATCH_SHAKE = 15   # value: which shake
+EV_ESCAPED = 16
+EV_FELL_IN = 17       # target was caught without any shakes
+EV_DESCRIBE = 18      # extra: the move or item
+
+_SHAKES = ("ooo...", "Oooooo... ", "OOOOOOOOO...", "Yes! You caught them!")
+
+def _name(thing) -> str:
+    return getattr(thing, "nickname", None) or getattr(thing, "name", str(thing))
+
+def render(kind: int, user, target, value: int, amount: int, extra, log: Union[str, None]) -> Union[str, None]:
+    """
+    The text for an event, as the battle used to write it. None if the event has nothing to say.
+    """
+    if kind == EV_TEXT:
+        return log
+    if kind == EV_MOVE:
+        return (log or "{user} used {move_name}!\n").format(user=_name(user), move_name=extra.name)
+    if kind == EV_HIT:
+        return "A CRITICAL Hit!\n" if value else "A Hit!\n"
+    if kind == EV_MISS:
+        return "A Miss!\n"
+    if kind == EV_EFFECTIVENESS:
+        if value == calculation.EFF_EFFECTIVE:
+            return "It was really effective!\n"
+        if value == calculation.EFF_INEFFECTIVE:
+            return "It didn't really do much...\n"
+        return None
+    if kind == EV_STATUS:
+        return (log or "{target} was inflicted with the {status} condition!\n").format(
+            target=target, user=user, status=constants.status_to_str(extra))
+    if kind == EV_DAMAGE:
+        return (log or "{target} took {damage_taken} damage!\n").format(
+            target=_name(target), user=_name(user), damage_taken=-value, dmg_type=constants.type_to_str(extra),
+            original_damage=amount)
+    if kind == EV_HEAL:
+        return (log or "{target} regained {heal_taken} HP!\n").format(
+            target=target, user=user, heal_taken=value, original_heal=amount)
+    if kind == EV_EXP:
+        return (log or "{user} gained {exp} experience!\n").format(target=_name(target), user=_name(user), exp=value)
+    if kind == EV_FAINT:
+        return f"{_name(target)} fainted!"
+    if kind == EV_MONEY:
+        return f"Got {value} monies!"
+    if kind == EV_WIN:
+        return f"{user.name} wins by default!" if value else f"{user.name} wins!"
+    if kind == EV_ITEM:
+        return f"Used {extra.name}!"
+    if kind == EV_DOLL:
+        return f"{_name(user)} appreciated the craftsmanship of the doll."
+    if kind == EV_NO_CATCH:
+        return "Oh no! You can't catch THAT Badgemon!"
+    if kind == EV_CATCH_SHAKE:
+        return _SHAKES[value]
+    if kind == EV_ESCAPED:
+        return "NO! They escaped!"
+    if kind == EV_FELL_IN:
+        return f"{_name(target)} just fell straight in!"
+    if kind == EV_DESCRIBE:
+        if isinstance(extra, moves.Move):
+            return f"|TYPE: {constants.type_to_str(extra.move_type)}| {extra.desc}"
+        return extra.desc
+    return None
+
+
+class EventSink:
+    """
+    Where a battle's events go. This one throws them away, which is all a simulation needs.
+
+    emit is called for every event, and returns True if the battle should wait on drain() before carrying on
+     (e.g. until the player has read it). Returning False skips the await entirely, so a sink that doesn't need
+     to pace the battle costs one call per event and never formats any text.
+    """
+    def emit(self, kind: int, user=None, target=None, value: int = 0, amount: int = 0, extra=None,
+             log: Union[str, None] = None) -> bool:
+        return False
+
+    async def drain(self):
+        pass
+
+
+class RecordingSink(EventSink):
+    """
+    Keeps every event, for checking what happened after a headless battle.
+    """
+    def __init__(self):
+        self.events = []  # type: List[Tuple]
+
+    def emit(self, kind: int, user=None, target=None, value: int = 0, amount: int = 0, extra=None,
+             log: Union[str, None] = None) -> bool:
+        self.events.append((kind, user, target, value, amount, extra, log))
+        return False
+
+
+class PrintSink(EventSink):
+    def emit(self, kind: int, user=None, target=None, value: int = 0, amount: int = 0, extra=None,
+             log: Union[str, None] = None) -> bool:
+        text = render(kind, user, target, value, amount, extra, log)
+        if text:
+            print(text)
+        return False
+
+
+class NewsSink(EventSink):
+    """
+    Writes events out as text on a news target (anything with an async write, like SpeechDialog),
+     waiting for each one to be read before the battle carries on. Only this sink ever formats text.
+    """
+    def __init__(self, news_target):
+        self.news_target = news_target
+        self._pending = None
+
+    def emit(self, kind: int, user=None, target=None, value: int = 0, amount: int = 0, extra=None,
+             log: Union[str, None] = None) -> bool:
+        self._pending = (kind, user, target, value, amount, extra, log)
+        return True
+
+    async def drain(self):
+        event = self._pending
+        self._pending = None
+        if event is not None:
+            text = render(*event)
+            if text:
+                await self.news_target.write(text)
@@ -1,26 +1,40 @@
 from ..util import static_random as random
-import sys
 
 from app import App
 
-from ..util.speech import SpeechDialog
-
 from sys import implementation as _sys_implementation
 if _sys_implementation.name != "micropython":
     from typing import Union
 
 from . import constants, mons, moves, calculation, player, items
+from .battle_events import *
+
+
+class Describe:
+    """
+    An action that only shows a description of a move or item. It doesn't use up the turn.
+    """
+    def __init__(self, t):
+        self.t = t
+
+    def __str__(self) -> str:
+        return self.t.desc
 
 
 class Battle:
-    def __init__(self, player1: player.Player, player2: player.Player, app: App, news_target: SpeechDialog):
+    def __init__(self, player1: player.Player, player2: player.Player, app: App, events: EventSink,
+                 seed: Union[int, None] = None, journal: Union['BattleJournal', None] = None):
         """
         A battle takes place between two players, until all BadgeMon on one side have fainted.
 
         @param player1: The beloved hero!
         @param player2: The cruel enemy!
         @param start: Does player1 start
-        @param news_target: Output for all log messages
+        @param events: Where everything that happens is reported, see game/battle_events.py. Anything with an async
+         write (like SpeechDialog) is wrapped in a NewsSink. If None, events are dropped.
+        @param seed: Seed for the battle's random stream. Every roll in the battle comes from it,
+         so the same seed and the same choices play out the same battle. Picked at random if None.
+        @param journal: If given, the seed, both players and every action are recorded into it (see game/journal.py)
         """
 
         self.player1 = player1
@@ -29,23 +43,39 @@ class Battle:
         # We assume the first mon is in position 0
         self.mon1 = player1.badgemon[0]
         self.mon2 = player2.badgemon[0]
+        player1.badgedex.see(self.mon2.template.id)
+        player2.badgedex.see(self.mon1.template.id)
 
-        if news_target:
-            self.news_target = news_target
-        else:
-            self.news_target = sys.stdout
+        if events is None:
+            events = EventSink()
+        elif not isinstance(events, EventSink):
+            events = NewsSink(events)
+        self.events = events
 
         player1.battle_context = self
         player2.battle_context = self
 
+        if seed is None:
+            seed = random.getrandbits(30)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        # CPU decisions get their own stream, so replaying recorded decisions (which doesn't roll for them)
+        # leaves every roll on self.rng where it was.
+        self.cpu_rng = self.rng.fork()
+
         if self.mon1.stats[constants.STAT_SPD] == self.mon2.stats[constants.STAT_SPD]:
-            self.turn = random.getrandbits(1) == 0
+            self.turn = self.rng.getrandbits(1) == 0
         else:
             self.turn = self.mon1.stats[constants.STAT_SPD] > self.mon2.stats[constants.STAT_SPD]
         self._app = app
 
+        self.journal = journal
+        if journal is not None:
+            journal.start(seed, player1, player2)
+
     async def push_news_entry(self, *entry):
-        await self.news_target.write(" ".join(str(e) for e in entry))
+        if self.events.emit(EV_TEXT, log=" ".join(str(e) for e in entry)):
+            await self.events.drain()
 
     async def use_move(self, user: mons.Mon, target: mons.Mon, move: moves.Move, custom_log: str = ""):
         """
@@ -56,37 +86,35 @@ class Battle:
         :param move: The move to use.
         :param custom_log: A format string. Valid format values are {user} and {move_name}.
         """
-        if custom_log == "":
-            custom_log = "{user} used {move_name}!\n"
-        await self.push_news_entry(custom_log.format(user=user.nickname, move_name=move.name))
+        if self.events.emit(EV_MOVE, user, target, extra=move, log=custom_log or None):
+            await self.events.drain()
 
         if move.special_override == moves.MoveOverrideSpecial.NO_OVERRIDE:
             (damage, crit, effective) = calculation.calculate_damage(
                 user.level, move.power, user.stats[constants.STAT_ATK], target.stats[constants.STAT_DEF], move.move_type,
-                user.template.type1, user.template.type2, target.template.type1, target.template.type2)
+                user.template.type1, user.template.type2, target.template.type1, target.template.type2, self.rng)
         else:
             (damage, crit, effective) = calculation.calculate_damage(
                 user.level, move.power, user.stats[constants.STAT_SPATK], target.stats[constants.STAT_SPDEF],
-                move.move_type, user.template.type1, user.template.type2, target.template.type1, target.template.type2)
+                move.move_type, user.template.type1, user.template.type2, target.template.type1, target.template.type2,
+                self.rng)
 
-        if calculation.get_hit(move.accuracy, user.accuracy, target.evasion):
-            if crit:
-                await self.push_news_entry("A CRITICAL Hit!\n")
-            else:
-                await self.push_news_entry("A Hit!\n")
+        if calculation.get_hit(move.accuracy, user.accuracy, target.evasion, self.rng):
+            if self.events.emit(EV_HIT, user, target, 1 if crit else 0):
+                await self.events.drain()
+
+            if effective != calculation.EFF_NORMAL:
+                if self.events.emit(EV_EFFECTIVENESS, user, target, effective):
+                    await self.events.drain()
 
-            if effective == calculation.EFF_EFFECTIVE:
-                await self.push_news_entry("It was really effective!\n")
-            elif effective == calculation.EFF_INEFFECTIVE:
-                await self.push_news_entry("It didn't really do much...\n")
-            
             if move.effect_on_hit:
                 await move.effect_on_hit.execute(self, user, target, damage)
 
             await self.deal_damage(user, target, damage, move.move_type)
 
         else:
-            await self.push_news_entry("A Miss!\n")
+            if self.events.emit(EV_MISS, user, target):
+                await self.events.drain()
             if move.effect_on_miss:
                 await move.effect_on_miss.execute(self, user, target, damage)
 
@@ -102,9 +130,8 @@ class Battle:
         :return: Whether the status was successfully applied.
         """
         status_taken = target.apply_status(status)
-        if custom_log == "":
-            custom_log = "{target} was inflicted with the {status} condition!\n"
-        await self.push_news_entry(custom_log.format(target=target, user=user, status=constants.status_to_str(status)))
+        if self.events.emit(EV_STATUS, user, target, 1 if status_taken else 0, extra=status, log=custom_log or None):
+            await self.events.drain()
         return status_taken
 
     async def deal_damage(self, user: Union[mons.Mon, None], target: mons.Mon, amount: int,
@@ -123,10 +150,8 @@ class Battle:
         :return: The amount of damage taken.
         """
         damage_taken = target.take_damage(amount, dmg_type)
-        if custom_log == "":
-            custom_log = "{target} took {damage_taken} damage!\n"
-        await self.push_news_entry(custom_log.format(target=target.nickname, user=user.nickname, damage_taken=-damage_taken,
-                                               dmg_type=constants.type_to_str(dmg_type), original_damage=amount))
+        if self.events.emit(EV_DAMAGE, user, target, damage_taken, amount, dmg_type, custom_log or None):
+            await self.events.drain()
         return damage_taken
 
     async def gain_exp(self, user: mons.Mon, target: mons.Mon, custom_log: str = "") -> int:
@@ -139,9 +164,8 @@ class Battle:
         """
         exp = calculation.get_experience(user, target)
         user.gain_exp(exp)
-        if custom_log == "":
-            custom_log = "{user} gained {exp} experience!\n"
-        await self.push_news_entry(custom_log.format(target=target.nickname, user=user.nickname, exp=exp))
+        if self.events.emit(EV_EXP, user, target, exp, log=custom_log or None):
+            await self.events.drain()
         return exp
 
     async def heal_target(self, user: Union[mons.Mon, None], target: mons.Mon, amount: int, custom_log: str = ""):
@@ -158,27 +182,138 @@ class Battle:
         :return: The amount of damage taken.
         """
         heal_taken = target.take_heal(amount)
-        if custom_log == "":
-            custom_log = "{target} regained {heal_taken} HP!\n"
-        await self.push_news_entry(custom_log.format(target=target, user=user, heal_taken=heal_taken, original_heal=amount))
+        if self.events.emit(EV_HEAL, user, target, heal_taken, amount, log=custom_log or None):
+            await self.events.drain()
         return heal_taken
 
     async def catch(self, user: player.Player, this_mon: mons.Mon, target: mons.Mon, ball: items.Item):
         ball_rate = ball.function_in_battle(user, self, this_mon, target)
         (base, rate) = calculation.get_catch_rate(target, ball_rate)
-        if base == 1.0:
-            await self.push_news_entry(f"{target.nickname} just fell straight in!")
+        if base >= calculation.CATCH_CERTAIN:
+            if self.events.emit(EV_FELL_IN, this_mon, target):
+                await self.events.drain()
             return True
         else:
-            ooos = ["ooo...", "Oooooo... ", "OOOOOOOOO...", "Yes! You caught them!"]
-            escape = "NO! They escaped!"
-            caught = True
-            for oo in ooos:
-                if calculation.get_shake(rate):
-                    await self.push_news_entry(oo)
+            for shake in range(4):
+                if calculation.get_shake(rate, self.rng):
+                    if self.events.emit(EV_CATCH_SHAKE, this_mon, target, shake):
+                        await self.events.drain()
+                else:
+                    if self.events.emit(EV_ESCAPED, this_mon, target):
+                        await self.events.drain()
+                    return False
+            return True
+
+    async def gain_money(self, user: player.Player, amount: int):
+        user.money += amount
+        if self.events.emit(EV_MONEY, user, value=amount):
+            await self.events.drain()
+
+    async def _replace_fainted(self, side: player.Player, fainted: mons.Mon) -> bool:
+        """
+        Asks side for a new mon to replace fainted. Returns False if side has no mons left to send out.
+        """
+        for mon in side.badgemon:
+            if not mon.fainted:
+                break
+        else:
+            return False
+        new_badgemon = await side.get_new_badgemon()
+        if self.journal is not None:
+            self.journal.record(side, new_badgemon)
+        self._send_out(side, new_badgemon)
+        return True
+
+    def _send_out(self, side: player.Player, mon: mons.Mon):
+        if side is self.player1:
+            self.mon1 = mon
+            self.player2.badgedex.see(mon.template.id)
+        else:
+            self.mon2 = mon
+            self.player1.badgedex.see(mon.template.id)
+
+    async def run(self) -> player.Player:
+        """
+        Plays the battle out, asking each player for their actions in turn. Nothing here waits on anything
+         but the players and the news target, so it runs just as well without a UI (see game/journal.py).
+        :return: The winner.
+        """
+        while True:
+            if self.turn:
+                curr_player, curr_target = self.player1, self.player2
+                player_mon, target_mon = self.mon1, self.mon2
+            else:
+                curr_player, curr_target = self.player2, self.player1
+                player_mon, target_mon = self.mon2, self.mon1
+
+            if target_mon.fainted:
+                if self.events.emit(EV_FAINT, player_mon, target_mon):
+                    await self.events.drain()
+                if self.turn:
+                    await self.gain_exp(player_mon, target_mon)
+                    await self.gain_money(curr_player, target_mon.level*10)
+                if not await self._replace_fainted(curr_target, target_mon):
+                    if self.events.emit(EV_WIN, curr_player):
+                        await self.events.drain()
+                    return curr_player
+                target_mon = self.mon2 if self.turn else self.mon1
+
+            if player_mon.fainted:
+                if self.events.emit(EV_FAINT, target_mon, player_mon):
+                    await self.events.drain()
+                if not self.turn:
+                    await self.gain_exp(target_mon, player_mon)
+                    await self.gain_money(curr_target, player_mon.level*10)
+                if not await self._replace_fainted(curr_player, player_mon):
+                    if self.events.emit(EV_WIN, curr_target):
+                        await self.events.drain()
+                    return curr_target
+                player_mon = self.mon1 if self.turn else self.mon2
+
+            action = await curr_player.get_move(player_mon)
+
+            same_turn = False
+
+            if not isinstance(action, Describe):
+                if self.journal is not None:
+                    self.journal.record(curr_player, action, player_mon)
+                await curr_target.inform(action)
+
+            if isinstance(action, moves.Move):
+                player_mon.pp[player_mon.moves.index(action)] -= 1
+                await self.use_move(player_mon, target_mon, action)
+
+            elif isinstance(action, mons.Mon):
+                self._send_out(curr_player, action)
+
+            elif isinstance(action, items.Item):
+                if action.name == "Badgemon Doll":
+                    if self.turn and self.events.emit(EV_DOLL, player_mon):
+                        await self.events.drain()
+                    same_turn = True
                 else:
-                    await self.push_news_entry(escape)
-                    caught = False
-                    break
-            return caught
-                    
+                    curr_player.inventory.take(action)
+                if self.events.emit(EV_ITEM, player_mon, target_mon, extra=action):
+                    await self.events.drain()
+                if action.name.endswith("HexBox"):
+                    if not isinstance(self.player2, player.Cpu):
+                        if self.events.emit(EV_NO_CATCH, player_mon, target_mon):
+                            await self.events.drain()
+                    elif await self.catch(curr_player, player_mon, target_mon, action):
+                        await curr_player.gain_badgemon(target_mon, curr_player.badgemon_case, curr_player.badgedex)
+                        return curr_player
+                else:
+                    action.function_in_battle(curr_player, self, player_mon, target_mon)
+
+            elif isinstance(action, Describe):
+                if self.turn and self.events.emit(EV_DESCRIBE, player_mon, extra=action.t):
+                    await self.events.drain()
+                same_turn = True
+
+            elif action is None:
+                if self.events.emit(EV_WIN, curr_target, value=1):
+                    await self.events.drain()
+                return curr_target
+
+            if not same_turn:
+                self.turn = not self.turn
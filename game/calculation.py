@@ -1,4 +1,6 @@
 import math
+from array import array
+
 from ..util import static_random as random
 
 from sys import implementation as _sys_implementation
@@ -18,19 +20,38 @@ EFF_NORMAL = 0
 
 def calculate_damage(level: int, power: int, attack: int, defense: int, type: constants.MonType,
                      mon1_type1: constants.MonType, mon1_type2: constants.MonType, mon2_type1: constants.MonType,
-                     mon2_type2: constants.MonType) -> Tuple[int, bool, int]:
+                     mon2_type2: constants.MonType, rng: random.Random = random.default) -> Tuple[int, bool, int]:
     """
     Calculates the amount of damage to apply.
     Uses https://bulbapedia.bulbagarden.net/wiki/Damage#Generation_V_onward
+    All rolls come from rng, so a seeded stream gives the same damage every time.
 
     @return: (damage, critical hit, effectiveness)
     """
-    damage = (((((level << 1) // 5 + 2) * power * attack) // defense) // 50) + 2
+    damage = base_damage(level, power, attack, defense)
 
-    crit = is_critical()
+    crit = is_critical(rng)
     if crit:
         damage <<= 1
 
+    damage, effective = apply_type_bonus(damage, type, mon1_type1, mon1_type2, mon2_type1, mon2_type2)
+    damage *= rng.randrange(217, 256)
+    damage >>= 8
+    return damage, crit, effective
+
+
+def base_damage(level: int, power: int, attack: int, defense: int) -> int:
+    return (((((level << 1) // 5 + 2) * power * attack) // defense) // 50) + 2
+
+
+def apply_type_bonus(damage: int, type: constants.MonType,
+                     mon1_type1: constants.MonType, mon1_type2: constants.MonType, mon2_type1: constants.MonType,
+                     mon2_type2: constants.MonType) -> Tuple[int, int]:
+    """
+    STAB and type effectiveness.
+
+    @return: (damage, effectiveness)
+    """
     if type == mon1_type1 or type == mon1_type2:  # STAB
         damage += damage >> 1
 
@@ -44,16 +65,28 @@ def calculate_damage(level: int, power: int, attack: int, defense: int, type: co
     elif type_bonus < 0:
         effective = EFF_INEFFECTIVE
         damage >>= -type_bonus
-    damage *= random.randrange(217, 256)
-    damage >>= 8
-    return damage, crit, effective
+    return damage, effective
 
 
-def is_critical() -> bool:
-    return random.getrandbits(3) == 0  # 1/8 chance
+def expected_damage(level: int, power: int, attack: int, defense: int, type: constants.MonType,
+                    mon1_type1: constants.MonType, mon1_type2: constants.MonType, mon2_type1: constants.MonType,
+                    mon2_type2: constants.MonType) -> int:
+    """
+    The average of calculate_damage over every crit and roll, without rolling anything.
+    Off by at most a point or two from the true average, from rounding.
+    """
+    damage = base_damage(level, power, attack, defense)
+    normal = apply_type_bonus(damage, type, mon1_type1, mon1_type2, mon2_type1, mon2_type2)[0]
+    crit = apply_type_bonus(damage << 1, type, mon1_type1, mon1_type2, mon2_type1, mon2_type2)[0]
+    # 7/8 normal and 1/8 crits, then the average roll of 217 to 255 (236) out of 256
+    return ((normal * 7 + crit) * 236) >> 11
+
 
+def is_critical(rng: random.Random = random.default) -> bool:
+    return rng.getrandbits(3) == 0  # 1/8 chance
 
-def get_hit(move_accuracy: int, user_accuracy: int, target_evasion: int) -> bool:
+
+def get_hit(move_accuracy: int, user_accuracy: int, target_evasion: int, rng: random.Random = random.default) -> bool:
     """
     Returns whether an attack should hit
     https://bulbapedia.bulbagarden.net/wiki/Accuracy#Generations_III_and_IV
@@ -63,6 +96,12 @@ def get_hit(move_accuracy: int, user_accuracy: int, target_evasion: int) -> bool
     @param target_evasion:
     @return:
     """
+    return rng.randrange(0, 100) <= hit_threshold(move_accuracy, user_accuracy, target_evasion)
+
+def hit_threshold(move_accuracy: int, user_accuracy: int, target_evasion: int) -> int:
+    """
+    get_hit hits if a roll from 0 to 99 is at most this, so the chance of hitting is min(threshold + 1, 100)%.
+    """
     user_accuracy -= target_evasion
     user_accuracy += 6
     user_accuracy = min(user_accuracy, 11)
@@ -70,27 +109,58 @@ def get_hit(move_accuracy: int, user_accuracy: int, target_evasion: int) -> bool
 
     move_accuracy *= stage
     move_accuracy //= 100
+    return move_accuracy
+
+# get_catch_rate's base chance is a fraction out of CATCH_CERTAIN. At CATCH_CERTAIN, the catch can't fail.
+CATCH_CERTAIN = 1 << 28
 
-    return random.randrange(0, 100) <= move_accuracy
+# x ** 0.25 for x = i / 256 (0 to 1), in 16 bit fixed point. One spare entry at the end so the last step can interpolate.
+_FOURTH_ROOT = array('I', (int(math.pow(i / 256, 0.25) * 65536 + 0.5) for i in range(258)))
+# x ** 2.5 for x = i / 128 (0 to 2), in 12 bit fixed point.
+_POW_2_5 = array('H', (int(math.pow(i / 128, 2.5) * 4096 + 0.5) for i in range(258)))
 
 def get_catch_rate(mon: Mon, ball: float):
+    """
+    The chance of catching mon, and the threshold each of get_shake's four shakes has to roll under.
+
+    All integer: ball and status multipliers are taken in halves (so 1.5x is exact), the base chance is a fraction
+     out of CATCH_CERTAIN and the threshold 1048560 / (65280 / base) ** 0.25 becomes 1048560 / 65280 ** 0.25 * base ** 0.25,
+     with the fourth root from a table.
+    For any mon at or below full HP (a base of at least 1/3) the threshold is within 3 out of 65536 of the float
+     formula, see util/bench.py catching() for the exhaustive comparison.
+
+    @return: (base chance out of CATCH_CERTAIN, shake threshold out of 65536)
+    """
     if ball == 255:
-        return (1.0, 1.0)
+        return (CATCH_CERTAIN, 65536)
     three = (3 * mon.stats[constants.STAT_HP])
-    base = (three - (2 * mon.hp)) / three
-    base *= mon.template.catch_rate
-    base *= ball
-    base *= constants.catch_table[mon.status]
-    base = min(max(base,0.0),1.0)
-    print(f"BASE: {base}")
-    check2 = 1048560/math.pow(65280/base, 0.25)
-    print(f"RATE: {check2}")
-    return (base, check2)
-
-def get_shake(catch_rate: float):
-    check1 = random.randrange(0, 65536)
-    print(f"1: {check1}, 2: {catch_rate}")
-    return check1 < catch_rate
+    multiplier = mon.template.catch_rate * int(ball * 2) * int(constants.catch_table[mon.status] * 2)
+    num = max(three - 2 * mon.hp, 0) * multiplier
+    den = three * 4
+    if num >= den:
+        base = CATCH_CERTAIN
+    else:
+        # (num << 28) // den, without going over 30 bits
+        high = (num << 14) // den
+        base = (high << 14) + ((((num << 14) - high * den) << 14) // den)
+    i = base >> 20
+    frac = (base >> 12) & 0xFF
+    root = (_FOURTH_ROOT[i] * (256 - frac) + _FOURTH_ROOT[i + 1] * frac + 128) >> 8
+    # 1048560 / 65280 ** 0.25 is 65536 * 1.000964, and 0.000964 is 4042 / 2 ** 22
+    return (base, root + ((root * 4042) >> 22))
+
+def get_shake(catch_rate: int, rng: random.Random = random.default):
+    return rng.randrange(0, 65536) < catch_rate
 
 def get_experience(mon: Mon, target: Mon):
-    return int(((mon.template.base_exp * target.level)/5)*math.pow((2*target.level+10)/(target.level+mon.level+10), 2.5)+1)
+    """
+    (base_exp * target level / 5) * ((2 * target level + 10) / (target level + mon level + 10)) ** 2.5 + 1,
+     with the ratio in 16 bit fixed point and ** 2.5 from a table.
+    Within 1 of the float formula for every pair of levels up to 100, see util/bench.py catching().
+    Nothing goes over 30 bits (so nothing allocates on micropython) while base_exp * target level is under 46000.
+    """
+    ratio = ((2 * target.level + 10) << 16) // (target.level + mon.level + 10)
+    i = ratio >> 9
+    frac = ratio & 511
+    power = (_POW_2_5[i] * (512 - frac) + _POW_2_5[i + 1] * frac + 256) >> 9
+    return (mon.template.base_exp * target.level * power) // (5 << 12) + 1
@@ -1,5 +1,5 @@
 from app_components.tokens import colors
-from struct import pack, unpack_from
+from ..util.schema import Schema, Str, U8
 
 COLOURS: dict = colors
 COLOURS["bmon_grey"] = (0.9,0.9,0.9)
@@ -12,33 +12,30 @@ PATTERNS = {
     "LOGO"
 }
 
+CUSTOMISATION_SCHEMA = Schema(
+    "Customisation",
+    ("background_col", Str()),
+    ("foreground_col", Str()),
+    ("pattern", U8),
+)
+
 class Customisation:
     background_col = "bmon_grey"
     foreground_col = "mid_green"
     pattern = 0
 
-    def serialise(self):
-        data = bytearray()
-        data += pack('B', len(self.background_col))
-        data += self.background_col.encode('utf-8')
-        data += pack('B', len(self.foreground_col))
-        data += self.foreground_col.encode('utf-8')
-        data += pack('B', self.pattern)
-        return data
+    def record(self) -> tuple:
+        return self.background_col, self.foreground_col, self.pattern
 
     @staticmethod
-    def deserialise(data):
-        print(data)
+    def from_record(record: tuple) -> 'Customisation':
         c = Customisation()
-        offset = 0
-        name_len = data[offset]
-        offset += 1
-        c.background_col = data[offset:offset + name_len].decode('utf-8')
-        offset += name_len
-        name_len = data[offset]
-        offset += 1
-        c.foreground_col = data[offset:offset + name_len].decode('utf-8')
-        offset += name_len
-        c.pattern = data[offset]
-        offset += 1
+        c.background_col, c.foreground_col, c.pattern = record
         return c
+
+    def serialise(self):
+        return CUSTOMISATION_SCHEMA.pack(self.record())
+
+    @staticmethod
+    def deserialise(data):
+        return Customisation.from_record(CUSTOMISATION_SCHEMA.unpack(data))
@@ -0,0 +1,218 @@
+'''
+Every move and mon, packed by tools/build_data.py from tools/game_data.py. Don't edit this, edit that and
+ run the build again. Decoded by game/moves.py and game/mons.py.
+'''
+
+MOVE_FORMAT = '<HBHBBBBBBB'
+MON_FORMAT = '<HBHBBBBB6HBHBHHB'
+
+STRINGS = (
+    b'ScratchScratches opponentTackleA'
+    b' crude body slam.BiteThe user bi'
+    b'tes the opponent.SlapA quick sla'
+    b"p to the opponent's face.Pleadin"
+    b'gFaceThe user looks pathetically'
+    b' at the opponent, reducing their'
+    b' ATK and SpATK.ScowlThe user fix'
+    b'es a withering scowl at the oppo'
+    b'nent, sharply reducing their DEF'
+    b'.ThinkThe user ponders deeply, g'
+    b'aining an increase to SpATK and '
+    b'SpDEF.PsychUpThe user repeats so'
+    b'me words of self-encouragement, '
+    b'gaining an increase to ATK and S'
+    b'pATK.free()Deallocates the space'
+    b' previously allocated to the opp'
+    b"onentStackSmashWrites a 'normal "
+    b"amount of data' to the opponent'"
+    b"s stack.SQLInjectWrites a 'norma"
+    b"l' string to the opponent's data"
+    b"base';DROP TABLE HPWetFishThe op"
+    b'ponent is hit across the face wi'
+    b'th a wet fishScathingInsultMake '
+    b'a witty remark about the opponen'
+    b"t's mother.PandemicCancels oppon"
+    b'ent due to pandemic restrictions'
+    b'TorrentialRainMaybe if the oppon'
+    b'ent had pitched at the top of th'
+    b'e hill they would still be fine '
+    b'right nowICBMThis feels self exp'
+    b'lanatory.MalletHits opponent wit'
+    b'h comically large malletReworkRe'
+    b'work the opponent into a stylish'
+    b' broachSlanderRun a smear campai'
+    b'n against the opponent in the lo'
+    b'cal newspaper.Nose!Get your oppo'
+    b"nent's nose.DangerHugGives oppon"
+    b'ent a (deadly) hug.PinchCheeksPi'
+    b"nch the opponent's cheeks and te"
+    b"ll them how much they've grown.M"
+    b'ailFraudAll items applied to the'
+    b' opponent for 2 turns will be ap'
+    b'pllied to you instead.Intoxicate'
+    b'Gets opponent drunk.Irrationalis'
+    b'eUse advanced mathematics to pro'
+    b've that the opponent is irration'
+    b'al, and therefore not representa'
+    b'ble as a fraction.RawrOwO? *nuzz'
+    b'les opponent*UppercutPow! Blam! '
+    b'Wham! Slap! Ka-pow!DisassembleDi'
+    b'sassembles the opponent to look '
+    b'for vulnerabilities.ArsonDid you'
+    b' know that the opponent is flamm'
+    b'able?TazerThe power of the sun i'
+    b'n the palm of your hand.FlamingS'
+    b'wordIts cool factor more than ma'
+    b'kes up for its impractibility.Du'
+    b'elChallenge opponent to pistol d'
+    b'uelFP16Cast the opponent to a sm'
+    b'aller data type, making them les'
+    b's accurate.ShakeHandsShake hands'
+    b' with the opponent and recover 5'
+    b'0% HP each.OOOooOOoO!Spook oppon'
+    b'entOvervoltSend more than the ra'
+    b"ted voltage to the opponent's VC"
+    b"C pin.DrainReduce the opponent's"
+    b' voltage potential.DodgyCurrySer'
+    b've the opponent a dodgy curry.Bu'
+    b'ryCovers opponent in a layer of '
+    b'dirtFancyLightingBlind opponent '
+    b'using dope ass lightshowWTF?Show'
+    b"s the opponent the 'WTF?' talk.F"
+    b'ineMistGives opponent a light mi'
+    b'sting.UnexpectedBillGives oppone'
+    b'nt a large shock.DevourAttempt t'
+    b'o eat opponent. You cannot eat R'
+    b'inoa.DadJokeTell a dad joke to t'
+    b'he opponent, who cringes so hard'
+    b' they deal themselves damage.EMF'
+    b' DuckCan quack louder than a jet'
+    b" engineEMF GooseIt's a peaceful "
+    b'day in the Maths Village, and yo'
+    b'u are a horrible gooseBit Warden'
+    b'Their powerful shield is self-ho'
+    b"stedInstall WizardHe's actually "
+    b'paid for WinRARBlacksmithHas a l'
+    b"ot of coke. don't askBlacksmiteT"
+    b'his is the last time you misuse '
+    b'an anvil in minecraftRadio WaveF'
+    b'M modulated!Radio TsunamiSomeone'
+    b' left the microwave running agai'
+    b'nPirateTrue pirates seedSwashbuc'
+    b'klerHas never paid for a copy of'
+    b' PhotoshopFurryWill nya for head'
+    b"patsFurry artistThey're overwork"
+    b'ed, but damn are they not loaded'
+    b"Maths PhDThey've written a thesi"
+    b's on how many hyperplanes you ca'
+    b'n fit in a non-euclidean sphere '
+    b'or somethingMaths BurnoutWhoopsS'
+    b'taticShockKinda spicy tbhElectro'
+    b'cutionToo spicy tbhLAZERSLAZERSL'
+    b'AZERSLAZERSLAAAZEERRRSSLAAAAAAZZ'
+    b'ZZZEEE EEEEERRRRRSSPintQuite sto'
+    b'utKegFinely agedAntiStaticMakes '
+    b'your body less spicyMultimeterKn'
+    b'ows how many amps are being draw'
+    b'nOmnimeterKnows the answers to t'
+    b'he universeFirepitKeeps your han'
+    b'ds warm - but watch out!Firenado'
+    b'Fire makes everything betterGhid'
+    b"raThere's a lingering feeling th"
+    b"at they're a cop but it's probab"
+    b'ly fineEMF 2020Faint whispers of'
+    b' festivals pastsmolhajJust a lil'
+    b' guyblahajDoes 2x damage to tran'
+    b'sphobesTetrisIs often seen hidin'
+    b'g in the arcadeMewWas found hidi'
+    b'ng under a van in null sectorNaN'
+    b'They will absorb your vision int'
+    b'o their consiousnessNullPointerY'
+    b'ou follow the signs, but they po'
+    b'int at the abyss. Your journey h'
+    b'as been meaninglessMISSINGNO.The'
+    b' shoreline is awash with the scr'
+    b'eams of those that should not ex'
+    b'istDiv. ZeroThese axioms are too'
+    b' feeble to describe the knowledg'
+    b'e of the godsOut.MemoryYour head'
+    b' is full, but it is set to burst'
+    b'. Everything fades'
+)
+
+MOVES = (
+    b'\x00\x00\x07\x07\x00\x12\x0b#(d\x01\x00\x19\x00\x06\x1f\x00\x12\x0b#(d\x00\x001\x00\x045\x00\x1c\x0b#'
+    b'(d\x00\x00Q\x00\x04U\x00$\x0b#(d\x00\x00y\x00\x0c\x85\x00J\x0b#(d\x00\x00\xcf\x00\x05\xd4'
+    b'\x00M\x0b#(d\x00\x00!\x01\x05&\x01@\x0b#(d\x00\x00f\x01\x07m\x01X\x05#(d\x00\x00'
+    b'\xc5\x01\x06\xcb\x01:\x01#(d\x00\x00\x05\x02\n\x0f\x029\x01#(d\x00\x00H\x02\tQ\x02B\x01#'
+    b'(d\x00\x00\x93\x02\x07\x9a\x023\x10#(d\x00\x00\xcd\x02\x0e\xdb\x020\x0b#(d\x00\x00\x0b\x03\x08\x13'
+    b'\x03-\x07#(d\x00\x00@\x03\x0eN\x03[\x10#(d\x00\x00\xa9\x03\x04\xad\x03\x1c\x0b#(d\x00\x00'
+    b"\xc9\x03\x06\xcf\x03)\x05#(d\x00\x00\xf8\x03\x06\xfe\x03)\x0f#(d\x00\x00'\x04\x07.\x04@\x0b#"
+    b'(d\x02\x00n\x04\x05s\x04\x19\x0b#(d\x00\x00\x8c\x04\t\x95\x04\x1e\x0b#(d\x00\x00\xb3\x04\x0b\xbe'
+    b'\x04A\x0b#(d\x00\x00\xff\x04\t\x08\x05N\x0b#(d\x00\x00V\x05\n`\x05\x14\x0c#(d\x00\x00'
+    b't\x05\r\x81\x05q\r#(d\x00\x00\xf2\x05\x04\xf6\x05\x17\x03#(d\x00\x00\r\x06\x08\x15\x06\x1e\x05#'
+    b'(d\x00\x003\x06\x0b>\x066\x03#(d\x00\x00t\x06\x05y\x06,\x06#(d\x00\x00\xa5\x06\x05\xaa'
+    b'\x06.\x04#(d\x00\x00\xd8\x06\x0c\xe4\x06:\x06#(d\x00\x00\x1e\x07\x04"\x07!\x02#(d\x00\x00'
+    b'C\x07\x04G\x07D\x01#(d\x00\x00\x8b\x07\n\x95\x076\x0b#(d\x00\x00\xcb\x07\n\xd5\x07\x0e\x07#'
+    b'(d\x00\x00\xe3\x07\x08\xeb\x07;\x04#(d\x00\x00&\x08\x05+\x08(\t#(d\x00\x00S\x08\n]'
+    b'\x08!\x0c#(d\x00\x00~\x08\x04\x82\x08"\t#(d\x00\x00\xa4\x08\r\xb1\x08\'\x07#(d\x00\x00'
+    b'\xd8\x08\x04\xdc\x08#\r#(d\x00\x00\xff\x08\x08\x07\t\x1f\x10#(d\x00\x00&\t\x0e4\t\x1d\x04#'
+    b'(d\x00\x00Q\t\x06W\t.\x0b#(d\x03\x00\x85\t\x07\x8c\tQ\r#(d\x00\x00'
+)
+
+MONS = (
+    b'\xdd\t\x08\xe5\t"\x10\x00\x01\x0f2\x00(\x00(\x00A\x00<\x00#\x00\x01d\x00\x01\x96\x00\x00\x00\x07\x07'
+    b'\n\t\x10\nF\x10\x05\xff\x00P\x00d\x00A\x00Z\x00A\x00Z\x00\x02\x04\x00\x01\x96\x00\x0e\x00\x07V\n'
+    b'\n`\n$\r\x00\x03\x14F\x00F\x00F\x00(\x00(\x00\x19\x00\x03d\x00\x01\x96\x00\x1c\x00\x07\x84\n\x0e'
+    b'\x92\n\x1d\r\x00\xff\x00K\x00K\x00K\x00d\x00d\x00\x1e\x00\x04\x04\x00\x01\x96\x00*\x00\x07\xaf\n\n\xb9'
+    b'\n\x1c\x06\x00\x05\x11<\x00Z\x00F\x00\x14\x00\x14\x00<\x00\x05d\x00\x01\x96\x008\x00\x07\xd5\n\n\xdf\n'
+    b'6\x06\x0f\xff\x00K\x00d\x00d\x00F\x00F\x00<\x00\x06\x04\x00\x01\x96\x00F\x00\x07\x15\x0b\n\x1f\x0b\r'
+    b'\x10\x00\x07\x12(\x00<\x00-\x00<\x00-\x00x\x00\x07F\x00\x01\x96\x00T\x00\x07,\x0b\r9\x0b(\x10'
+    b'\x10\xff\x002\x00K\x002\x00K\x002\x00\x96\x00\x08\x04\x00\x01\x96\x00b\x00\x07a\x0b\x06g\x0b\x11\x02\x00'
+    b'\t\x13F\x00P\x00K\x00\x19\x00\x19\x002\x00\xffP\x00\x01\x96\x00p\x00\x07x\x0b\x0c\x84\x0b&\x02\x00\xff'
+    b'\x00K\x00s\x00Z\x00#\x00#\x00F\x00\xff\x04\x00\x01\x96\x00~\x00\x07\xaa\x0b\x05\xaf\x0b\x15\x03\x00\x0b\x10'
+    b'K\x00#\x00\x19\x00P\x00P\x00\x14\x00\xffP\x00\x01\x96\x00\x8c\x00\x07\xc4\x0b\x0c\xd0\x0b0\x03\x00\xff\x00Z'
+    b'\x00-\x002\x00n\x00d\x00\x19\x00\xff\x08\x00\x01\x96\x00\x9a\x00\x07\x00\x0c\t\t\x0cc\x0b\x00\r\x10(\x00'
+    b'\x1e\x00\x1e\x00K\x00P\x00(\x00\xffZ\x00\x01\x96\x00\xa8\x00\x07l\x0c\ry\x0c\x06\x07\x00\xff\x00<\x00('
+    b'\x00(\x00\x8c\x00d\x002\x00\xff\x04\x00\x01\x96\x00\xb6\x00\x07\x7f\x0c\x0b\x8a\x0c\x0f\x04\x00\x0f\x14\x0f\x00\n\x00'
+    b'\n\x00d\x00\x1e\x00d\x00\xffP\x00\x01\x96\x00\xc4\x00\x07\x99\x0c\r\xa6\x0c\r\x04\x05\xff\x00\x19\x00\x19\x00\x19'
+    b'\x00\xa0\x002\x00\xb4\x00\xff\x04\x00\x01\x96\x00\xd2\x00\x07\xb3\x0c\x06\xb9\x0c\x12\x07\x04\x11\x0f\x14\x00(\x00\x1e\x00'
+    b'P\x002\x00x\x00\xffF\x00\x01\x96\x00\xe0\x00\x07\xcb\x0c\x0c\xd7\x0c\x1c\x07\x04\xff\x002\x00<\x00(\x00d'
+    b'\x00F\x00\x8c\x00\xff\x04\x00\x01\x96\x00\xee\x00\x07\xf3\x0c\x04\xf7\x0c\x0b\x0c\x00\x13\x12Z\x00F\x00<\x00\x19\x00'
+    b'\x14\x00(\x00\xffd\x00\x01\x96\x00\xfc\x00\x07\x02\r\x03\x05\r\x0b\x0c\x00\xff\x00}\x00n\x00d\x002\x00('
+    b'\x00(\x00\xff\x04\x00\x01\x96\x00\n\x01\x07\x10\r\n\x1a\r\x1a\t\x00\xff\x00d\x007\x00Z\x00(\x00d\x00'
+    b'\x19\x00\xff<\x00\x01\x96\x00\x18\x01\x074\r\n>\r#\x04\x00\x16\x17<\x007\x00A\x007\x00<\x00('
+    b'\x00\xffP\x00\x01\x96\x00&\x01\x07a\r\tj\r!\x04\r\xff\x00P\x00P\x00Z\x00Z\x00P\x00K\x00'
+    b'\xff\x04\x00\x01\x96\x004\x01\x07\x8b\r\x07\x92\r&\x06\t\x18\x13\x1e\x00K\x00\x19\x00K\x00\x1e\x00P\x00\xff'
+    b'Z\x00\x01\x96\x00B\x01\x07\xb8\r\x08\xc0\r\x1c\x06\x06\xff\x002\x00d\x00(\x00n\x00(\x00\x82\x00\xff\x04'
+    b'\x00\x01\x96\x00P\x01\x07\xdc\r\x06\xe2\rE\x03\x00\xff\x00<\x00d\x00P\x002\x00n\x00\n\x00\xff2\x00'
+    b"\x01\x96\x00^\x01\x07'\x0e\x08/\x0e \x07\x00\xff\x002\x00Z\x00Z\x00Z\x00Z\x00\x14\x00\xff\x14\x00\x01"
+    b'\x96\x00l\x01\x07O\x0e\x07V\x0e\x0e\x10\x00\x1c\x11\x0f\x00\x0f\x00\x19\x00\x14\x00(\x00\x14\x00\tF\x00\x01\x96'
+    b'\x00z\x01\x07d\x0e\x06j\x0e\x1d\x10\x00\xff\x00n\x00\xa0\x00P\x00\x8c\x00<\x00Z\x00\n\x04\x00\x01\x96\x00'
+    b'\x88\x01\x07\x87\x0e\x06\x8d\x0e"\x0b\x00\xff\x00\xc8\x00x\x00d\x00<\x00x\x00<\x00\x00\x14\x00\x01\x96\x00\x96'
+    b'\x01\x07\xaf\x0e\x03\xb2\x0e+\r\x00\xff\x00d\x00d\x00d\x00d\x00d\x00d\x00\xff\x04\x00\x01\x96\x00\xa4\x01'
+    b'\x07\xdd\x0e\x03\xe0\x0e4\x0c\x01 \x19\n\x00\x9c\x00*\x00\x0b\x00E\x00\x0c\x00\xff2\x00\x01\x96\x00\xb2\x01\x07'
+    b"\x14\x0f\x0b\x1f\x0fT\x0c\x01!'F\x00u\x00M\x00\x15\x00\x7f\x00\r\x00\xff\x14\x00\x01\x96\x00\xc0\x01\x07s"
+    b'\x0f\n}\x0fF\x0c\x01\xff\x00\x0f\x00\x1f\x01W\x00\x89\x00\r\x00\x0b\x00\xff\n\x00\x01\x96\x00\xce\x01\x07\xc3\x0f'
+    b'\t\xcc\x0fA\x01\x00#\x1bF\x00n\x00\x00\x00n\x00\x00\x00\x00\x00\xff(\x00\x01\x96\x00\xdc\x01\x07\r\x10\n'
+    b'\x17\x10;\x01\x00\xff\x00Z\x00o\x00o\x00o\x00o\x00,\x00\xff\n\x00\x01\x96\x00\xea\x01\x07'
+)
+
+LEARNSETS = (
+    b'\x01\x05\x02\x05\x0b\x08\x10\r\x0e\x15\x12\x1e)(\x01\x05\x02\x05\x0b\x08\x10\r\x0e\x15\x12\x1e)(\x00\x05\x01\x05'
+    b'\x18\x08\x12\r\x14\x15(\x1e,(\x00\x05\x01\x05\x18\x08\x12\r\x14\x15(\x1e,(\x03\x05\x0c\x05\x1c\x08\x1e\r'
+    b'\x11\x15\x1a\x1e\x13(\x03\x05\x0c\x05\x1c\x08\x1e\r\x11\x15\x1a\x1e\x13(\x12\x05\x03\x05\x0e\x08)\r\x0e\x15\x0f\x1e'
+    b'\x0c(\x12\x05\x03\x05\x0e\x08)\r\x0e\x15\x0f\x1e\x0c(\x0b\x05\x01\x05\x1a\x08\x02\r\x1f\x15\x0f\x1e\x14(\x0b\x05'
+    b'\x01\x05\x1a\x08\x02\r\x1f\x15\x0f\x1e\x14(\x19\x05\x00\x05\x01\x08\x12\r\x02\x15\x03\x1e\x0f(\x19\x05\x00\x05\x01\x08'
+    b'\x12\r\x02\x15\x03\x1e\x0f(\x02\x05\x00\x05\x01\x08\x00\r\x12\x15"\x1e*(\x02\x05\x00\x05\x01\x08\x00\r\x12\x15'
+    b'"\x1e*(\x00\x05\x01\x05\x1d\x08#\r\x12\x15\x15\x1e*(\x00\x05\x01\x05\x1d\x08#\r\x12\x15\x15\x1e*('
+    b'\'\x05\x1d\x05\x12\x08*\r\r\x15\x00\x1e"(\'\x05\x1d\x05\x12\x08*\r\r\x15\x00\x1e"(\x17\x05\x0b\x05'
+    b'\x00\x08\x01\r%\x15\x13\x1e\x12(\x17\x05\x0b\x05\x00\x08\x01\r%\x15\x13\x1e\x12(\x00\x05\x03\x05\x0c\x08$\r'
+    b'\x13\x15&\x1e\x02(\x00\x05\x1d\x05#\x08\x12\r\x02\x15(\x1e,(\x00\x05\x1d\x05#\x08\x12\r\x02\x15(\x1e'
+    b',(&\x05\x1e\x05\x12\x08\x1c\r\x1e\x15\x0c\x1e\x00(&\x05\x1e\x05\x12\x08\x1c\r\x1e\x15\x0c\x1e\x00(\x19\x05'
+    b'\x00\x05\x01\x08\x02\r\x1b\x15\x0f\x1e+(\x00\x05"\x05\'\x08\r\r\x12\x15\x13\x1e\x03(\x0b\x05\x00\x05\x0e\x08'
+    b')\r\x12\x15\x14\x1e)(\x0b\x05\x00\x05\x0e\x08)\r\x12\x15\x14\x1e)(\x00\x05\x01\x05\x02\x08\x03\r\x0f\x15'
+    b'\x15\x1e+((\x05,\x05\x02\x08\x03\r\x18\x15\x12\x1e\x13(\x17\x05\x08\x05\t\x08\n\r\x17\x15 \x1e+('
+    b'\x17\x05\x08\x05\t\x08\n\r\x17\x15 \x1e+(\x17\x05\x08\x05\t\x08\n\r\x17\x15 \x1e+( \x05\t\x05'
+    b'\n\x08\x08\r\x13\x15\x12\x1e+( \x05\t\x05\n\x08\x08\r\x13\x15\x12\x1e+('
+)
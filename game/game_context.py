@@ -1,51 +1,71 @@
-from struct import pack, unpack_from
+from struct import pack_into, unpack_from
 
-from ..game.customisation import Customisation
-from ..game.mons import Mon, mons_list
+from ..game.customisation import Customisation, CUSTOMISATION_SCHEMA
 from ..game.items import items_list
-from ..game.player import Player
+from ..game.player import Player, PLAYER_SCHEMA
+from ..game.migrate import steps
+from ..util.schema import Schema, Sized, Versions, U8
 
-potion = items_list[5]
-mon_template1 = mons_list[0]
-mon_template2 = mons_list[1]
-mon1 = Mon(mon_template1, 5).set_nickname("small guy")
-mon2 = Mon(mon_template2, 17).set_nickname("mr. 17")
-mon3 = Mon(mon_template1, 17).set_nickname("David")
-mon4 = Mon(mon_template2, 33).set_nickname("large individual")
-mon5 = Mon(mon_template1, 100).set_nickname("biggest dude")
+VERSION = 4
+HEADER = b'BGGR'
+# HEADER, then the version
+_HEADER_FMT = '<4sH'
+_HEADER_SIZE = 6
 
-VERSION = 3
+_V1_SCHEMA = Schema(
+    "GameContext",
+    ("player", Sized(PLAYER_SCHEMA, 'H')),
+    ("random_encounters", U8),
+)
+SAVE_SCHEMA = Schema(
+    "GameContext",
+    ("player", Sized(PLAYER_SCHEMA, 'H')),
+    ("random_encounters", U8),
+    ("custom", Sized(CUSTOMISATION_SCHEMA)),
+)
+# What follows the header, in every version of the save, and how to bring each up to the next (see migrate.py)
+SAVES = Versions({1: _V1_SCHEMA, 2: _V1_SCHEMA, 3: SAVE_SCHEMA, 4: SAVE_SCHEMA}, steps)
 
 class GameContext:
     def __init__(self):
-        self.player = Player("SCARLETT", [], [], {potion: 2})
+        self.player = Player("SCARLETT", [], [], {items_list[5]: 2})
         self.random_encounters = True
         self.custom = Customisation()
 
+    def record(self) -> tuple:
+        return self.player.record(), self.random_encounters, self.custom.record()
+
+    @staticmethod
+    def from_record(record: tuple) -> 'GameContext':
+        gc = GameContext()
+        player, gc.random_encounters, custom = record
+        gc.player = Player.from_record(player)
+        gc.custom = Customisation.from_record(custom)
+        return gc
+
     def serialise(self):
-        data = bytearray()
-        data += b'BGGR'
-        data += pack('H', VERSION)
-        player = self.player.serialise()
-        data += pack("H", len(player))
-        data += player
-        data += pack('B', self.random_encounters)
-        custom = self.custom.serialise()
-        data += pack("B", len(custom))
-        data += custom
+        data = SAVE_SCHEMA.pack(self.record(), _HEADER_SIZE)
+        pack_into(_HEADER_FMT, data, 0, HEADER, VERSION)
         return data
 
-    def deserialise(data):
-        offset = 0
-        gc = GameContext()
-        pl_len = unpack_from('H', data, offset)[0]
-        offset += 2
-        gc.player = Player.deserialise(data[offset:offset + pl_len])
-        offset += pl_len
-        gc.random_encounters = unpack_from('B', data, offset)[0]
-        offset += 1
-        cm_len = unpack_from('B', data, offset)[0]
-        offset += 1
-        gc.custom = Customisation.deserialise(data[offset:offset+cm_len])
-        offset += cm_len
-        return gc
\ No newline at end of file
+    @staticmethod
+    def deserialise(data, version: int = VERSION) -> 'GameContext':
+        '''
+        :param data: The save, after the header.
+        :param version: The version it was saved as, if it needs upgrading.
+        '''
+        return GameContext.from_record(SAVES.unpack(version, data))
+
+    @staticmethod
+    def load(data) -> 'GameContext':
+        '''
+        A whole save file, of any version up to this one. Raises ValueError if it can't be read.
+        '''
+        if len(data) < _HEADER_SIZE:
+            raise ValueError("too short for a save file")
+        header, version = unpack_from(_HEADER_FMT, data, 0)
+        if header != HEADER:
+            raise ValueError("not a save file")
+        if version > VERSION:
+            raise ValueError(f"version {version} is newer than this game ({VERSION})")
+        return GameContext.deserialise(memoryview(data)[_HEADER_SIZE:], version)
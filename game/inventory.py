@@ -0,0 +1,125 @@
+from array import array
+
+from .items import Item, items_list
+
+from sys import implementation as _sys_implementation
+if _sys_implementation.name != "micropython":
+    from typing import Callable, Dict, Iterable, Iterator, List, Tuple, Union
+
+# Counts are saved as a byte each
+MAX_COUNT = 255
+
+class Inventory:
+    """
+    How many of each item a player has, as a count per item id (its index in items_list).
+
+    version goes up with every change, so anything built from the inventory, like an InventoryView, can tell when
+    it's out of date without looking through it.
+    """
+    def __init__(self, stacks: Union[Dict[Item, int], Iterable[Tuple[Item, int]], None] = None):
+        """
+        :param stacks: What's in it to start with, as {item: count} or (item, count) pairs.
+        """
+        self._counts = array('B', bytes(len(items_list)))
+        self.version = 0
+        if stacks is not None:
+            if isinstance(stacks, dict):
+                stacks = stacks.items()
+            for item, count in stacks:
+                self.add(item, count)
+
+    def __getitem__(self, item_id: int) -> int:
+        return self._counts[item_id]
+
+    def __len__(self) -> int:
+        """
+        How many different items there are.
+        """
+        held = 0
+        for count in self._counts:
+            if count:
+                held += 1
+        return held
+
+    def count(self, item: Item) -> int:
+        return self._counts[item.id]
+
+    def add(self, item: Item, count: int = 1) -> int:
+        """
+        :return: How many there are now (at most MAX_COUNT).
+        """
+        total = min(self._counts[item.id] + count, MAX_COUNT)
+        self._counts[item.id] = total
+        self.version += 1
+        return total
+
+    def take(self, item: Item, count: int = 1) -> int:
+        """
+        :return: How many are left.
+        """
+        left = max(self._counts[item.id] - count, 0)
+        self._counts[item.id] = left
+        self.version += 1
+        return left
+
+    def items(self) -> Iterator[Tuple[Item, int]]:
+        """
+        (item, count) for every item there's at least one of, in id order.
+        """
+        counts = self._counts
+        for item_id in range(len(counts)):
+            if counts[item_id]:
+                yield items_list[item_id], counts[item_id]
+
+    def record(self) -> List[Tuple[int, int]]:
+        counts = self._counts
+        return [(item_id, counts[item_id]) for item_id in range(len(counts)) if counts[item_id]]
+
+    @staticmethod
+    def from_record(record: List[Tuple[int, int]]) -> 'Inventory':
+        inventory = Inventory()
+        for item_id, count in record:
+            inventory._counts[item_id] = min(count, MAX_COUNT)
+        return inventory
+
+
+class InventoryView:
+    """
+    Menu rows built from an inventory, by row(item, count) for every item (None leaves the item out).
+
+    Rows are kept, and when the inventory changes only the rows of items whose count changed are built again, so
+    asking for them on every button press costs a version check. Anything else the rows depend on goes in key(),
+    and all of them are built again when it changes.
+    """
+    def __init__(self, inventory: Inventory, row: Callable[[Item, int], object], key: Callable[[], object] = None):
+        self._inventory = inventory
+        self._row = row
+        self._key = key
+        self._last_key = None
+        self._version = -1
+        self._counts = array('h', [-1] * len(items_list))
+        self._by_id = [None] * len(items_list)
+        self._rows = []
+
+    def rows(self) -> list:
+        inventory = self._inventory
+        if self._key is not None:
+            key = self._key()
+            if key != self._last_key:
+                self._last_key = key
+                self._version = -1
+                for item_id in range(len(self._counts)):
+                    self._counts[item_id] = -1
+        if inventory.version == self._version:
+            return self._rows
+        self._version = inventory.version
+        changed = False
+        for item_id in range(len(self._counts)):
+            count = inventory[item_id]
+            if count != self._counts[item_id]:
+                self._counts[item_id] = count
+                self._by_id[item_id] = self._row(items_list[item_id], count)
+                changed = True
+        if changed:
+            self._rows = [row for row in self._by_id if row is not None]
+        return self._rows
@@ -0,0 +1,145 @@
+from struct import calcsize, pack, unpack_from
+
+from sys import implementation as _sys_implementation
+if _sys_implementation.name != "micropython":
+    from typing import List, Tuple, Union
+
+from . import items, mons, moves, player
+from .battle_main import Battle
+from .battle_events import EventSink, PrintSink
+
+# b'BJNL', version, flags, seed, then each player as a length and Player.serialise, then the actions.
+JOURNAL_VERSION = 1
+_HEADER = '<BBI'
+_FLAG_WILD = 1
+
+# Every action is two bytes, the opcode and its argument.
+OP_MOVE = 0  # argument: slot of the move on the current mon
+OP_ITEM = 1  # argument: item id
+OP_MON = 2   # argument: index into the player's badgemon, for swaps and replacing fainted mons
+OP_RUN = 3   # argument: unused
+
+
+class BattleJournal:
+    """
+    A compact record of a battle: the seed, both players as they were before it started, and every action
+     either player took, in order. Battle writes into it as the battle runs.
+
+    Since every roll in a battle comes from its seed, that's enough to play the battle out again exactly,
+     with replay(). Battles are saved to battle.dat in the save folder, so a bug report can come with one.
+    """
+    def __init__(self):
+        self.data = bytearray()
+
+    def start(self, seed: int, player1: player.Player, player2: player.Player):
+        self.data = bytearray(b'BJNL')
+        self.data += pack(_HEADER, JOURNAL_VERSION, _FLAG_WILD if isinstance(player2, player.Cpu) else 0, seed)
+        for p in (player1, player2):
+            p_data = p.serialise()
+            self.data += pack('<H', len(p_data))
+            self.data += p_data
+
+    def record(self, user: player.Player, action: Union[mons.Mon, items.Item, moves.Move, None],
+               mon: Union[mons.Mon, None] = None):
+        """
+        :param user: The player taking the action.
+        :param action: What get_move or get_new_badgemon gave back.
+        :param mon: The mon that was out, needed to record moves.
+        """
+        if isinstance(action, moves.Move):
+            self.data += pack('BB', OP_MOVE, mon.moves.index(action))
+        elif isinstance(action, items.Item):
+            self.data += pack('BB', OP_ITEM, action.id)
+        elif isinstance(action, mons.Mon):
+            self.data += pack('BB', OP_MON, user.badgemon.index(action))
+        else:
+            self.data += pack('BB', OP_RUN, 0)
+
+    def save(self, path: str):
+        try:
+            with open(path, "wb") as f:
+                f.write(self.data)
+        except OSError as e:
+            print(f"Couldn't save battle journal: {e}")
+
+    @staticmethod
+    def load(path: str) -> 'BattleJournal':
+        journal = BattleJournal()
+        with open(path, "rb") as f:
+            journal.data = bytearray(f.read())
+        return journal
+
+    def parse(self) -> Tuple[int, player.Player, player.Player, List[Tuple[int, int]]]:
+        """
+        :return: The seed, both players, and the actions as (opcode, argument) pairs.
+        """
+        if self.data[:4] != b'BJNL':
+            raise ValueError("Not a battle journal")
+        version, flags, seed = unpack_from(_HEADER, self.data, 4)
+        if version != JOURNAL_VERSION:
+            raise ValueError(f"Unknown battle journal version {version}")
+        offset = 4 + calcsize(_HEADER)
+        players = []
+        for _ in range(2):
+            p_len = unpack_from('<H', self.data, offset)[0]
+            offset += 2
+            players.append(player.Player.deserialise(self.data[offset:offset + p_len]))
+            offset += p_len
+        if flags & _FLAG_WILD:
+            p = players[1]
+            players[1] = player.Cpu(p.name, p.badgemon, p.badgemon_case, p.inventory, p.last_heal, p.money, p.badgedex)
+        actions = [(self.data[i], self.data[i + 1]) for i in range(offset, len(self.data) - 1, 2)]
+        return seed, players[0], players[1], actions
+
+
+async def replay(journal: BattleJournal, verbose: bool = False,
+                 events: Union[EventSink, None] = None) -> Tuple[Battle, player.Player]:
+    """
+    Plays a recorded battle out again, without any UI. The players' choices come from the journal,
+     everything else is rolled again from the seed and so comes out the same.
+    Useful for checking what a balance change does to known battles, or for stepping through a bug report.
+
+        import asyncio
+        from game.journal import BattleJournal, replay
+        battle, winner = asyncio.run(replay(BattleJournal.load("battle.dat"), verbose=True))
+
+    :param verbose: Print the battle's text as it goes.
+    :param events: Where the battle's events go, instead. e.g. a RecordingSink, to check them afterwards.
+    :return: The battle, as it was at the end, and the winner.
+    """
+    seed, player1, player2, actions = journal.parse()
+    cursor = [0]
+
+    def next_action(side: player.Player, mon: mons.Mon):
+        if cursor[0] >= len(actions):
+            raise ValueError("Battle journal ran out of actions")
+        op, arg = actions[cursor[0]]
+        cursor[0] += 1
+        if op == OP_MOVE:
+            return mon.moves[arg]
+        if op == OP_ITEM:
+            return items.items_list[arg]
+        if op == OP_MON:
+            return side.badgemon[arg]
+        return None
+
+    for side in (player1, player2):
+        async def get_move(mon: mons.Mon, side=side):
+            return next_action(side, mon)
+
+        async def get_new_badgemon(side=side):
+            return next_action(side, None)
+
+        async def gain_badgemon(mon: mons.Mon, case: List[mons.Mon], badgedex):
+            case.append(mon)
+            badgedex.find(mon.template.id)
+
+        side.get_move = get_move
+        side.get_new_badgemon = get_new_badgemon
+        side.gain_badgemon = gain_badgemon
+
+    if events is None:
+        events = PrintSink() if verbose else EventSink()
+    battle = Battle(player1, player2, None, events, seed)
+    winner = await battle.run()
+    return battle, winner
@@ -1,21 +1,26 @@
-from ..config import SAVE_PATH
+'''
+How to bring a save up from each version to the next. Each step takes the save's record (see SAVES in
+game_context.py) as it was in one version, and gives it as it is in the next, which is checked against that
+version's schema as it's loaded.
+'''
+from .customisation import Customisation
+from .badgedex import Badgedex
+from .player import PLAYER_SCHEMA
 
-VERSION_LOC = 4
+def _1to2(record: tuple) -> tuple:
+    # Only the version changed
+    return record
 
-def save_1to2():
-    with open(SAVE_PATH+"sav.dat", "rb") as f:
-        data = bytearray(f.read())
-        data[VERSION_LOC] = 2
-    with open(SAVE_PATH+"sav.dat", "wb") as f:
-        f.write(data)
+def _2to3(record: tuple) -> tuple:
+    return record + (Customisation().record(),)
 
-def save_2to3():
-    with open(SAVE_PATH+"sav.dat", "rb") as f:
-        data = bytearray(f.read())
-        data[VERSION_LOC] = 3
-        data.extend(b'\14\09bmon_grey\09mid_green\00')
-    with open(SAVE_PATH+"sav.dat", "wb") as f:
-        f.write(data)
+def _3to4(record: tuple) -> tuple:
+    # The badgedex went from a byte per mon to seen and caught bitmaps
+    player = list(record[0])
+    i = PLAYER_SCHEMA.names.index("badgedex")
+    player[i] = Badgedex.from_found(player[i]).record()
+    return (tuple(player),) + record[1:]
 
-conversion = {1: save_1to2,
-              2: save_2to3}
+steps = {1: _1to2,
+         2: _2to3,
+         3: _3to4}
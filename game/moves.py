@@ -1,7 +1,7 @@
 import math
 from ..util import static_random as random
 
-from . import constants
+from . import constants, data
 
 try:
     from sys import implementation as _sys_implementation
@@ -17,11 +17,14 @@ except ImportError:
 from ..util.animation import Animation, AnimationEvent
 from ..util import animation
 from ..util.misc import shrink_until_fit, ASSET_PATH
+from ..util.records import RecordTable, text
 from asyncio import Event
 from ctx import Context
 from app import App
 
 class MoveAnim(Animation):
+    critical = True
+
     def __init__(self, *args, app: App, draw_user = True, draw_target = True, user_pos: Tuple[float, float] = (0,0), target_pos: Tuple[float, float] = (0,0), user: 'Mon' = None, target: 'Mon' = None, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._draw_user = draw_user
@@ -33,14 +36,26 @@ class MoveAnim(Animation):
         self._time = 0
         self._app = app
 
+    def prepare(self, app: App, user_pos: Tuple[float, float], target_pos: Tuple[float, float], user: 'Mon', target: 'Mon') -> None:
+        '''
+        Points a pooled animation at a new use of its move, so it can be played again.
+        '''
+        self.reset()
+        self._app = app
+        self._user_pos = user_pos
+        self._target_pos = target_pos
+        self._user = user
+        self._target = target
+        self._time = 0
+
     def on_anim_end(self) -> None:
-        self._app.overlays.remove(self)
+        self._app._anim_overlay.hide(self)
         self._app._scene._draw_target = True
         self._app._scene._draw_user = True
         return super().on_anim_end()
     
     def on_anim_start(self) -> None:
-        self._app.overlays.append(self)
+        self._app._anim_overlay.show(self)
         self._app._scene._draw_target = self._draw_target
         self._app._scene._draw_user = self._draw_user
         return super().on_anim_start()
@@ -51,12 +66,17 @@ class MoveAnim(Animation):
     def draw(self, ctx: Context) -> None:
         pass
 
+_INSULTS = ("SUCKS", "IS BAD", "STINKS")
+
 class SlanderAnim(MoveAnim):
     def __init__(self, *args, length=3000, **kwargs) -> None:
-        insults = ["SUCKS", "IS BAD", "STINKS"]
-        self.insult = random.choice(insults)
+        self.insult = random.cosmetic.choice(_INSULTS)
         super().__init__(*args, length, **kwargs)
 
+    def prepare(self, *args, **kwargs) -> None:
+        self.insult = random.cosmetic.choice(_INSULTS)
+        return super().prepare(*args, **kwargs)
+
     def draw(self, ctx: Context) -> None:
         if self._time < 0.33:
             rot = animation.lerp(0,math.tau*3.95,self._time*3.0)
@@ -99,11 +119,18 @@ class ScratchAnim(MoveAnim):
                 .line_to(animation.lerp(start_point_x, end_point_x, end), animation.lerp(start_point_y, end_point_y, end))\
                 .rgb(0.8,0.2,0.2).stroke()
             
+_DEVOUR_IMAGES = [ASSET_PATH+"moves/devour-"+str(i)+".jpg" for i in range(3)]
+
 class DevourAnim(MoveAnim):
     def __init__(self, *args, length=4000, **kwargs) -> None:
-        self.image = ASSET_PATH+"moves/devour-"+str(random.randrange(0,3))+".jpg"
+        self.image = random.cosmetic.choice(_DEVOUR_IMAGES)
         super().__init__(*args, length, **kwargs)
 
+    def prepare(self, *args, **kwargs) -> None:
+        self.image = random.cosmetic.choice(_DEVOUR_IMAGES)
+        return super().prepare(*args, **kwargs)
+
+
     def draw(self, ctx: Context) -> None:
         ctx.image_smoothing = 0
         ctx.image(self.image, -120, -120, 240, 240)
@@ -113,6 +140,24 @@ class DevourAnim(MoveAnim):
         ctx.font_size = 60
         ctx.rgb(1,1,1).move_to(text_pos,0).text("Censored... Please stand by...")
 
+# Move animations only ever play one at a time, so one of each kind is kept and reused.
+# Maps the animation class to (animation, AnimationEvent, Event).
+_anim_pool = {}
+
+def _pooled_anim(Anim: MoveAnim) -> Tuple[MoveAnim, AnimationEvent, Event]:
+    pooled = _anim_pool.get(Anim)
+    if pooled is None:
+        anim = Anim(app=None)
+        event = Event()
+        end = AnimationEvent(event)
+        anim.and_then(end)
+        pooled = (anim, end, event)
+        _anim_pool[Anim] = pooled
+    return pooled
+
+_LOWER_POS = (-16*3, (16*3)-10)
+_UPPER_POS = (16*3, -(16*3)+10)
+
 class MoveOverrideSpecial:
     """
     Any overrides that can't be expressed, even by MoveEffect.
@@ -145,7 +190,7 @@ class MoveEffect:
         :return: A MoveEffect object containing this effect only.
         """
         async def function(battle: 'Battle', user: 'Mon', target: 'Mon', damage: int):
-            if random.random() < chance_to_apply:
+            if battle.rng.random() < chance_to_apply:
                 return await battle.inflict_status(user, target, status)
 
             return False
@@ -175,14 +220,17 @@ class MoveEffect:
         :return: A MoveEffect object containing this effect only.
         """
         async def function(battle: 'Battle', user: 'Mon', target: 'Mon', damage: int):
+            if battle._app is None:
+                # Headless, e.g. a replay
+                return True
             if user == battle.mon1:
-                user_pos, target_pos = (-16*3, (16*3)-10), (16*3, -(16*3)+10)
+                user_pos, target_pos = _LOWER_POS, _UPPER_POS
             else:
-                target_pos, user_pos = (-16*3, (16*3)-10), (16*3, -(16*3)+10)
+                target_pos, user_pos = _LOWER_POS, _UPPER_POS
 
-            anim = Anim(app=battle._app, user_pos=user_pos, target_pos=target_pos, user = user, target = target)
-            event = Event()
-            anim.and_then(AnimationEvent(event))
+            anim, end, event = _pooled_anim(Anim)
+            anim.prepare(battle._app, user_pos, target_pos, user, target)
+            end.reset()
             battle._app._animation_scheduler.trigger(anim)
             await event.wait()
             return True
@@ -261,7 +309,7 @@ class Move:
     def __init__(
         self, name: str, desc: str, move_type: constants.MonType, max_pp: int, power: int, accuracy: int,
         effect_on_hit: MoveEffect = None, effect_on_miss: MoveEffect = None,
-            special_override: MoveOverrideSpecial = MoveOverrideSpecial.NO_OVERRIDE
+            special_override: MoveOverrideSpecial = MoveOverrideSpecial.NO_OVERRIDE, move_id: Union[int, None] = None
     ):
         """
         Any kind of move.
@@ -274,9 +322,12 @@ class Move:
         :param effect_on_hit: Special effect called when the move hits.
         :param effect_on_miss: Special effect called when the move misses.
         :param special_override: Any override that a special case must be made for.
+        :param move_id: The move's id, its index in moves_list. Counts up from 0 if not given.
         """
-        self.id = Move.id_inc
-        Move.id_inc += 1
+        if move_id is None:
+            move_id = Move.id_inc
+            Move.id_inc += 1
+        self.id = move_id
 
         self.name = name
         self.desc = desc
@@ -289,50 +340,19 @@ class Move:
         self.special_override = special_override
 
 
-moves_list = [
-    Move('Scratch', 'Scratches opponent', constants.MonType.NORMAL, 35, 40, 100, MoveEffect.animation(ScratchAnim)),
-    Move('Tackle', "A crude body slam.", constants.MonType.NORMAL, 35, 40, 100),
-    Move('Bite', "The user bites the opponent.", constants.MonType.NORMAL, 35, 40, 100),
-    Move('Slap', "A quick slap to the opponent's face.", constants.MonType.NORMAL, 35, 40, 100),
-    Move('PleadingFace', "The user looks pathetically at the opponent, reducing their ATK and SpATK.", constants.MonType.NORMAL, 35, 40, 100),
-    Move('Scowl', "The user fixes a withering scowl at the opponent, sharply reducing their DEF.", constants.MonType.NORMAL, 35, 40, 100),
-    Move('Think', "The user ponders deeply, gaining an increase to SpATK and SpDEF.", constants.MonType.NORMAL, 35, 40, 100),
-    Move('PsychUp', "The user repeats some words of self-encouragement, gaining an increase to ATK and SpATK.", constants.MonType.FIGHTING, 35, 40, 100),
-    Move('free()', "Deallocates the space previously allocated to the opponent", constants.MonType.BUG, 35, 40, 100),
-    Move('StackSmash', "Writes a \'normal amount of data\' to the opponent's stack.", constants.MonType.BUG, 35, 40, 100),
-    Move('SQLInject', "Writes a \'normal\' string to the opponent's database';DROP TABLE HP", constants.MonType.BUG, 35, 40, 100),
-    Move('WetFish', "The opponent is hit across the face with a wet fish", constants.MonType.WATER, 35, 40, 100),
-    Move('ScathingInsult', "Make a witty remark about the opponent's mother.", constants.MonType.NORMAL, 35, 40, 100),
-    Move('Pandemic', "Cancels opponent due to pandemic restrictions", constants.MonType.GHOST, 35, 40, 100),
-    Move('TorrentialRain', "Maybe if the opponent had pitched at the top of the hill they would still be fine right now", constants.MonType.WATER, 35, 40, 100),
-    Move('ICBM', "This feels self explanatory.", constants.MonType.NORMAL, 35, 40, 100),
-    Move('Mallet', "Hits opponent with comically large mallet", constants.MonType.FIGHTING, 35, 40, 100),
-    Move('Rework', "Rework the opponent into a stylish broach", constants.MonType.STEEL, 35, 40, 100),
-    Move('Slander', "Run a smear campain against the opponent in the local newspaper.", constants.MonType.NORMAL, 35, 40, 100, MoveEffect.animation(SlanderAnim)),
-    Move('Nose!', "Get your opponent's nose.", constants.MonType.NORMAL, 35, 40, 100),
-    Move('DangerHug', "Gives opponent a (deadly) hug.", constants.MonType.NORMAL, 35, 40, 100),
-    Move('PinchCheeks', "Pinch the opponent's cheeks and tell them how much they've grown.", constants.MonType.NORMAL, 35, 40, 100),
-    Move('MailFraud', "All items applied to the opponent for 2 turns will be appllied to you instead.", constants.MonType.NORMAL, 35, 40, 100),
-    Move('Intoxicate', "Gets opponent drunk.", constants.MonType.POISON, 35, 40, 100),
-    Move('Irrationalise', "Use advanced mathematics to prove that the opponent is irrational, and therefore not representable as a fraction.", constants.MonType.PSYCHIC, 35, 40, 100),
-    Move('Rawr', "OwO? *nuzzles opponent*", constants.MonType.DRAGON, 35, 40, 100),
-    Move('Uppercut', "Pow! Blam! Wham! Slap! Ka-pow!", constants.MonType.FIGHTING, 35, 40, 100),
-    Move('Disassemble', "Disassembles the opponent to look for vulnerabilities.", constants.MonType.DRAGON, 35, 40, 100),
-    Move('Arson', "Did you know that the opponent is flammable?", constants.MonType.FIRE, 35, 40, 100),
-    Move('Tazer', "The power of the sun in the palm of your hand.", constants.MonType.ELECTRIC, 35, 40, 100),
-    Move('FlamingSword', "Its cool factor more than makes up for its impractibility.", constants.MonType.FIRE, 35, 40, 100),
-    Move('Duel', "Challenge opponent to pistol duel", constants.MonType.DARK, 35, 40, 100),
-    Move('FP16', "Cast the opponent to a smaller data type, making them less accurate.", constants.MonType.BUG, 35, 40, 100),
-    Move('ShakeHands', "Shake hands with the opponent and recover 50% HP each.", constants.MonType.NORMAL, 35, 40, 100),
-    Move('OOOooOOoO!', "Spook opponent", constants.MonType.GHOST, 35, 40, 100),
-    Move('Overvolt', "Send more than the rated voltage to the opponent's VCC pin.", constants.MonType.ELECTRIC, 35, 40, 100),
-    Move('Drain', "Reduce the opponent's voltage potential.", constants.MonType.GROUND, 35, 40, 100),
-    Move('DodgyCurry', "Serve the opponent a dodgy curry.", constants.MonType.POISON, 35, 40, 100),
-    Move('Bury', "Covers opponent in a layer of dirt", constants.MonType.GROUND, 35, 40, 100),
-    Move('FancyLighting', "Blind opponent using dope ass lightshow", constants.MonType.GHOST, 35, 40, 100),
-    Move('WTF?', "Shows the opponent the \'WTF?\' talk.", constants.MonType.PSYCHIC, 35, 40, 100),
-    Move('FineMist', "Gives opponent a light misting.", constants.MonType.WATER, 35, 40, 100),
-    Move('UnexpectedBill', "Gives opponent a large shock.", constants.MonType.ELECTRIC, 35, 40, 100),
-    Move('Devour', "Attempt to eat opponent. You cannot eat Rinoa.", constants.MonType.NORMAL, 35, 40, 100, MoveEffect.animation(DevourAnim)),
-    Move('DadJoke', "Tell a dad joke to the opponent, who cringes so hard they deal themselves damage.", constants.MonType.PSYCHIC, 35, 40, 100)
-]
\ No newline at end of file
+# Move effects by their id in game/data.py's move records. Must match EFFECTS in tools/build_data.py.
+_EFFECTS = (
+    None,
+    lambda: MoveEffect.animation(ScratchAnim),
+    lambda: MoveEffect.animation(SlanderAnim),
+    lambda: MoveEffect.animation(DevourAnim),
+)
+
+def _decode_move(index: int, fields: Tuple) -> Move:
+    (name, name_len, desc, desc_len, move_type, max_pp, power, accuracy, effect, special_override) = fields
+    return Move(
+        text(data.STRINGS, name, name_len), text(data.STRINGS, desc, desc_len), move_type, max_pp, power, accuracy,
+        _EFFECTS[effect]() if effect else None, None, special_override, move_id=index)
+
+# Every move, by id. Each is only decoded from game/data.py the first time it's used (see tools/game_data.py).
+moves_list = RecordTable(data.MOVES, data.MOVE_FORMAT, _decode_move)
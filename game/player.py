@@ -1,8 +1,7 @@
-from struct import pack, unpack_from
-from ..util import static_random as random
 import time
 
-from . import items, badgedex
+from . import badgedex
+from .inventory import Inventory
 
 try:
     from sys import implementation as _sys_implementation
@@ -15,13 +14,25 @@ try:
 except ImportError:
     pass
 
-from .mons import Mon
+from .mons import Mon, MON_SCHEMA
+from ..util.schema import Schema, ListOf, Sized, Str, Bytes, U8, U32, U64
+
+PLAYER_SCHEMA = Schema(
+    "Player",
+    ("name", Str()),
+    ("badgemon", ListOf(Sized(MON_SCHEMA))),
+    ("badgemon_case", ListOf(Sized(MON_SCHEMA))),
+    ("inventory", ListOf(Schema("Stack", ("item", U8), ("count", U8)))),
+    ("last_heal", U64),
+    ("badgedex", Bytes()),
+    ("money", U32),
+)
 
 #_TIME_BETWEEN_HEALS = const(1000*60*1) # 1 minute
 _TIME_BETWEEN_HEALS = 1000*60*10 # 1 minute
 
 class Player:
-    def __init__(self, name: str, badgemon: List['Mon'], badgemon_case: List['Mon'], inventory: Dict['Item', int], last_heal = None, money = 1000, bdex = None):
+    def __init__(self, name: str, badgemon: List['Mon'], badgemon_case: List['Mon'], inventory: Union[Inventory, Dict['Item', int]], last_heal = None, money = 1000, bdex = None):
         """
         The Player class will be inherited by classes implementing the user interface, it broadly holds player data and
         handles interaction with the main Battle class
@@ -29,12 +40,12 @@ class Player:
         @param name:
         @param badgemon: player's team. max 6
         @param badgemon_case: all other badgemon
-        @param inventory:
+        @param inventory: an Inventory, or {item: count} to start one with
         """
         self.name = name
         self.badgemon = badgemon[0:6]
         self.badgemon_case = badgemon_case
-        self.inventory = inventory
+        self.inventory = inventory if isinstance(inventory, Inventory) else Inventory(inventory)
         if last_heal is None:
             self.last_heal = time.ticks_ms()
         else:
@@ -47,92 +58,30 @@ class Player:
 
         self.money = money
 
-    def serialise(self):
-        data = bytearray()
-
-        data += pack('B', len(self.name))
-        data += self.name.encode('utf-8')
-
-        data += pack('B', len(self.badgemon))
-        for mon in self.badgemon:
-            mon_data = mon.serialise()
-            data += pack('B', len(mon_data))
-            data += mon_data
-        
-        data += pack('B', len(self.badgemon_case))
-        for mon in self.badgemon_case:
-            mon_data = mon.serialise()
-            data += pack('B', len(mon_data))
-            data += mon_data
-
-        data += pack('B', len(self.inventory))
-        for item, count in self.inventory.items():
-            data += pack('BB', item.id, count)
-
-        data += pack('Q', self.last_heal)
-
-        bdex  = self.badgedex.serialise()
-        data += pack('B', len(bdex))
-        data += bdex
+    def record(self) -> tuple:
+        """
+        The player as a tuple of values, in the order of PLAYER_SCHEMA.
+        """
+        return (self.name, [mon.record() for mon in self.badgemon], [mon.record() for mon in self.badgemon_case],
+                self.inventory.record(), self.last_heal,
+                self.badgedex.record(), self.money)
 
-        data += pack('I', self.money)
+    @staticmethod
+    def from_record(record: tuple) -> 'Player':
+        """
+        Opposite of Player.record().
+        """
+        name, badgemon, badgemon_case, inventory, last_heal, bdex, money = record
+        return Player(name, [Mon.from_record(r) for r in badgemon], [Mon.from_record(r) for r in badgemon_case],
+                      Inventory.from_record(inventory), last_heal, money,
+                      badgedex.Badgedex.from_record(bdex))
 
-        return data
+    def serialise(self):
+        return PLAYER_SCHEMA.pack(self.record())
 
     @staticmethod
     def deserialise(data: bytearray) -> 'Player':
-        offset = 0
-
-        name_len = data[offset]
-        offset += 1
-        name = data[offset:offset + name_len].decode('utf-8')
-        offset += name_len
-
-        mons_len = data[offset]
-        offset += 1
-        badgemon = []
-        for _ in range(mons_len):
-            mon_len = data[offset]
-            offset += 1
-            mon = Mon.deserialise(data[offset:offset + mon_len])
-            badgemon.append(mon)
-            offset += mon_len
-
-        mons_len = data[offset]
-        offset += 1
-        badgemon_case = []
-        for _ in range(mons_len):
-            mon_len = data[offset]
-            offset += 1
-            mon = Mon.deserialise(data[offset:offset + mon_len])
-            badgemon_case.append(mon)
-            offset += mon_len
-
-        inventory = {}
-        inv_len = data[offset]
-        offset += 1
-        for _ in range(inv_len):
-            item_id, count = data[offset:offset + 2]
-            item = items.items_list[item_id]
-            inventory[item] = count
-            offset += 2
-
-        print(f"OFFSET: {offset}")
-        last_heal = unpack_from("Q", data, offset)[0]
-        print(f"LAST_HEAL: {last_heal}")
-        offset += 8
-
-        bdex_len = data[offset]
-        print(f"OFFSET: {offset}")
-        print(f"BDEX_LEN: {bdex_len}")
-        offset += 1
-        bdex = badgedex.Badgedex.deserialise(data[offset:offset + bdex_len])
-        offset += bdex_len
-
-        money = unpack_from("I", data, offset)[0]
-
-        pl = Player(name, badgemon, badgemon_case, inventory, last_heal, money, bdex)
-        return pl
+        return Player.from_record(PLAYER_SCHEMA.unpack(data))
 
     async def get_move(self, mon: 'Mon') -> Union['Mon', 'Item', 'Move', None]:
         """
@@ -187,9 +136,7 @@ class Cpu(Player):
         if not any(mon.pp):
             return None
         else:
-            index, m = random.choice(list((index, m) for index, (m, pp) in enumerate(zip(mon.moves,mon.pp)) if pp > 0))
-            mon.pp[index] -=1
-            return m
+            return self.battle_context.cpu_rng.choice(list(m for m, pp in zip(mon.moves,mon.pp) if pp > 0))
     
     async def get_new_badgemon(self) -> 'Mon':
         for mon in self.badgemon:
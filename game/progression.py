@@ -0,0 +1,99 @@
+from sys import implementation as _sys_implementation
+if _sys_implementation.name != "micropython":
+    from typing import List, Tuple, Union
+
+from . import constants, moves
+from .mons import Mon, MonTemplate, _calculate_stats
+
+
+def level_for_xp(xp: int, level: int = 1) -> int:
+    """
+    The highest level whose threshold (level cubed) xp has reached, but never below level.
+    Binary search, so a huge exp gain costs the same as a small one.
+    """
+    lo = level
+    hi = level + 1
+    while hi * hi * hi <= xp:
+        hi <<= 1
+    # lo is reached, hi isn't
+    while hi - lo > 1:
+        mid = (lo + hi) >> 1
+        if mid * mid * mid <= xp:
+            lo = mid
+        else:
+            hi = mid
+    return lo
+
+
+class LevelProgress:
+    """
+    Everything a mon gets from the exp it has, worked out in one go: the new level, what that does to its stats,
+     the moves it can learn on the way and anything it evolves into.
+    Nothing changes on the mon until apply() (and evolve(), for evolutions), so the scene can present it at its own pace.
+    """
+    def __init__(self, mon: Mon, index: int, new_level: int):
+        self.mon = mon
+        self.index = index
+        self.old_level = mon.level
+        self.new_level = new_level
+        self.old_stats = mon.stats[:]
+        self.new_stats = [0, 0, 0, 0, 0, 0]
+        _calculate_stats(self.new_stats, mon.template.stat_terms, mon.ivs, mon.evs, new_level)
+        self.moves = mon.template.moves_between(self.old_level, new_level)  # type: List[Tuple[moves.Move, int]]
+
+        self.evolutions = []  # type: List[MonTemplate]
+        template = mon.template
+        while template.evolve_mon and template.evolve_level and template.evolve_level <= new_level:
+            if template.evolve_level > self.old_level:
+                self.evolutions.append(template.evolve_mon)
+            template = template.evolve_mon
+
+    def levels_gained(self) -> int:
+        return self.new_level - self.old_level
+
+    def stat_gains(self) -> List[int]:
+        return [new - old for new, old in zip(self.new_stats, self.old_stats)]
+
+    def describe_gains(self) -> str:
+        """
+        e.g. "HP +3, ATK +2, SPD +1"
+        """
+        return ", ".join(f"{name} +{gain}" for name, gain in zip(constants.stat_names, self.stat_gains()) if gain)
+
+    def apply(self):
+        self.mon.level = self.new_level
+        for i, stat in enumerate(self.new_stats):
+            self.mon.stats[i] = stat
+
+    def evolve(self, template: MonTemplate) -> Mon:
+        """
+        Turns the mon into template, keeping its nickname, moves and exp (and fully healing it). The caller puts the
+         new mon in the party at index, and from then on it's the one this progress applies to.
+        """
+        old = self.mon
+        new_mon = Mon(template, old.level, old.ivs, old.evs, old.moves)
+        new_mon.set_nickname(old.nickname)
+        new_mon.xp = old.xp
+        self.mon = new_mon
+        return new_mon
+
+
+def progress(mon: Mon, index: int = 0) -> Union[LevelProgress, None]:
+    """
+    :return: What mon gets from its exp, or None if it isn't due a level.
+    """
+    if not mon.level_up_needed():
+        return None
+    return LevelProgress(mon, index, level_for_xp(mon.xp, mon.level))
+
+
+def pending(party: List[Mon]) -> List[LevelProgress]:
+    """
+    The level ups due across the whole party, in party order.
+    """
+    result = []
+    for index, mon in enumerate(party):
+        p = progress(mon, index)
+        if p is not None:
+            result.append(p)
+    return result
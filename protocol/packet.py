@@ -10,6 +10,7 @@ instead of working on a protocol
 from struct import pack, unpack_from
 from ..game.player import Player
 from ..game.mons import Mon
+from ..game.items import items_list
 
 
 class API:
@@ -61,7 +62,8 @@ def decode_packet(packet: bytes, player: Player = None, mon: Mon = None):
             mon = player.badgemon[move_opcode]
             return mon
         if move_opcode == API.SEND_ITEM:
-            item = player.inventory[move_operand]
+            # The inventory is counted by item id, which is what's sent
+            item = items_list[move_operand]
             return item
         if move_opcode == API.SEND_ESCAPE:
             return None
\ No newline at end of file
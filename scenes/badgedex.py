@@ -12,6 +12,8 @@ from ..game.constants import type_to_str, MonType
 from events.input import BUTTON_TYPES
 
 class Badgedex(Scene):
+    cacheable = True
+
     def _set_wobble(self, x):
         self._arrow_wobble = x
 
@@ -19,11 +21,20 @@ class Badgedex(Scene):
         super().__init__(*args, **kwargs)
         self._index = 0
         self._current_mon = mons_list[self._index]
-        self._mon_known = self.context.player.badgedex.found[self._index]
+        self.reset()
+
+    def reset(self):
+        # Coming back keeps the place in the dex, but what's been found may have changed
+        self._update_known()
         self._exit = Event()
         self._arrow_wobble = 0
         self.animation_scheduler.trigger(AnimSin(AnimLerp(lambda x: self._set_wobble(x), end=4)))
 
+    def _update_known(self):
+        badgedex = self.context.player.badgedex
+        self._mon_caught = badgedex.caught(self._index)
+        self._mon_seen = badgedex.seen(self._index)
+
     def _show_detail(self):
         if self._current_mon is None:
             return
@@ -39,11 +50,11 @@ class Badgedex(Scene):
             elif BUTTON_TYPES["UP"] in event.button:
                 self._index =  (self._index - 1 + len(mons_list)) % len(mons_list)
                 self._current_mon = mons_list[self._index]
-                self._mon_known = self.context.player.badgedex.found[self._index]
+                self._update_known()
             elif BUTTON_TYPES["DOWN"] in event.button:
                 self._index =  (self._index + 1 + len(mons_list)) % len(mons_list)
                 self._current_mon = mons_list[self._index]
-                self._mon_known = self.context.player.badgedex.found[self._index]
+                self._update_known()
 
     def _draw_arrow(self, ctx: Context):
         (ctx.move_to(-10, -100+self._arrow_wobble)
@@ -75,11 +86,15 @@ class Badgedex(Scene):
             shrink_until_fit(ctx, types, 120, 40)
             ctx.gray(0.2).move_to(0,75).text(types).fill()
             
-            found = "Found" if self._mon_known else "Not Found"
             ctx.font_size = 20
-            if self._mon_known:
+            if self._mon_caught:
+                found = "Caught"
                 ctx.rgb(0.1,0.6,0.1)
+            elif self._mon_seen:
+                found = "Seen"
+                ctx.rgb(0.6,0.5,0.1)
             else:
+                found = "Not Found"
                 ctx.rgb(0.6,0.1,0.1)
             ctx.move_to(0,100).text(found).fill()
         ctx.font_size = 30
@@ -3,26 +3,21 @@ from events.input import ButtonDownEvent
 from ..util.misc import *
 from ..util.animation import AnimLerp, AnimSin
 
-from ..game.mons import Mon, mons_list
-from ..game.items import Item, items_list
+from ..game.mons import Mon
+from ..game.items import Item
 from ..game.moves import Move
-from ..game.battle_main import Battle as BContext
-from ..game.player import Cpu, Player
+from ..game.battle_main import Battle as BContext, Describe
+from ..game.battle_events import NewsSink
+from ..game.journal import BattleJournal
+from ..game.player import Player
+from ..game.inventory import InventoryView
 from ctx import Context
 
 from ..game import constants
+from ..config import SAVE_PATH
 
 from asyncio import Event
 
-potion = items_list[0]
-mon_template1 = mons_list[0]
-mon_template2 = mons_list[1]
-mon1 = Mon(mon_template1, 5).set_nickname("small guy")
-mon2 = Mon(mon_template2, 17).set_nickname("mr. 17")
-mon3 = Mon(mon_template1, 17).set_nickname("David")
-mon4 = Mon(mon_template2, 33).set_nickname("large individual")
-mon5 = Mon(mon_template1, 100).set_nickname("biggest dude")
-
 class Battle(Scene):
     def _set_text_tilt(self, x):
         self._text_tilt = x/16.0
@@ -32,43 +27,64 @@ class Battle(Scene):
         self.context.player.get_move = self._get_move
         self.context.player.get_new_badgemon = self._get_new_badgemon
         self.context.player.gain_badgemon = self._gain_badgemon
-        self._battle_context = BContext(self.context.player, opponent, self.sm, self.speech)
+        self._journal = BattleJournal()
+        self._battle_context = BContext(self.context.player, opponent, self.sm, NewsSink(self.speech),
+                                        journal=self._journal)
         self._next_move: Mon | Item | Move | self.Desc | None = None
         self._next_move_available = Event()
+        inventory = self.context.player.inventory
+        self._item_rows = InventoryView(inventory, self._item_row)
+        self._describe_item_rows = InventoryView(inventory, self._describe_item_row)
+        # The tree last given to the choice dialog, and what it was built from
+        self._choices = None
+        self._choices_key = None
         self._gen_choice_dialog()
         self._text_tilt = 0
         self._draw_user = True
         self._draw_target = True
         self.animation_scheduler.trigger(AnimSin(AnimLerp(editor=lambda x: self._set_text_tilt(x)), length=3000))
 
+    def _item_row(self, item: Item, count: int):
+        if item.usable_in_battle and count > 0:
+            return f"{count}x {item.name}", self._do_item(item)
+
+    def _describe_item_row(self, item: Item, count: int):
+        if item.usable_in_battle and count > 0:
+            return item.name, self._describe(item)
+
     def _gen_choice_dialog(self):
+        # This runs on every button press, so when nothing it shows has changed, the dialog keeps the tree it has
+        # (and the text sizes it measured for it)
+        mon1 = self._battle_context.mon1
+        party = self._battle_context.player1.badgemon
+        key = (mon1, tuple(mon1.pp), self.context.player.inventory.version, tuple(m.fainted for m in party))
+        if key == self._choices_key and self.choice.choices() is self._choices:
+            return
+        self._choices_key = key
         available_moves: set[Move] = set()
-        for m in self._battle_context.player1.badgemon:
+        for m in party:
             if not m.fainted:
                 available_moves.update(m.moves)
-        self.choice.set_choices(
-            (
-                "BATTLE?!",
-                [
-                    ("Attack", ("Attack", [
-                        (f"{pp}x {m.name}", self._do_move(m, index)) for index, (m, pp) in enumerate(zip(self._battle_context.mon1.moves,self._battle_context.mon1.pp)) if pp > 0
-                    ])),
-                    ("Item", ("Item", [
-                        (f"{count}x {item.name}", self._do_item(item, count)) for (item,count) in self._battle_context.player1.inventory.items() if item.usable_in_battle and count > 0
-                    ])),
-                    ("Swap Mon", ("Swap Mon", [
-                        (m.nickname, self._do_mon(m)) for m in self._battle_context.player1.badgemon if not m.fainted
-                    ])),
-                    ("Describe...", ("Describe...", [
-                        ("Item", ("Describe Item", [(i.name, self._describe(i)) for i,c in self._battle_context.player1.inventory.items() if i.usable_in_battle and c > 0])),
-                        ("Move", ("Describe Move", [(m.name, self._describe(m)) for m in available_moves]))
-                    ])),
-                    ("Run Away", ("Run Away??", [
-                        ("Confirm", self._run_away())
-                    ]))
-                ]
-            )
+        self._choices = (
+            "BATTLE?!",
+            [
+                ("Attack", ("Attack", [
+                    (f"{pp}x {m.name}", self._do_move(m)) for m, pp in zip(self._battle_context.mon1.moves,self._battle_context.mon1.pp) if pp > 0
+                ])),
+                ("Item", ("Item", self._item_rows.rows())),
+                ("Swap Mon", ("Swap Mon", [
+                    (m.nickname, self._do_mon(m)) for m in self._battle_context.player1.badgemon if not m.fainted
+                ])),
+                ("Describe...", ("Describe...", [
+                    ("Item", ("Describe Item", self._describe_item_rows.rows())),
+                    ("Move", ("Describe Move", [(m.name, self._describe(m)) for m in available_moves]))
+                ])),
+                ("Run Away", ("Run Away??", [
+                    ("Confirm", self._run_away())
+                ]))
+            ]
         )
+        self.choice.set_choices(self._choices)
 
     def _gen_new_badgemon_dialog(self):
         self.choice.set_choices(
@@ -187,10 +203,9 @@ class Battle(Scene):
         else:
             self._their_turn(ctx)
 
-    def _do_move(self, move: Move, index: int):
+    def _do_move(self, move: Move):
         def f():
             self._next_move = move
-            self._battle_context.mon1.pp[index] -= 1
             self._next_move_available.set()
         return f
 
@@ -200,14 +215,8 @@ class Battle(Scene):
             self._next_move_available.set()
         return f
     
-    def _do_item(self, item: Item, count: int):
+    def _do_item(self, item: Item):
         def f():
-            if item.name != "Badgemon Doll":
-                nc = count - 1
-                if nc == 0:
-                    self._battle_context.player1.inventory.pop(item)
-                else:
-                    self._battle_context.player1.inventory[item] = nc  # decrease stock
             self._next_move = item
             self._next_move_available.set()
         return f
@@ -218,13 +227,8 @@ class Battle(Scene):
             self._next_move_available.set()
         return f
     
-    class Desc():
-        def __init__(self, t):
-            self.t = t
+    Desc = Describe
 
-        def __str__(self) -> str:
-            return self.t.desc
-    
     def _describe(self, thing):
         def f():
             self._next_move = self.Desc(thing)
@@ -251,116 +255,10 @@ class Battle(Scene):
         badgedex.find(mon.template.id)
         await self.speech.write(f"{mon.nickname} has been added to your badgemon case!")
 
-    async def _gain_money(self, player: Player, amount: int):
-        player.money += amount
-        await self.speech.write(f"Got {amount} monies!")
-    
     async def background_task(self):
-        print("test")
-        while True:
-            if self._battle_context.turn:
-                curr_player, curr_target = self._battle_context.player1, self._battle_context.player2
-                player_mon, target_mon = self._battle_context.mon1, self._battle_context.mon2
-            else:
-                curr_player, curr_target = self._battle_context.player2, self._battle_context.player1
-                player_mon, target_mon = self._battle_context.mon2, self._battle_context.mon1
-
-            print("target faint?")
-            
-            if target_mon.fainted:
-                await self.speech.write(f"{target_mon.nickname} fainted!")
-                if self._battle_context.turn:
-                    await self._battle_context.gain_exp(player_mon, target_mon)
-                    await self._gain_money(curr_player, target_mon.level*10)
-                all_fainted = True
-                for mon in curr_target.badgemon:
-                    all_fainted = all_fainted and mon.fainted
-                if all_fainted:
-                    await self.speech.write(f"{curr_player.name} wins!")
-                    await self.fade_to_scene(2)
-                    return
-                else:
-                    new_badgemon = await curr_target.get_new_badgemon()
-                    if self._battle_context.turn:
-                        self._battle_context.mon2 = new_badgemon
-                    else:
-                        self._battle_context.mon1 = new_badgemon
-                    target_mon = new_badgemon
-
-            print("player faint?")
-
-            if player_mon.fainted:
-                await self.speech.write(f"{player_mon.nickname} fainted!")
-                if not self._battle_context.turn:
-                    await self._battle_context.gain_exp(target_mon, player_mon)
-                    await self._gain_money(curr_target, player_mon.level*10)
-                all_fainted = True
-                for mon in curr_player.badgemon:
-                    all_fainted = all_fainted and mon.fainted
-                if all_fainted:
-                    await self.speech.write(f"{curr_target.name} wins!")
-                    await self.fade_to_scene(2)
-                    return
-                else:
-                    new_badgemon = await curr_player.get_new_badgemon()
-                    if self._battle_context.turn:
-                        self._battle_context.mon1 = new_badgemon
-                    else:
-                        self._battle_context.mon2 = new_badgemon
-                    player_mon = new_badgemon
-
-            print("getting move")
-
-            action = await curr_player.get_move(player_mon)
-
-            print(f"move got: {action}")
-
-            same_turn = False
-
-            if not isinstance(action, self.Desc):
-                curr_target.inform(action)
-
-            if isinstance(action, Move):
-                print(f"USING MOVE {action}")
-                await self._battle_context.use_move(player_mon, target_mon, action)
-
-            elif isinstance(action, Mon):
-                if self._battle_context.turn:
-                    self._battle_context.mon1 = action
-                else:
-                    self._battle_context.mon2 = action
-
-            elif isinstance(action, Item):
-                if action.name == "Badgemon Doll":
-                    if self._battle_context.turn:
-                        await self.speech.write(f"{player_mon.nickname} appreciated the craftsmanship of the doll.")
-                    same_turn = True
-                await self.speech.write(f"Used {action.name}!") 
-                if action.name.endswith("HexBox"):
-                    if not isinstance(self._battle_context.player2, Cpu):
-                        await self.speech.write("Oh no! You can't catch THAT Badgemon!")
-                    else:
-                        catch = await self._battle_context.catch(curr_player, player_mon, target_mon, action)
-                        if catch:
-                            print("CATCH")
-                            await curr_player.gain_badgemon(target_mon, curr_player.badgemon_case, curr_player.badgedex)
-                            await self.fade_to_scene(2)
-                            return
-                else:
-                    action.function_in_battle(curr_player, self._battle_context, player_mon, target_mon)
-
-            elif isinstance(action, self.Desc):
-                if self._battle_context.turn:
-                    if isinstance(action.t, Move):
-                        await self.speech.write(f"|TYPE: {constants.type_to_str(action.t.move_type)}| {action}")
-                    else:
-                        await self.speech.write(str(action))
-                same_turn = True
-
-            elif action is None:
-                await self.speech.write(f"{curr_target.name} wins by default!")
-                await self.fade_to_scene(2)
-                return
-
-            if not same_turn:
-                self._battle_context.turn = not self._battle_context.turn
\ No newline at end of file
+        try:
+            await self._battle_context.run()
+        finally:
+            # Kept for bug reports, see game/journal.py
+            self._journal.save(SAVE_PATH + "battle.dat")
+        await self.fade_to_scene(2)
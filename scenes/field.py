@@ -3,12 +3,14 @@ import asyncio
 from ..util import static_random as random
 from sys import implementation as _sys_implementation
 if _sys_implementation.name != "micropython":
-    from typing import Coroutine
+    from typing import Callable, Coroutine
 
 from ..game.player import Cpu, Player
 
 from ..scenes.scene import Scene
+from ..util.choice import Submenu
 from ..game.items import Item, items_list
+from ..game.inventory import InventoryView, MAX_COUNT
 from ..game.mons import Mon, mons_list, choose_weighted_mon
 from ..util.misc import shrink_until_fit, draw_mon
 from ..protocol import packet
@@ -16,18 +18,17 @@ from events.input import ButtonDownEvent
 from ctx import Context
 from ..game.customisation import COLOURS, PATTERNS
 
-potion = items_list[0]
-mon_template1 = mons_list[0]
-mon_template2 = mons_list[1]
-mon1 = Mon(mon_template1, 5).set_nickname("small guy")
-mon2 = Mon(mon_template2, 17).set_nickname("mr. 17")
-mon3 = Mon(mon_template1, 17).set_nickname("David")
-mon4 = Mon(mon_template2, 33).set_nickname("large individual")
-mon5 = Mon(mon_template1, 100).set_nickname("biggest dude")
-
 class Field(Scene):
+    cacheable = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._inventory = None
+        self._menu = None
+        self._describe_items = ("Descriptions", [(i.name, self._get_answer(self._describe_item, i)) for i in items_list])
+        self.reset()
+
+    def reset(self):
         self._next_move_available = Event()
         self._next_move = None
         self._fight_accept_available = Event()
@@ -39,34 +40,39 @@ class Field(Scene):
         self._random_enc_needed = Event()
         self._tasks_finished = Event()
         self.adv = None
+        # Anything could have changed while the scene was away
+        self._menu = None
+        if self._inventory is not self.context.player.inventory:
+            self._inventory = self.context.player.inventory
+            self._use_item_rows = InventoryView(self._inventory, self._use_item_row, lambda: tuple(self.context.player.badgemon))
+            self._shop_rows = InventoryView(self._inventory, self._shop_row, lambda: self.context.player.money)
         if len(self.context.player.badgemon) == 0:
-            self.context.player.badgemon.append(Mon(mon_template1, 5).set_nickname("LIL GUY"))
+            self.context.player.badgemon.append(Mon(mons_list[0], 5).set_nickname("LIL GUY"))
         try:
             self._gen_field_dialog()
         except Exception as e:
             print(e)
-        self.sm._attempt_save()
+        self.sm.request_save()
 
     def redirect(self):
         for m in self.context.player.badgemon:
             if m.level_up_needed():
                 return 7
 
-    def _get_answer(self, ans: Coroutine, exit = False):
-        return lambda: self._get_answer_internal(ans,exit)
+    def _get_answer(self, fn: Callable[..., Coroutine], *args, exit = False):
+        '''
+        The coroutine fn(*args) is only made once the answer's chosen, so menus can be kept and chosen from again.
+        '''
+        return lambda: self._get_answer_internal(fn(*args), exit)
 
     def _get_answer_internal(self, ans: Coroutine, exit = False):
         self._next_move = ans
         self._exit = exit
         self._next_move_available.set()
 
-    async def _use_item(self, item: Item, count: int, mon: Mon):
+    async def _use_item(self, item: Item, mon: Mon):
         if item.name != "Fishing Rod":
-            count -= 1
-            if count == 0:
-                self.context.player.inventory.pop(item)
-            else:
-                self.context.player.inventory[item] = count
+            self.context.player.inventory.take(item)
         await self.speech.write(f"Using {item.name}!")
         if item.name == "Fishing Rod":
             await self.speech.write(f"But wait - You don't have an Eastnor Fishing licence! Try again later.")
@@ -95,21 +101,19 @@ class Field(Scene):
         await self.context.player.use_full_heal(self.speech)
 
     async def _initiate_battle(self):
-        template = choose_weighted_mon()
+        template = choose_weighted_mon(random.encounter)
         max_level = max([m.level for m in self.context.player.badgemon])
-        level = random.randrange(max(max_level//8,5), int(max_level*1.2))
+        level = random.encounter.randrange(max(max_level//8,5), int(max_level*1.2))
 
-        await self.fade_to_scene(3, opponent=Cpu(template.name, [Mon(template, level)], [], []))
+        await self.fade_to_scene(3, opponent=Cpu(template.name, [Mon(template, level, rng=random.encounter)], [], {}))
 
     async def _save(self):
-        self.sm._attempt_save()
+        self.sm.request_save()
+        await self.sm._saver.wait()
         await self.speech.write("Game Saved!")
 
     async def _purchase(self, item: Item, count: int):
-        current = self.context.player.inventory.get(item)
-        if current is None:
-            current = 0
-        self.context.player.inventory[item] = count+current
+        self.context.player.inventory.add(item, count)
         self.context.player.money -= item.value*count
         await self.speech.write(f"Bought {count}x {item.name}! Have a nice day!")
 
@@ -183,109 +187,115 @@ class Field(Scene):
     async def _set_pattern(self, pat):
         self.context.custom.pattern = pat
 
-    def _gen_field_dialog(self):
+    def _use_item_row(self, item: Item, count: int):
+        if not item.usable_in_field or count == 0:
+            return None
+        return (f"{count}x {item.name}",
+                ("Pick a mon", [(m.nickname, self._get_answer(self._use_item, item, m))
+                                for m in self.context.player.badgemon]))
+
+    def _shop_row(self, item: Item, count: int):
+        m = min(self.context.player.money//item.value, MAX_COUNT-count, 10)
+        if m <= 0:
+            return None
+        return (f"{item.name}",
+                (f"Cost: {item.value}", [(f"{i}x {item.name}",
+                        (f"Buy {i}x {item.name}", [("Confirm",
+                            self._get_answer(self._purchase, item, i)
+                        )])
+                    ) for i in range(1,m+1)]))
+
+    def _deposit_menu(self):
         if len(self.context.player.badgemon) == 1:
-            swap_mon_out = self._get_answer(self.speech.write("You must have at least one badgemon at all times!"))
-        else:
-            swap_mon_out = ("Deposit BM", [(m.nickname, self._get_answer(self._deposit_mon(m)))for m in self.context.player.badgemon])
+            return self._get_answer(self.speech.write, "You must have at least one badgemon at all times!")
+        return ("Deposit BM", [(m.nickname, self._get_answer(self._deposit_mon, m)) for m in self.context.player.badgemon])
 
+    def _withdraw_menu(self):
         if len(self.context.player.badgemon) == 6:
-            swap_mon_in = self._get_answer(self.speech.write("You can have maximum six badgemon!"))
-        elif len(self.context.player.badgemon_case) == 0:
-            swap_mon_in = self._get_answer(self.speech.write("You have no badgemons in storage!"))
-        else:
-            swap_mon_in  = ("Withdraw BM ", [(m.nickname, self._get_answer(self._move_in_mon(m))) for m in self.context.player.badgemon_case])
+            return self._get_answer(self.speech.write, "You can have maximum six badgemon!")
+        if len(self.context.player.badgemon_case) == 0:
+            return self._get_answer(self.speech.write, "You have no badgemons in storage!")
+        return ("Withdraw BM ", [(m.nickname, self._get_answer(self._move_in_mon, m)) for m in self.context.player.badgemon_case])
 
-        # this is so cursed
+    def _order_menu(self):
         if len(self.context.player.badgemon) == 1:
-            swap_mons = self._get_answer(self.speech.write("You only have one badgemon!"))
-        else:
-            swap_mons  = ("Pick first mon", [(m1.nickname,
-                        (f"Pick Second mon", [(m2.nickname,
-                               self._get_answer(self._swap_mon(i, j)), 
-                            ) for j, m2 in enumerate(self.context.player.badgemon)])
-                        ) for i, m1 in enumerate(self.context.player.badgemon)])
-            
-        inspect = ("Inspect BMon", [(f"{m.nickname}", self._get_answer(self._inspect(m), True)) for m in self.context.player.badgemon])
-            
-        usable_items = [(i, c) for (i, c) in self.context.player.inventory.items() if i.usable_in_field and c > 0]
-
-        if len(usable_items) == 0:
-            use_item = self._get_answer(self.speech.write("You have no (usable) items!"))
-        else:
-            use_item = ("Pick an item", [(f"{c}x {i.name}",
-                        ("Pick a mon", [(m.nickname,
-                                self._get_answer(self._use_item(i, c, m))
-                            ) for m in self.context.player.badgemon])
-                        ) for (i, c) in usable_items])
+            return self._get_answer(self.speech.write, "You only have one badgemon!")
+        return ("Pick first mon", [(m1.nickname, Submenu(self._order_second_menu, i))
+                                   for i, m1 in enumerate(self.context.player.badgemon)])
+
+    def _order_second_menu(self, i: int):
+        return ("Pick Second mon", [(m2.nickname, self._get_answer(self._swap_mon, i, j))
+                                    for j, m2 in enumerate(self.context.player.badgemon)])
+
+    def _inspect_menu(self):
+        return ("Inspect BMon", [(f"{m.nickname}", self._get_answer(self._inspect, m, exit=True))
+                                 for m in self.context.player.badgemon])
+
+    def _badgemon_menu(self):
+        return ("Badgemon",[
+            ("Heal", self._get_answer(self._use_full_heal)),
+            ("Deposit", Submenu(self._deposit_menu)),
+            ("Withdraw", Submenu(self._withdraw_menu)),
+            ("Order", Submenu(self._order_menu)),
+            ("Inspect", Submenu(self._inspect_menu))
+        ])
+
+    def _use_item_menu(self):
+        rows = self._use_item_rows.rows()
+        if len(rows) == 0:
+            return self._get_answer(self.speech.write, "You have no (usable) items!")
+        return ("Pick an item", rows)
+
+    def _shop_menu(self):
+        rows = self._shop_rows.rows()
+        if len(rows) == 0:
+            return self._get_answer(self.speech.write, "You don't have enough money!")
+        return (f"GP: {self.context.player.money}", rows)
+
+    def _item_bag_menu(self):
+        return ("Item Bag", [
+            ("Use Item", Submenu(self._use_item_menu)),
+            ("Describe", self._describe_items),
+            ("Buy Item", Submenu(self._shop_menu))
+        ])
+
+    def _customisation_menu(self):
+        return ("Customisation", [
+            ("Background", ("Background Colour", [(col, self._get_answer(self._set_bg_col, col)) for col in COLOURS.keys()])),
+            ("Foreground", ("Foreground Colour", [(col, self._get_answer(self._set_fg_col, col)) for col in COLOURS.keys()])),
+            #("pattern", ("Pattern", [(pat, self._get_answer(self._set_pattern, pat)) for pat in PATTERNS])),
+        ])
 
+    def _gen_field_dialog(self):
+        '''
+        Puts up the field menu. Only its top level is built here, and only again once an answer has run (or the scene's
+        been away); each submenu is built when it's first entered, and answers make their coroutines when chosen.
+        '''
+        if self._menu is None:
+            options = [
+                ("Badgemon", Submenu(self._badgemon_menu)),
+                ("Badgedex", self._get_answer(self.fade_to_scene, 5, exit=True)),
+                ("Item Bag", Submenu(self._item_bag_menu)),
+                ("Customisation", Submenu(self._customisation_menu)),
+                #("Host Fight",self._get_answer(self._host_fight)),
+                #("Instructions", self._get_answer(self.fade_to_scene, 4, exit=True)),
+                ("Settings", ("Settings",[
+                    ("Tog. RandEnc", self._get_answer(self._toggle_randomenc))
+                ])),
+                ("Main Menu", ("Main Menu?",[
+                    ("Confirm", self._get_answer(self.fade_to_scene, 0, exit=True))
+                ])),
+                ("Save", self._get_answer(self._save)),
+            ]
 
-        describe_item = ("Descriptions", [(i.name,
-                            self._get_answer(self._describe_item(i))
-                            ) for i in items_list])
-        
+            if self.context.player.name == "MOLIVE" or self.context.player.name == "NYAALEX":
+                options.append(("DEBUG BATTLE", self._get_answer(self._initiate_battle, exit=True)))
 
-        max_purchase = []
-        no_purchase = True
-        for item in items_list:
-            current = self.context.player.inventory.get(item)
-            if current is None:
-                current = 0
-            m = min(self.context.player.money//item.value, 255-current, 10)
-            no_purchase &= m == 0
-            max_purchase.append((item, m))
-            
-        if no_purchase:
-            shop = self._get_answer(self.speech.write("You don't have enough money!"))
-        else:
-            shop = (f"GP: {self.context.player.money}", [(f"{item.name}",
-                    (f"Cost: {item.value}", [(f"{i}x {item.name}",
-                            (f"Buy {i}x {item.name}", [("Confirm",
-                                self._get_answer(self._purchase(item,i))
-                            )])
-                        ) for i in range(1,count+1)])
-                    ) for (item, count) in max_purchase if count > 0])
-            
-        change_bg_col = ("Background Colour", [(col, self._get_answer(self._set_bg_col(col))) for col in COLOURS.keys()])
-        change_fg_col = ("Foreground Colour", [(col, self._get_answer(self._set_fg_col(col))) for col in COLOURS.keys()])
-        change_pattern = ("Pattern", [(pat, self._get_answer(self._set_pattern(pat))) for pat in PATTERNS])
-
-        options = [
-            ("Badgemon", ("Badgemon",[
-                ("Heal", self._get_answer(self._use_full_heal())),
-                ("Deposit", swap_mon_out),
-                ("Withdraw", swap_mon_in),
-                ("Order", swap_mons),
-                ("Inspect", inspect)
-            ])),
-            ("Badgedex", self._get_answer(self.fade_to_scene(5), True)),
-            ("Item Bag", ("Item Bag", [
-                ("Use Item", use_item),
-                ("Describe", describe_item),
-                ("Buy Item", shop)
-            ])),
-            ("Customisation", ("Customisation", [
-                ("Background", change_bg_col),
-                ("Foreground", change_fg_col),
-                #("pattern", change_pattern),
-            ])),
-            #("Host Fight",self._get_answer(self._host_fight())),
-            #("Instructions", self._get_answer(self.fade_to_scene(4), True)),
-            ("Settings", ("Settings",[
-                ("Tog. RandEnc", self._get_answer(self._toggle_randomenc()))
-            ])),
-            ("Main Menu", ("Main Menu?",[
-                ("Confirm", self._get_answer(self.fade_to_scene(0), True))
-            ])),
-            ("Save", self._get_answer(self._save())),
-        ]
-        
-        if self.context.player.name == "MOLIVE" or self.context.player.name == "NYAALEX":
-            options.append(("DEBUG BATTLE", self._get_answer(self._initiate_battle(), True)))
+            self._menu = ("Field", options)
 
-        self.choice.set_choices(
-            ("Field", options)
-        )
+        # Other menus (like a fight request) share the dialog, so it may need the field menu back
+        if self.choice.choices() is not self._menu:
+            self.choice.set_choices(self._menu)
 
     def draw(self, ctx: Context):
         ctx.rectangle(-120,-120,240,240).rgb(*COLOURS[self.context.custom.background_col]).fill()
@@ -297,7 +307,7 @@ class Field(Scene):
         shrink_until_fit(ctx, self.context.player.name, 220, 60)
         ctx.move_to(-110, 0).text(self.context.player.name).fill()
         ctx.font_size = 20
-        ctx.move_to(-105, 35).text(f"Badgedex: {sum(self.context.player.badgedex.found)}/{len(mons_list)}").fill()
+        ctx.move_to(-105, 35).text(f"Badgedex: {self.context.player.badgedex.caught_count}/{len(mons_list)}").fill()
         positions = [
             (-34-16, -90 -16),
             (   -16, -100-16),
@@ -361,6 +371,8 @@ class Field(Scene):
             await self._next_move_available.wait()
             self._next_move_available.clear()
             await self._next_move
+            # The answer may have changed what the menu shows
+            self._menu = None
         self._tasks_finished.set()  
     
     async def _drive_random_enc(self):
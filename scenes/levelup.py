@@ -1,7 +1,7 @@
 from asyncio import Event
 import asyncio
 from ctx import Context
-from ..game.mons import Mon
+from ..game import progression
 from ..util.animation import AnimFaster, AnimLerp, AnimRandom, AnimationEvent, AnimationWait
 
 from ..scenes.scene import Scene
@@ -10,13 +10,9 @@ from ..util.misc import draw_mon
 class LevelUp(Scene):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.mon = None
-        self.mon_index = 0
-        for i,m in enumerate(self.context.player.badgemon):
-            if m.level_up_needed():
-                self.mon = m
-                self.mon_index = i
-                break
+        # Every level up due across the party, presented one after another in this one visit
+        self.queue = progression.pending(self.context.player.badgemon)
+        self.mon = self.queue[0].mon if self.queue else None
         self.replace_chosen = False
         self.mon_x = 0
         self.mon_y = 0
@@ -46,71 +42,77 @@ class LevelUp(Scene):
         super().draw(ctx)
         draw_mon(ctx, self.mon.template.sprite, -64+self.mon_x*self.scale, -64+self.mon_y*self.scale, False, False, 4)
 
+    async def _learn(self, move):
+        if len(self.mon.moves) < 4:
+            self.mon.moves.append(move)
+            await self.speech.write(f"{self.mon.nickname} learnt {move.name}!")
+        else:
+            await self.speech.write(f"{self.mon.nickname} would like to learn {move.name}. Please select a move to replace, or press back to abandon learning the move.")
+            self.replace_chosen = False
+            self.choice.set_choices(
+                (
+                    move.name,
+                        [(old.name, self._replace_move(self.mon, index, move)) for index, old in enumerate(self.mon.moves)]
+                )
+            )
+            self.choice.open()
+            await self.choice.closed_event.wait()
+            if self.replace_chosen:
+                await self.speech.write(f"{self.mon.nickname} learnt {move.name}!")
+            else:
+                await self.speech.write(f"{self.mon.nickname} did not learn {move.name}.")
+
+    async def _evolve(self, p: progression.LevelProgress, template):
+        await asyncio.sleep(1)
+        await self.speech.write(f"Wait, what's happening???")
+        rndx = AnimRandom(editor=lambda x: self._set_mon_x(x), start=-1, length=2837, infinite=True)
+        rndy = AnimRandom(editor=lambda y: self._set_mon_y(y), start=-1, length=4526, infinite=True)
+        scaleanim = AnimFaster(editor=lambda s: self._set_scale(s*30), length=5000)
+        self._fader.detach()
+        self._fader.ends(rndx)
+        self._fader.ends(rndy)
+        self._fader.ends(scaleanim)
+        self._fader._colour = (1,1,1)
+        self._fader.reset(fadein=False)
+        self._fader._length = 5000
+        endevent = Event()
+        animend = AnimationEvent(endevent)
+        self._fader.and_then(animend)
+        starter = AnimationWait(length=0)
+        starter.and_then(rndx).but_also(rndy).but_also(scaleanim).but_also(self._fader)
+        self.animation_scheduler.trigger(starter)
+        await endevent.wait()
+        self.mon = p.evolve(template)
+        self.context.player.badgemon[p.index] = self.mon
+        self._fader.reset(fadein=True)
+        self._fader._length = 1000
+        animend.reset()
+        self.mon_x = 0
+        self.mon_y = 0
+        self.scale = 0
+        self.animation_scheduler.trigger(self._fader)
+        await endevent.wait()
+        self._fader._length = 200
+        self.scale = 1
+        await asyncio.sleep(2)
+        await self.speech.write(f"{self.mon.nickname} evolved into {self.mon.template.name}!")
+        self.context.player.badgedex.find(self.mon.template.id)
+
     async def background_task(self):
-        await self.speech.write(f"{self.mon.nickname} leveled up!")
-        self.mon.level += 1
-        await self.speech.write(f"{self.mon.nickname} is now level {self.mon.level}")
-        for move, lvl in self.mon.template.learnset:
-            if lvl == self.mon.level:
-                if len(self.mon.moves) < 4:
-                    self.mon.moves.append(move)
-                    await self.speech.write(f"{self.mon.nickname} learnt {move.name}!")
-                else:
-                    await self.speech.write(f"{self.mon.nickname} would like to learn {move.name}. Please select a move to replace, or press back to abandon learning the move.")
-                    self.replace_chosen = False
-                    self.choice.set_choices(
-                        (
-                            move.name,
-                                [(move.name, self._replace_move(self.mon, index, move)) for index, move in enumerate(self.mon.moves)]
-                        )
-                    )
-                    self.choice.open()
-                    await self.choice.closed_event.wait()
-                    if self.replace_chosen:
-                        await self.speech.write(f"{self.mon.nickname} learnt {move.name}!")
-                    else:
-                        await self.speech.write(f"{self.mon.nickname} did not learn {move.name}.")
-        self.mon.calculate_stats()
-        await self.speech.write(f"{self.mon.nickname}'s stats updated!")
-        if self.mon.template.evolve_level and self.mon.template.evolve_mon:
-            if self.mon.template.evolve_level == self.mon.level:
-                await asyncio.sleep(1)
-                await self.speech.write(f"Wait, what's happening???")
-                rndx = AnimRandom(editor=lambda x: self._set_mon_x(x), start=-1, length=2837, infinite=True)
-                rndy = AnimRandom(editor=lambda y: self._set_mon_y(y), start=-1, length=4526, infinite=True)
-                scaleanim = AnimFaster(editor=lambda s: self._set_scale(s*30), length=5000)
-                self._fader.detach()
-                self._fader.ends(rndx)
-                self._fader.ends(rndy)
-                self._fader.ends(scaleanim)
-                self._fader._colour = (1,1,1)
-                self._fader.reset(fadein=False)
-                self._fader._length = 5000
-                endevent = Event()
-                animend = AnimationEvent(endevent)
-                self._fader.and_then(animend)
-                starter = AnimationWait(length=0)
-                starter.and_then(rndx).but_also(rndy).but_also(scaleanim).but_also(self._fader)
-                self.animation_scheduler.trigger(starter)
-                await endevent.wait()
-                new_mon = Mon(self.mon.template.evolve_mon, self.mon.level, self.mon.ivs, self.mon.evs, self.mon.moves)
-                new_mon.set_nickname(self.mon.nickname)
-                new_mon.xp = self.mon.xp
-                self.context.player.badgemon[self.mon_index] = new_mon
-                self.mon = new_mon
-                self._fader.reset(fadein=True)
-                self._fader._length = 1000
-                animend.reset()
-                self.mon_x = 0
-                self.mon_y = 0
-                self.scale = 0
-                self.animation_scheduler.trigger(self._fader)
-                await endevent.wait()
-                self._fader._length = 200
-                await asyncio.sleep(2)
-                await self.speech.write(f"{self.mon.nickname} evolved into {self.mon.template.name}!")
-                self.context.player.badgedex.find(self.mon.template.id)
-                self.mon.calculate_stats()
-                await self.speech.write(f"{self.mon.nickname}'s stats updated!")
+        for p in self.queue:
+            self.mon = p.mon
+            if p.levels_gained() == 1:
+                await self.speech.write(f"{self.mon.nickname} leveled up!")
+            else:
+                await self.speech.write(f"{self.mon.nickname} gained {p.levels_gained()} levels!")
+            p.apply()
+            await self.speech.write(f"{self.mon.nickname} is now level {self.mon.level}")
+            gains = p.describe_gains()
+            if gains:
+                await self.speech.write(f"{self.mon.nickname}'s stats went up! {gains}")
+            for move, _ in p.moves:
+                await self._learn(move)
+            for template in p.evolutions:
+                await self._evolve(p, template)
 
-        await self.fade_to_scene(7)
\ No newline at end of file
+        await self.fade_to_scene(2)
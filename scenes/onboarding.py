@@ -4,7 +4,7 @@ from ..util import static_random as random
 
 from ctx import Context
 
-from ..game.mons import Mon, mons_list
+from ..game.mons import Mon, mons_list, template_weights
 
 from ..config import ASSET_PATH
 
@@ -19,7 +19,7 @@ class Onboarding(Scene):
         self._slide = None
         self._bmons = []
         chosen = set()
-        common_mons = [m for m in mons_list if m.weight >= 80]
+        common_mons = [mons_list[i] for i, weight in enumerate(template_weights()) if weight >= 80]
         for _ in range(3):
             mon = random.choice(common_mons)
             while mon.id in chosen:
@@ -6,8 +6,13 @@ from ..config import ASSET_PATH
 from events.input import ButtonDownEvent
 
 class Qr(Scene):
+    cacheable = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.reset()
+
+    def reset(self):
         self._exit = Event()
 
     def draw(self, ctx: Context):
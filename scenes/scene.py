@@ -14,6 +14,11 @@ except ImportError:
     pass
 
 class Scene:
+    # Whether the scene manager may keep this scene around after leaving it, and reuse it next time instead of
+    # building a new one (see SceneManager.switch_scene). A cacheable scene does everything it needs for a visit in
+    # reset(), which its __init__ calls too.
+    cacheable = False
+
     def __init__(self, sm: 'SceneManager'):
         self.sm = sm
         self.choice = sm._choice
@@ -39,10 +44,19 @@ class Scene:
         self._battle_fader.reset()
         fader._colour = (0,0,0)
         fader.and_then(AnimationEvent(end_event))
+        if scene is not None:
+            # Import the next scene now, while the screen is still, rather than in the middle of the fade
+            self.sm.preload(scene)
         self.animation_scheduler.trigger(fader)
         await end_event.wait()
         self.sm.switch_scene(scene, *args, **kwargs)
 
+    def reset(self, *args, **kwargs):
+        """
+        Sets a cacheable scene up for another visit, with the arguments switch_scene was given.
+        """
+        pass
+
     def _fadein(self):
         self._scene_ready.clear()
         self._fader.detach()
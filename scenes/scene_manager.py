@@ -4,20 +4,11 @@ import os
 import sys
 
 from ..scenes.scene import Scene
-from ..scenes.main_menu import MainMenu
-from ..scenes.field import Field
-from ..scenes.battle import Battle
-from ..scenes.qr import Qr
-from ..scenes.badgedex import Badgedex
-from ..scenes.onboarding import Onboarding
-from ..scenes.levelup import LevelUp
-from ..scenes.stats import Stats
-from ..game.game_context import GameContext, VERSION
+from ..game.game_context import GameContext
 from ..util.fades import FadeToShade, BattleFadeToShade
 from ..util.choice import ChoiceDialog
 from ..util.speech import SpeechDialog
-from ..util.misc import dump_exception, path_isdir
-from ..game.migrate import conversion
+from ..util.misc import dump_exception, OverlaySlot, ticks_us
 from ..protocol.bluetooth import BluetoothDevice
 from system.eventbus import eventbus
 from events.input import Buttons
@@ -25,11 +16,48 @@ from system.scheduler.events import RequestStopAppEvent
 from ..util.animation import AnimationScheduler
 from app import App
 from ctx import Context
-from ..config import SAVE_PATH
+from ..config import SAVE_PATH, PROFILE, SCENE_CACHE_SIZE
+from ..util.profiler import FrameProfiler, NullProfiler
+from ..util.gc_scheduler import GcScheduler
+from ..util.save_writer import SaveWriter
 
-from ..util.text_box import TextExample, TextDialog
+from ..util.text_box import TextDialog
 
-SCENE_LIST = [MainMenu, Onboarding, Field, Battle, Qr, Badgedex, TextExample, LevelUp, Stats]
+class SceneRegistry:
+    """
+    The scenes by index, each as its module (relative to the app) and class name. A scene's module is only
+     imported the first time the scene is looked up, so starting the app doesn't load, or hold on to,
+     scenes it never shows. Once imported, the class is kept.
+    """
+    def __init__(self, entries):
+        self._entries = entries
+        self._classes = [None] * len(entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getitem__(self, index: int) -> type:
+        scene_class = self._classes[index]
+        if scene_class is None:
+            module, name = self._entries[index]
+            scene_class = getattr(__import__(module, globals(), None, (name,), 2), name)
+            self._classes[index] = scene_class
+        return scene_class
+
+    def loaded(self, index: int) -> bool:
+        return self._classes[index] is not None
+
+SCENE_LIST = SceneRegistry((
+    ("scenes.main_menu", "MainMenu"),
+    ("scenes.onboarding", "Onboarding"),
+    ("scenes.field", "Field"),
+    ("scenes.battle", "Battle"),
+    ("scenes.qr", "Qr"),
+    ("scenes.badgedex", "Badgedex"),
+    ("util.text_box", "TextExample"),
+    ("scenes.levelup", "LevelUp"),
+    ("scenes.stats", "Stats"),
+))
 
 def dump_exception(e: Exception):
     if sys.implementation.name == "micropython":
@@ -45,6 +73,7 @@ class SceneManager(App):
             os.mkdir("bmon_gr_saves")
         except Exception as e:
             dump_exception(e)
+        self._animation_scheduler = AnimationScheduler()
         self._speech = SpeechDialog(
             app=self,
             speech="Scene Testing!"
@@ -55,10 +84,22 @@ class SceneManager(App):
         self._fader = FadeToShade((1.0,1.0,1.0), length=200)
         self._battle_fader = BattleFadeToShade((0.0,0.0,0.0), length=1000)
         self._text = TextDialog(self, "Jim")
-        self.overlays = [self._speech, self._choice, self._text, self._fader, self._battle_fader]
-        self._animation_scheduler = AnimationScheduler()
+        self._anim_overlay = OverlaySlot()
+        self.overlays = [self._speech, self._choice, self._text, self._fader, self._battle_fader, self._anim_overlay]
         self._button_states = Buttons(self)
+        self._profiler = None
+        if PROFILE:
+            self._profiler = FrameProfiler()
+        # What the frame loop times itself with, which does nothing unless PROFILE is set
+        self._timer = NullProfiler() if self._profiler is None else self._profiler
+        self._gc = GcScheduler(self._animation_scheduler, self._profiler)
+        self._gc.start()
+        self._frame_start = ticks_us()
+        self._saver = SaveWriter(SAVE_PATH, "sav.dat", self._serialise_save, self._animation_scheduler.critical_running)
         self._scene = None
+        self._scene_index = None
+        # (index, scene) of scenes that have been left, most recent first, see switch_scene
+        self._scene_cache = []
         self._attempt_load()
         if self._context == None:
             self._context = GameContext()
@@ -68,72 +109,84 @@ class SceneManager(App):
         self._bt = BluetoothDevice()
         self.connection_task = None
 
-    def _attempt_save(self):
+    def _serialise_save(self) -> bytes:
+        return self._context.serialise()
+
+    def request_save(self):
         '''
-        Save data to disk
+        Save data to disk, in the background (see util/save_writer.py)
         '''
-        data = self._context.serialise()
-        if not path_isdir(SAVE_PATH):
-            os.mkdir(SAVE_PATH)
-        with open(SAVE_PATH+"sav.dat", "wb") as f:
-            f.write(data)
+        self._saver.request()
 
     def _attempt_load(self):
         '''
         Load data from disk
         '''
         try:
-            while True:
-                f = open(SAVE_PATH+"sav.dat", "rb")
-                if f.read(4) != b'BGGR':
-                    print("FILE UNRECOGNISED")
-                    self._context = None
-                    return
-                version = int.from_bytes(f.read(1), 'little')
-                if version != VERSION:
-                    if version > VERSION:
-                        print("TOO NEW!")
-                        self._context = None
-                        return
-                    elif version in conversion:
-                        f.close()
-                        conversion[version]()
-                        continue
-                    print("UNKNOWN VERSION")
-                    self._context = None
-                    return
-                f.close()
-                with open(SAVE_PATH+"sav.dat", "rb") as f:
-                    f.seek(6)
-                    data = f.read()
-                    self._context = GameContext.deserialise(data)
-                    return
+            with open(SAVE_PATH+"sav.dat", "rb") as f:
+                data = f.read()
+            # Older versions are upgraded as they load, and written back as the current one the next time it saves
+            self._context = GameContext.load(data)
+        except ValueError as e:
+            print(f"Can't load save: {e}")
+            self._context = None
         except Exception as e:
             dump_exception(e)
             self._context = None
 
+    def _fail(self, what: str, e: Exception):
+        '''
+        Quits after an uncaught exception, leaving the garbage collector as it found it.
+        '''
+        print(what)
+        dump_exception(e)
+        self._gc.stop()
+        sys.exit()
+
     def update(self, delta: float):
+        timer = self._timer
+        self._frame_start = ticks_us()
+        self._gc.pause()
         try:
+            t = timer.start()
             self._animation_scheduler.update(delta)
+            timer.stop("anim update", t)
+            t = timer.start()
             self._speech.update(delta)
             self._choice.update(delta)
             self._text.update(delta)
+            timer.stop("dialogs update", t)
+            t = timer.start()
             if self._scene is not None:
                 self._scene.update(delta)
+            timer.stop("scene update", t)
         except Exception as e:
-            print("UPDATE FAIL")
-            dump_exception(e)
-            sys.exit()
+            self._fail("UPDATE FAIL", e)
+        finally:
+            self._gc.resume()
 
     def draw(self, ctx: Context):
+        timer = self._timer
+        self._gc.pause()
         try:
+            t = timer.start()
             if self._scene is not None:
                 self._scene.draw(ctx)
+            timer.stop("scene draw", t)
+            t = timer.start()
             super().draw(ctx)
+            timer.stop("overlays draw", t)
+            t = timer.start()
+            timer.draw(ctx)
+            timer.stop("profiler draw", t)
+            t = timer.start()
+            self._gc.idle(self._frame_start)
+            timer.stop("gc idle", t)
+            timer.end_frame()
         except Exception as e:
-            print("DRAW FAIL")
-            dump_exception(e)
-            sys.exit()
+            self._fail("DRAW FAIL", e)
+        finally:
+            self._gc.resume()
 
     async def background_task(self):
         while True:
@@ -145,20 +198,47 @@ class SceneManager(App):
             try:
                 await self._scene.background_task()
             except Exception as e:
-                print("BACKGROUND FAIL")
-                dump_exception(e)
-                sys.exit()
+                self._fail("BACKGROUND FAIL", e)
             self._choice.close()
             self._speech.close()
             self._text.close()
             await asyncio.sleep(0.05)
 
+    def preload(self, scene: int):
+        """
+        Gets a scene ready to switch to, by importing it.
+        """
+        SCENE_LIST[scene]
+
+    def _cache_scene(self, index: int, scene: Scene):
+        if not scene.cacheable:
+            return
+        for i, (cached_index, _) in enumerate(self._scene_cache):
+            if cached_index == index:
+                self._scene_cache.pop(i)
+                break
+        self._scene_cache.insert(0, (index, scene))
+
+    def _take_cached_scene(self, index: int) -> Scene:
+        for i, (cached_index, scene) in enumerate(self._scene_cache):
+            if cached_index == index:
+                self._scene_cache.pop(i)
+                return scene
+        return None
+
     def switch_scene(self, scene: int, *args, **kwargs):
+        """
+        Leaves the current scene for scene (an index into SCENE_LIST), or quits if scene is None.
+        Cacheable scenes that were left recently are reset and reused rather than built again.
+        """
         if self._scene is not None:
             self._scene.scene_end()
+            self._cache_scene(self._scene_index, self._scene)
         if scene is None:
+            self._scene_cache = []
+            self._gc.stop()
             self._animation_scheduler.kill_animation()
-            self._attempt_save()
+            self._saver.flush()
             eventbus.emit(RequestStopAppEvent(self))
             del self._animation_scheduler
             del self._choice
@@ -173,10 +253,21 @@ class SceneManager(App):
             while scene is not None:
                 print("LOAD SCENE")
                 print((SCENE_LIST[scene]))
-                self._scene: Scene = (SCENE_LIST[scene])(self, *args, **kwargs)
-                gc.collect()
-                print(f"mem used: {gc.mem_alloc()}, mem free:{gc.mem_free()}")
+                self._scene: Scene = self._take_cached_scene(scene)
+                if self._scene is None:
+                    self._scene = (SCENE_LIST[scene])(self, *args, **kwargs)
+                    # The screen is faded out, so this is the best time there'll be
+                    self._gc.collect()
+                    print(f"mem used: {gc.mem_alloc()}, mem free:{gc.mem_free()}")
+                else:
+                    self._scene.reset(*args, **kwargs)
+                self._scene_index = scene
                 scene = self._scene.redirect()
+                if scene is not None:
+                    self._cache_scene(self._scene_index, self._scene)
+            # Only trimmed now, so that the scene being switched to didn't count towards the limit
+            while len(self._scene_cache) > SCENE_CACHE_SIZE:
+                self._scene_cache.pop()
             self._scene._fadein()
             self._battle_fader.reset()
             print("scene start")
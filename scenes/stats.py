@@ -12,11 +12,16 @@ from events.input import BUTTON_TYPES
 PAGES = 4
 
 class Stats(Scene):
+    cacheable = True
+
     def _set_wobble(self, x):
         self._arrow_wobble = x
 
     def __init__(self, *args, mon: Mon = None, **kwargs):
         super().__init__(*args, **kwargs)
+        self.reset(mon=mon)
+
+    def reset(self, mon: Mon = None):
         self.mon = mon
         self.page = 0
         self._exit = Event()
@@ -0,0 +1,117 @@
+'''
+Packs tools/game_data.py into game/data.py, as bytes the game can decode a move or mon from on demand,
+instead of building every one of them (and their learnsets and effects) when it starts. Run it from the
+repo's root after changing game_data.py, on a computer, not the badge:
+
+    python3 tools/build_data.py
+
+Every move and mon is a fixed size struct record, so finding one is a multiplication. Names and descriptions
+are stored once in STRINGS, and learnsets as (move, level) byte pairs in LEARNSETS.
+'''
+import os
+from struct import calcsize, pack
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# name offset, name length, desc offset, desc length, type, max pp, power, accuracy, effect, special override
+MOVE_FORMAT = '<HBHBBBBBBB'
+# name offset, name length, desc offset, desc length, type1, type2, evolves into, evolve level,
+#  hp, atk, def, spatk, spdef, spd, sprite, weight, catch rate, base exp, learnset offset, learnset length
+MON_FORMAT = '<HBHBBBBB6HBHBHHB'
+
+# Move effects, by their id in a move record. Must match _EFFECTS in game/moves.py.
+EFFECTS = (None, "scratch", "slander", "devour")
+# What's stored for no evolution, and for a sprite that doesn't exist yet ("unknown")
+NONE = 255
+
+
+def _load(path: str) -> dict:
+    scope = {}
+    with open(path) as f:
+        exec(f.read(), scope)
+    return scope
+
+
+class _Strings:
+    def __init__(self):
+        self.data = bytearray()
+        self._seen = {}
+
+    def add(self, text: str):
+        encoded = text.encode()
+        if len(encoded) > 255:
+            raise ValueError(f"Text too long to pack: {text!r}")
+        offset = self._seen.get(encoded)
+        if offset is None:
+            offset = len(self.data)
+            self.data += encoded
+            self._seen[encoded] = offset
+        return offset, len(encoded)
+
+
+def build(source: dict, types: dict) -> dict:
+    strings = _Strings()
+    moves = bytearray()
+    move_ids = {}
+    for move_id, (name, desc, move_type, max_pp, power, accuracy, effect) in enumerate(source["MOVES"]):
+        if name in move_ids:
+            raise ValueError(f"Two moves called {name}")
+        move_ids[name] = move_id
+        moves += pack(MOVE_FORMAT, *strings.add(name), *strings.add(desc), types[move_type], max_pp, power,
+                      accuracy, EFFECTS.index(effect), 0)
+
+    mon_ids = {mon["name"]: mon_id for mon_id, mon in enumerate(source["MONS"])}
+    mons = bytearray()
+    learnsets = bytearray()
+    for mon in source["MONS"]:
+        evolve_into, evolve_level = mon.get("evolves", (None, 0))
+        sprite = mon["sprite"]
+        learnset_offset = len(learnsets)
+        for move, level in mon["learnset"]:
+            learnsets += pack('BB', move_ids[move], level)
+        mons += pack(MON_FORMAT, *strings.add(mon["name"]), *strings.add(mon["desc"]),
+                     types[mon["types"][0]], types[mon["types"][1]],
+                     NONE if evolve_into is None else mon_ids[evolve_into], evolve_level,
+                     *mon["stats"], NONE if sprite == "unknown" else sprite, mon["weight"],
+                     mon.get("catch_rate", 1), mon.get("base_exp", 150), learnset_offset, len(mon["learnset"]))
+
+    return {"STRINGS": bytes(strings.data), "MOVES": bytes(moves), "MONS": bytes(mons),
+            "LEARNSETS": bytes(learnsets)}
+
+
+def _blob(name: str, data: bytes, width: int = 32) -> str:
+    lines = [f"{name} = ("]
+    for i in range(0, len(data), width):
+        lines.append(f"    {bytes(data[i:i + width])!r}")
+    lines.append(")")
+    return "\n".join(lines)
+
+
+def main():
+    source = _load(os.path.join(ROOT, "tools", "game_data.py"))
+    constants = _load(os.path.join(ROOT, "game", "constants.py"))
+    types = {k: v for k, v in vars(constants["MonType"]).items() if not k.startswith("_")}
+    tables = build(source, types)
+
+    out = [
+        "'''",
+        "Every move and mon, packed by tools/build_data.py from tools/game_data.py. Don't edit this, edit that and",
+        " run the build again. Decoded by game/moves.py and game/mons.py.",
+        "'''",
+        "",
+        f"MOVE_FORMAT = {MOVE_FORMAT!r}",
+        f"MON_FORMAT = {MON_FORMAT!r}",
+        "",
+    ]
+    for name in ("STRINGS", "MOVES", "MONS", "LEARNSETS"):
+        out.append(_blob(name, tables[name]))
+        out.append("")
+    with open(os.path.join(ROOT, "game", "data.py"), "w") as f:
+        f.write("\n".join(out))
+    print(f"{len(source['MOVES'])} moves ({calcsize(MOVE_FORMAT)} bytes each), "
+          f"{len(source['MONS'])} mons ({calcsize(MON_FORMAT)} bytes each), "
+          f"{len(tables['STRINGS'])} bytes of text, {len(tables['LEARNSETS'])} bytes of learnsets")
+
+
+if __name__ == "__main__":
+    main()
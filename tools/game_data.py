@@ -0,0 +1,619 @@
+"""
+The source for every move and mon in the game. Nothing on the badge reads this: tools/build_data.py packs it into
+ game/data.py, which the game decodes from as it needs things. Edit this, then run
+
+    python3 tools/build_data.py
+
+Types are the names in game/constants.py MonType, and moves are referred to by name.
+"""
+
+# name, description, type, max pp, power, accuracy, effect (see EFFECTS in build_data.py)
+MOVES = [
+    ('Scratch', 'Scratches opponent', 'NORMAL', 35, 40, 100, 'scratch'),
+    ('Tackle', 'A crude body slam.', 'NORMAL', 35, 40, 100, None),
+    ('Bite', 'The user bites the opponent.', 'NORMAL', 35, 40, 100, None),
+    ('Slap', "A quick slap to the opponent's face.", 'NORMAL', 35, 40, 100, None),
+    ('PleadingFace', 'The user looks pathetically at the opponent, reducing their ATK and SpATK.', 'NORMAL', 35, 40, 100, None),
+    ('Scowl', 'The user fixes a withering scowl at the opponent, sharply reducing their DEF.', 'NORMAL', 35, 40, 100, None),
+    ('Think', 'The user ponders deeply, gaining an increase to SpATK and SpDEF.', 'NORMAL', 35, 40, 100, None),
+    ('PsychUp', 'The user repeats some words of self-encouragement, gaining an increase to ATK and SpATK.', 'FIGHTING', 35, 40, 100, None),
+    ('free()', 'Deallocates the space previously allocated to the opponent', 'BUG', 35, 40, 100, None),
+    ('StackSmash', "Writes a 'normal amount of data' to the opponent's stack.", 'BUG', 35, 40, 100, None),
+    ('SQLInject', "Writes a 'normal' string to the opponent's database';DROP TABLE HP", 'BUG', 35, 40, 100, None),
+    ('WetFish', 'The opponent is hit across the face with a wet fish', 'WATER', 35, 40, 100, None),
+    ('ScathingInsult', "Make a witty remark about the opponent's mother.", 'NORMAL', 35, 40, 100, None),
+    ('Pandemic', 'Cancels opponent due to pandemic restrictions', 'GHOST', 35, 40, 100, None),
+    ('TorrentialRain', 'Maybe if the opponent had pitched at the top of the hill they would still be fine right now', 'WATER', 35, 40, 100, None),
+    ('ICBM', 'This feels self explanatory.', 'NORMAL', 35, 40, 100, None),
+    ('Mallet', 'Hits opponent with comically large mallet', 'FIGHTING', 35, 40, 100, None),
+    ('Rework', 'Rework the opponent into a stylish broach', 'STEEL', 35, 40, 100, None),
+    ('Slander', 'Run a smear campain against the opponent in the local newspaper.', 'NORMAL', 35, 40, 100, 'slander'),
+    ('Nose!', "Get your opponent's nose.", 'NORMAL', 35, 40, 100, None),
+    ('DangerHug', 'Gives opponent a (deadly) hug.', 'NORMAL', 35, 40, 100, None),
+    ('PinchCheeks', "Pinch the opponent's cheeks and tell them how much they've grown.", 'NORMAL', 35, 40, 100, None),
+    ('MailFraud', 'All items applied to the opponent for 2 turns will be appllied to you instead.', 'NORMAL', 35, 40, 100, None),
+    ('Intoxicate', 'Gets opponent drunk.', 'POISON', 35, 40, 100, None),
+    ('Irrationalise', 'Use advanced mathematics to prove that the opponent is irrational, and therefore not representable as a fraction.', 'PSYCHIC', 35, 40, 100, None),
+    ('Rawr', 'OwO? *nuzzles opponent*', 'DRAGON', 35, 40, 100, None),
+    ('Uppercut', 'Pow! Blam! Wham! Slap! Ka-pow!', 'FIGHTING', 35, 40, 100, None),
+    ('Disassemble', 'Disassembles the opponent to look for vulnerabilities.', 'DRAGON', 35, 40, 100, None),
+    ('Arson', 'Did you know that the opponent is flammable?', 'FIRE', 35, 40, 100, None),
+    ('Tazer', 'The power of the sun in the palm of your hand.', 'ELECTRIC', 35, 40, 100, None),
+    ('FlamingSword', 'Its cool factor more than makes up for its impractibility.', 'FIRE', 35, 40, 100, None),
+    ('Duel', 'Challenge opponent to pistol duel', 'DARK', 35, 40, 100, None),
+    ('FP16', 'Cast the opponent to a smaller data type, making them less accurate.', 'BUG', 35, 40, 100, None),
+    ('ShakeHands', 'Shake hands with the opponent and recover 50% HP each.', 'NORMAL', 35, 40, 100, None),
+    ('OOOooOOoO!', 'Spook opponent', 'GHOST', 35, 40, 100, None),
+    ('Overvolt', "Send more than the rated voltage to the opponent's VCC pin.", 'ELECTRIC', 35, 40, 100, None),
+    ('Drain', "Reduce the opponent's voltage potential.", 'GROUND', 35, 40, 100, None),
+    ('DodgyCurry', 'Serve the opponent a dodgy curry.', 'POISON', 35, 40, 100, None),
+    ('Bury', 'Covers opponent in a layer of dirt', 'GROUND', 35, 40, 100, None),
+    ('FancyLighting', 'Blind opponent using dope ass lightshow', 'GHOST', 35, 40, 100, None),
+    ('WTF?', "Shows the opponent the 'WTF?' talk.", 'PSYCHIC', 35, 40, 100, None),
+    ('FineMist', 'Gives opponent a light misting.', 'WATER', 35, 40, 100, None),
+    ('UnexpectedBill', 'Gives opponent a large shock.', 'ELECTRIC', 35, 40, 100, None),
+    ('Devour', 'Attempt to eat opponent. You cannot eat Rinoa.', 'NORMAL', 35, 40, 100, 'devour'),
+    ('DadJoke', 'Tell a dad joke to the opponent, who cringes so hard they deal themselves damage.', 'PSYCHIC', 35, 40, 100, None),
+]
+
+# Stats are hp, atk, def, spatk, spdef, spd. The learnset is (move, level), from low to high.
+# weight is how likely the mon is to turn up in the wild, against every other mon.
+# Optional: evolves (into, at level), catch_rate (default 1, higher is easier) and base_exp (default 150).
+MONS = [
+    dict(
+        name='EMF Duck', desc='Can quack louder than a jet engine',
+        types=('WATER', 'NO_TYPE'),
+        stats=(50, 40, 40, 65, 60, 35),
+        learnset=[
+            ('Tackle', 5),
+            ('Bite', 5),
+            ('WetFish', 8),
+            ('Mallet', 13),
+            ('TorrentialRain', 21),
+            ('Slander', 30),
+            ('FineMist', 40),
+        ],
+        sprite=1, weight=100,
+        evolves=('EMF Goose', 15),
+    ),
+    dict(
+        name='EMF Goose', desc="It's a peaceful day in the Maths Village, and you are a horrible goose",
+        types=('WATER', 'FIGHTING'),
+        stats=(80, 100, 65, 90, 65, 90),
+        learnset=[
+            ('Tackle', 5),
+            ('Bite', 5),
+            ('WetFish', 8),
+            ('Mallet', 13),
+            ('TorrentialRain', 21),
+            ('Slander', 30),
+            ('FineMist', 40),
+        ],
+        sprite=2, weight=4,
+    ),
+    dict(
+        name='Bit Warden', desc='Their powerful shield is self-hosted',
+        types=('PSYCHIC', 'NO_TYPE'),
+        stats=(70, 70, 70, 40, 40, 25),
+        learnset=[
+            ('Scratch', 5),
+            ('Tackle', 5),
+            ('Irrationalise', 8),
+            ('Slander', 13),
+            ('DangerHug', 21),
+            ('WTF?', 30),
+            ('DadJoke', 40),
+        ],
+        sprite=3, weight=100,
+        evolves=('Install Wizard', 20),
+    ),
+    dict(
+        name='Install Wizard', desc="He's actually paid for WinRAR",
+        types=('PSYCHIC', 'NO_TYPE'),
+        stats=(75, 75, 75, 100, 100, 30),
+        learnset=[
+            ('Scratch', 5),
+            ('Tackle', 5),
+            ('Irrationalise', 8),
+            ('Slander', 13),
+            ('DangerHug', 21),
+            ('WTF?', 30),
+            ('DadJoke', 40),
+        ],
+        sprite=4, weight=4,
+    ),
+    dict(
+        name='Blacksmith', desc="Has a lot of coke. don't ask",
+        types=('FIRE', 'NO_TYPE'),
+        stats=(60, 90, 70, 20, 20, 60),
+        learnset=[
+            ('Slap', 5),
+            ('ScathingInsult', 5),
+            ('Arson', 8),
+            ('FlamingSword', 13),
+            ('Rework', 21),
+            ('Uppercut', 30),
+            ('Nose!', 40),
+        ],
+        sprite=5, weight=100,
+        evolves=('Blacksmite', 17),
+    ),
+    dict(
+        name='Blacksmite', desc='This is the last time you misuse an anvil in minecraft',
+        types=('FIRE', 'STEEL'),
+        stats=(75, 100, 100, 70, 70, 60),
+        learnset=[
+            ('Slap', 5),
+            ('ScathingInsult', 5),
+            ('Arson', 8),
+            ('FlamingSword', 13),
+            ('Rework', 21),
+            ('Uppercut', 30),
+            ('Nose!', 40),
+        ],
+        sprite=6, weight=4,
+    ),
+    dict(
+        name='Radio Wave', desc='FM modulated!',
+        types=('WATER', 'NO_TYPE'),
+        stats=(40, 60, 45, 60, 45, 120),
+        learnset=[
+            ('Slander', 5),
+            ('Slap', 5),
+            ('TorrentialRain', 8),
+            ('FineMist', 13),
+            ('TorrentialRain', 21),
+            ('ICBM', 30),
+            ('ScathingInsult', 40),
+        ],
+        sprite=7, weight=70,
+        evolves=('Radio Tsunami', 18),
+    ),
+    dict(
+        name='Radio Tsunami', desc='Someone left the microwave running again',
+        types=('WATER', 'WATER'),
+        stats=(50, 75, 50, 75, 50, 150),
+        learnset=[
+            ('Slander', 5),
+            ('Slap', 5),
+            ('TorrentialRain', 8),
+            ('FineMist', 13),
+            ('TorrentialRain', 21),
+            ('ICBM', 30),
+            ('ScathingInsult', 40),
+        ],
+        sprite=8, weight=4,
+    ),
+    dict(
+        name='Pirate', desc='True pirates seed',
+        types=('DARK', 'NO_TYPE'),
+        stats=(70, 80, 75, 25, 25, 50),
+        learnset=[
+            ('WetFish', 5),
+            ('Tackle', 5),
+            ('Uppercut', 8),
+            ('Bite', 13),
+            ('Duel', 21),
+            ('ICBM', 30),
+            ('DangerHug', 40),
+        ],
+        sprite='unknown', weight=80,
+        evolves=('Swashbuckler', 19),
+    ),
+    dict(
+        name='Swashbuckler', desc='Has never paid for a copy of Photoshop',
+        types=('DARK', 'NO_TYPE'),
+        stats=(75, 115, 90, 35, 35, 70),
+        learnset=[
+            ('WetFish', 5),
+            ('Tackle', 5),
+            ('Uppercut', 8),
+            ('Bite', 13),
+            ('Duel', 21),
+            ('ICBM', 30),
+            ('DangerHug', 40),
+        ],
+        sprite='unknown', weight=4,
+    ),
+    dict(
+        name='Furry', desc='Will nya for headpats',
+        types=('DRAGON', 'NO_TYPE'),
+        stats=(75, 35, 25, 80, 80, 20),
+        learnset=[
+            ('Rawr', 5),
+            ('Scratch', 5),
+            ('Tackle', 8),
+            ('Slander', 13),
+            ('Bite', 21),
+            ('Slap', 30),
+            ('ICBM', 40),
+        ],
+        sprite='unknown', weight=80,
+        evolves=('Furry artist', 16),
+    ),
+    dict(
+        name='Furry artist', desc="They're overworked, but damn are they not loaded",
+        types=('DRAGON', 'NO_TYPE'),
+        stats=(90, 45, 50, 110, 100, 25),
+        learnset=[
+            ('Rawr', 5),
+            ('Scratch', 5),
+            ('Tackle', 8),
+            ('Slander', 13),
+            ('Bite', 21),
+            ('Slap', 30),
+            ('ICBM', 40),
+        ],
+        sprite='unknown', weight=8,
+    ),
+    dict(
+        name='Maths PhD', desc="They've written a thesis on how many hyperplanes you can fit in a non-euclidean sphere or something",
+        types=('NORMAL', 'NO_TYPE'),
+        stats=(40, 30, 30, 75, 80, 40),
+        learnset=[
+            ('Bite', 5),
+            ('Scratch', 5),
+            ('Tackle', 8),
+            ('Scratch', 13),
+            ('Slander', 21),
+            ('OOOooOOoO!', 30),
+            ('UnexpectedBill', 40),
+        ],
+        sprite='unknown', weight=90,
+        evolves=('Maths Burnout', 16),
+    ),
+    dict(
+        name='Maths Burnout', desc='Whoops',
+        types=('GHOST', 'NO_TYPE'),
+        stats=(60, 40, 40, 140, 100, 50),
+        learnset=[
+            ('Bite', 5),
+            ('Scratch', 5),
+            ('Tackle', 8),
+            ('Scratch', 13),
+            ('Slander', 21),
+            ('OOOooOOoO!', 30),
+            ('UnexpectedBill', 40),
+        ],
+        sprite='unknown', weight=4,
+    ),
+    dict(
+        name='StaticShock', desc='Kinda spicy tbh',
+        types=('ELECTRIC', 'NO_TYPE'),
+        stats=(15, 10, 10, 100, 30, 100),
+        learnset=[
+            ('Scratch', 5),
+            ('Tackle', 5),
+            ('Tazer', 8),
+            ('Overvolt', 13),
+            ('Slander', 21),
+            ('PinchCheeks', 30),
+            ('UnexpectedBill', 40),
+        ],
+        sprite='unknown', weight=80,
+        evolves=('Electrocution', 20),
+    ),
+    dict(
+        name='Electrocution', desc='Too spicy tbh',
+        types=('ELECTRIC', 'FIGHTING'),
+        stats=(25, 25, 25, 160, 50, 180),
+        learnset=[
+            ('Scratch', 5),
+            ('Tackle', 5),
+            ('Tazer', 8),
+            ('Overvolt', 13),
+            ('Slander', 21),
+            ('PinchCheeks', 30),
+            ('UnexpectedBill', 40),
+        ],
+        sprite='unknown', weight=4,
+    ),
+    dict(
+        name='LAZERS', desc='LAZERSLAZERSLAZERS',
+        types=('GHOST', 'ELECTRIC'),
+        stats=(20, 40, 30, 80, 50, 120),
+        learnset=[
+            ('FancyLighting', 5),
+            ('Tazer', 5),
+            ('Slander', 8),
+            ('UnexpectedBill', 13),
+            ('Pandemic', 21),
+            ('Scratch', 30),
+            ('OOOooOOoO!', 40),
+        ],
+        sprite='unknown', weight=70,
+        evolves=('LAAAZEERRRSS', 15),
+    ),
+    dict(
+        name='LAAAZEERRRSS', desc='LAAAAAAZZZZZEEE EEEEERRRRRSS',
+        types=('GHOST', 'ELECTRIC'),
+        stats=(50, 60, 40, 100, 70, 140),
+        learnset=[
+            ('FancyLighting', 5),
+            ('Tazer', 5),
+            ('Slander', 8),
+            ('UnexpectedBill', 13),
+            ('Pandemic', 21),
+            ('Scratch', 30),
+            ('OOOooOOoO!', 40),
+        ],
+        sprite='unknown', weight=4,
+    ),
+    dict(
+        name='Pint', desc='Quite stout',
+        types=('POISON', 'NO_TYPE'),
+        stats=(90, 70, 60, 25, 20, 40),
+        learnset=[
+            ('Intoxicate', 5),
+            ('WetFish', 5),
+            ('Scratch', 8),
+            ('Tackle', 13),
+            ('DodgyCurry', 21),
+            ('Nose!', 30),
+            ('Slander', 40),
+        ],
+        sprite='unknown', weight=100,
+        evolves=('Keg', 18),
+    ),
+    dict(
+        name='Keg', desc='Finely aged',
+        types=('POISON', 'NO_TYPE'),
+        stats=(125, 110, 100, 50, 40, 40),
+        learnset=[
+            ('Intoxicate', 5),
+            ('WetFish', 5),
+            ('Scratch', 8),
+            ('Tackle', 13),
+            ('DodgyCurry', 21),
+            ('Nose!', 30),
+            ('Slander', 40),
+        ],
+        sprite='unknown', weight=4,
+    ),
+    dict(
+        name='AntiStatic', desc='Makes your body less spicy',
+        types=('GROUND', 'NO_TYPE'),
+        stats=(100, 55, 90, 40, 100, 25),
+        learnset=[
+            ('Scratch', 5),
+            ('Slap', 5),
+            ('ScathingInsult', 8),
+            ('Drain', 13),
+            ('Nose!', 21),
+            ('Bury', 30),
+            ('Bite', 40),
+        ],
+        sprite='unknown', weight=60,
+    ),
+    dict(
+        name='Multimeter', desc='Knows how many amps are being drawn',
+        types=('ELECTRIC', 'NO_TYPE'),
+        stats=(60, 55, 65, 55, 60, 40),
+        learnset=[
+            ('Scratch', 5),
+            ('Tazer', 5),
+            ('Overvolt', 8),
+            ('Slander', 13),
+            ('Bite', 21),
+            ('WTF?', 30),
+            ('DadJoke', 40),
+        ],
+        sprite='unknown', weight=80,
+        evolves=('Omnimeter', 23),
+    ),
+    dict(
+        name='Omnimeter', desc='Knows the answers to the universe',
+        types=('ELECTRIC', 'PSYCHIC'),
+        stats=(80, 80, 90, 90, 80, 75),
+        learnset=[
+            ('Scratch', 5),
+            ('Tazer', 5),
+            ('Overvolt', 8),
+            ('Slander', 13),
+            ('Bite', 21),
+            ('WTF?', 30),
+            ('DadJoke', 40),
+        ],
+        sprite='unknown', weight=4,
+    ),
+    dict(
+        name='Firepit', desc='Keeps your hands warm - but watch out!',
+        types=('FIRE', 'GROUND'),
+        stats=(30, 75, 25, 75, 30, 80),
+        learnset=[
+            ('Bury', 5),
+            ('FlamingSword', 5),
+            ('Slander', 8),
+            ('Arson', 13),
+            ('FlamingSword', 21),
+            ('ScathingInsult', 30),
+            ('Scratch', 40),
+        ],
+        sprite='unknown', weight=90,
+        evolves=('Firenado', 19),
+    ),
+    dict(
+        name='Firenado', desc='Fire makes everything better',
+        types=('FIRE', 'FIRE'),
+        stats=(50, 100, 40, 110, 40, 130),
+        learnset=[
+            ('Bury', 5),
+            ('FlamingSword', 5),
+            ('Slander', 8),
+            ('Arson', 13),
+            ('FlamingSword', 21),
+            ('ScathingInsult', 30),
+            ('Scratch', 40),
+        ],
+        sprite='unknown', weight=4,
+    ),
+    dict(
+        name='Ghidra', desc="There's a lingering feeling that they're a cop but it's probably fine",
+        types=('DRAGON', 'NO_TYPE'),
+        stats=(60, 100, 80, 50, 110, 10),
+        learnset=[
+            ('Rawr', 5),
+            ('Scratch', 5),
+            ('Tackle', 8),
+            ('Bite', 13),
+            ('Disassemble', 21),
+            ('ICBM', 30),
+            ('Devour', 40),
+        ],
+        sprite='unknown', weight=50,
+    ),
+    dict(
+        name='EMF 2020', desc='Faint whispers of festivals past',
+        types=('GHOST', 'NO_TYPE'),
+        stats=(50, 90, 90, 90, 90, 20),
+        learnset=[
+            ('Scratch', 5),
+            ('OOOooOOoO!', 5),
+            ('FancyLighting', 8),
+            ('Pandemic', 13),
+            ('Slander', 21),
+            ('Nose!', 30),
+            ('Slap', 40),
+        ],
+        sprite='unknown', weight=20,
+    ),
+    dict(
+        name='smolhaj', desc='Just a lil guy',
+        types=('WATER', 'NO_TYPE'),
+        stats=(15, 15, 25, 20, 40, 20),
+        learnset=[
+            ('WetFish', 5),
+            ('Scratch', 5),
+            ('TorrentialRain', 8),
+            ('FineMist', 13),
+            ('Slander', 21),
+            ('DangerHug', 30),
+            ('FineMist', 40),
+        ],
+        sprite=9, weight=70,
+        evolves=('blahaj', 17),
+    ),
+    dict(
+        name='blahaj', desc='Does 2x damage to transphobes',
+        types=('WATER', 'NO_TYPE'),
+        stats=(110, 160, 80, 140, 60, 90),
+        learnset=[
+            ('WetFish', 5),
+            ('Scratch', 5),
+            ('TorrentialRain', 8),
+            ('FineMist', 13),
+            ('Slander', 21),
+            ('DangerHug', 30),
+            ('FineMist', 40),
+        ],
+        sprite=10, weight=4,
+    ),
+    dict(
+        name='Tetris', desc='Is often seen hiding in the arcade',
+        types=('NORMAL', 'NO_TYPE'),
+        stats=(200, 120, 100, 60, 120, 60),
+        learnset=[
+            ('Scratch', 5),
+            ('Tackle', 5),
+            ('Bite', 8),
+            ('Slap', 13),
+            ('ICBM', 21),
+            ('PinchCheeks', 30),
+            ('Devour', 40),
+        ],
+        sprite=0, weight=20,
+    ),
+    dict(
+        name='Mew', desc='Was found hiding under a van in null sector',
+        types=('PSYCHIC', 'NO_TYPE'),
+        stats=(100, 100, 100, 100, 100, 100),
+        learnset=[
+            ('WTF?', 5),
+            ('DadJoke', 5),
+            ('Bite', 8),
+            ('Slap', 13),
+            ('Irrationalise', 21),
+            ('Slander', 30),
+            ('Nose!', 40),
+        ],
+        sprite='unknown', weight=4,
+    ),
+    dict(
+        name='NaN', desc='They will absorb your vision into their consiousness',
+        types=('POISON', 'BUG'),
+        stats=(10, 156, 42, 11, 69, 12),
+        learnset=[
+            ('Intoxicate', 5),
+            ('free()', 5),
+            ('StackSmash', 8),
+            ('SQLInject', 13),
+            ('Intoxicate', 21),
+            ('FP16', 30),
+            ('Devour', 40),
+        ],
+        sprite='unknown', weight=50,
+        evolves=('NullPointer', 25),
+    ),
+    dict(
+        name='NullPointer', desc='You follow the signs, but they point at the abyss. Your journey has been meaningless',
+        types=('POISON', 'BUG'),
+        stats=(70, 117, 77, 21, 127, 13),
+        learnset=[
+            ('Intoxicate', 5),
+            ('free()', 5),
+            ('StackSmash', 8),
+            ('SQLInject', 13),
+            ('Intoxicate', 21),
+            ('FP16', 30),
+            ('Devour', 40),
+        ],
+        sprite='unknown', weight=20,
+        evolves=('MISSINGNO.', 39),
+    ),
+    dict(
+        name='MISSINGNO.', desc='The shoreline is awash with the screams of those that should not exist',
+        types=('POISON', 'BUG'),
+        stats=(15, 287, 87, 137, 13, 11),
+        learnset=[
+            ('Intoxicate', 5),
+            ('free()', 5),
+            ('StackSmash', 8),
+            ('SQLInject', 13),
+            ('Intoxicate', 21),
+            ('FP16', 30),
+            ('Devour', 40),
+        ],
+        sprite='unknown', weight=10,
+    ),
+    dict(
+        name='Div. Zero', desc='These axioms are too feeble to describe the knowledge of the gods',
+        types=('BUG', 'NO_TYPE'),
+        stats=(70, 110, 0, 110, 0, 0),
+        learnset=[
+            ('FP16', 5),
+            ('StackSmash', 5),
+            ('SQLInject', 8),
+            ('free()', 13),
+            ('Nose!', 21),
+            ('Slander', 30),
+            ('Devour', 40),
+        ],
+        sprite='unknown', weight=40,
+        evolves=('Out.Memory', 27),
+    ),
+    dict(
+        name='Out.Memory', desc='Your head is full, but it is set to burst. Everything fades',
+        types=('BUG', 'NO_TYPE'),
+        stats=(90, 111, 111, 111, 111, 44),
+        learnset=[
+            ('FP16', 5),
+            ('StackSmash', 5),
+            ('SQLInject', 8),
+            ('free()', 13),
+            ('Nose!', 21),
+            ('Slander', 30),
+            ('Devour', 40),
+        ],
+        sprite='unknown', weight=10,
+    ),
+]
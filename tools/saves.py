@@ -0,0 +1,302 @@
+'''
+Reads, checks and converts save files (sav.dat) in bulk, on a computer. Every file goes through the game's own
+GameContext.load/serialise, schemas and upgrades, so what this accepts is exactly what a badge accepts.
+
+The game imports the badge's firmware modules (ctx, app, app_components...), so run this with the same fakes the
+desktop simulator uses on the path, e.g.
+
+    PYTHONPATH=path/to/badge-2024-software/sim/fakes python3 tools/saves.py validate saves/
+
+Commands (files can be given directly or as directories, which are searched for *.dat or *.json):
+
+    validate SAVES...          Checks each save loads and writes back the same. Exits 1 if any don't.
+    dump SAVES... [-o DIR]     Writes each save as JSON, to DIR or as one line each on stdout.
+    encode JSONS... -o DIR     Turns JSON (as dumped) back into saves.
+    migrate SAVES... -o DIR    Brings saves up to the current version.
+    stats SAVES...             Collection stats across all the saves, e.g. from everyone's badge at an event.
+
+Files are handled by a pool of processes (-j, one per CPU by default), in order, as they're found.
+'''
+import argparse
+import json
+import os
+import sys
+from importlib import import_module
+from multiprocessing import Pool
+from struct import unpack_from
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = os.path.basename(ROOT)
+
+# The game's modules, imported into each worker by _init_worker
+_game = {}
+
+
+def _init_worker():
+    sys.path.insert(0, os.path.dirname(ROOT))
+    # The game prints as it deserialises, which would get mixed into the output
+    sys.stdout = open(os.devnull, "w")
+    for name in ("game_context", "mons", "moves", "items", "player", "badgedex", "customisation"):
+        _game[name] = import_module(f"{PACKAGE}.game.{name}")
+
+
+def _load(data: bytes):
+    '''
+    :return: The save's version before upgrading, and the GameContext.
+    '''
+    game_context = _game["game_context"]
+    context = game_context.GameContext.load(data)
+    # Read with the game's own header format (load has already checked there's a whole header)
+    version = unpack_from(game_context._HEADER_FMT, data, 0)[1]
+    return version, context
+
+
+def _mon_to_json(mon) -> dict:
+    return {
+        "nickname": mon.nickname, "template": mon.template.id, "species": mon.template.name,
+        "level": mon.level, "xp": mon.xp, "hp": mon.hp, "fainted": mon.fainted, "status": mon.status,
+        "ivs": mon.ivs, "evs": mon.evs, "accuracy": mon.accuracy, "evasion": mon.evasion,
+        "moves": [{"id": move.id, "name": move.name, "pp": pp} for move, pp in zip(mon.moves, mon.pp)],
+    }
+
+
+def _mon_from_json(d: dict):
+    mons = _game["mons"]
+    moves = [mons.moves.moves_list[m["id"]] for m in d["moves"]]
+    mon = mons.Mon(mons.mons_list[d["template"]], d["level"], d["ivs"], d["evs"], moves,
+                   pp=[m["pp"] for m in d["moves"]], hp=d["hp"])
+    mon.set_nickname(d["nickname"])
+    mon.fainted = d["fainted"]
+    mon.status = d["status"]
+    mon.accuracy = d["accuracy"]
+    mon.evasion = d["evasion"]
+    mon.xp = d["xp"]
+    return mon
+
+
+def _seen(bdex) -> list:
+    return [i for i in range(len(_game["mons"].mons_list)) if bdex.seen(i)]
+
+
+def _caught(bdex) -> list:
+    return [i for i in range(len(_game["mons"].mons_list)) if bdex.caught(i)]
+
+
+def to_json(context) -> dict:
+    player = context.player
+    return {
+        "version": _game["game_context"].VERSION,
+        "player": {
+            "name": player.name, "money": player.money, "last_heal": player.last_heal,
+            "badgemon": [_mon_to_json(mon) for mon in player.badgemon],
+            "case": [_mon_to_json(mon) for mon in player.badgemon_case],
+            "inventory": [{"id": item.id, "name": item.name, "count": count}
+                          for item, count in player.inventory.items()],
+            "badgedex": {"seen": _seen(player.badgedex), "caught": _caught(player.badgedex)},
+        },
+        "random_encounters": bool(context.random_encounters),
+        "custom": {"background": context.custom.background_col, "foreground": context.custom.foreground_col,
+                   "pattern": context.custom.pattern},
+    }
+
+
+def from_json(d: dict):
+    p = d["player"]
+    bdex = _game["badgedex"].Badgedex()
+    for i in p["badgedex"]["seen"]:
+        bdex.see(i)
+    for i in p["badgedex"]["caught"]:
+        bdex.find(i)
+    items = _game["items"].items_list
+    inventory = {items[entry["id"]]: entry["count"] for entry in p["inventory"]}
+    context = _game["game_context"].GameContext()
+    context.player = _game["player"].Player(
+        p["name"], [_mon_from_json(m) for m in p["badgemon"]], [_mon_from_json(m) for m in p["case"]],
+        inventory, p["last_heal"], p["money"], bdex)
+    context.random_encounters = d["random_encounters"]
+    custom = _game["customisation"].Customisation()
+    custom.background_col = d["custom"]["background"]
+    custom.foreground_col = d["custom"]["foreground"]
+    custom.pattern = d["custom"]["pattern"]
+    context.custom = custom
+    return context
+
+
+def _read(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _write(path: str, data):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w" if isinstance(data, str) else "wb") as f:
+        f.write(data)
+
+
+def _validate(job):
+    path, _ = job
+    try:
+        data = _read(path)
+        version, context = _load(data)
+        # Only a save that was already current has to come back byte for byte
+        if version == _game["game_context"].VERSION and bytes(context.serialise()) != data:
+            return path, False, "doesn't write back the same"
+        return path, True, f"version {version}, {len(context.player.badgemon)} in party, " \
+                           f"{len(context.player.badgemon_case)} in case"
+    except Exception as e:
+        return path, False, f"{type(e).__name__}: {e}"
+
+
+def _dump(job):
+    path, out = job
+    try:
+        _, context = _load(_read(path))
+        text = json.dumps(to_json(context))
+        if out is None:
+            return path, True, text
+        _write(out, text)
+        return path, True, out
+    except Exception as e:
+        return path, False, f"{type(e).__name__}: {e}"
+
+
+def _encode(job):
+    path, out = job
+    try:
+        with open(path) as f:
+            context = from_json(json.load(f))
+        _write(out, bytes(context.serialise()))
+        return path, True, out
+    except Exception as e:
+        return path, False, f"{type(e).__name__}: {e}"
+
+
+def _migrate(job):
+    path, out = job
+    try:
+        version, context = _load(_read(path))
+        _write(out, bytes(context.serialise()))
+        return path, True, f"version {version} -> {_game['game_context'].VERSION}, {out}"
+    except Exception as e:
+        return path, False, f"{type(e).__name__}: {e}"
+
+
+def _stats(job):
+    path, _ = job
+    try:
+        _, context = _load(_read(path))
+        player = context.player
+        mons = player.badgemon + player.badgemon_case
+        return path, True, {
+            "seen": _seen(player.badgedex),
+            "caught": _caught(player.badgedex),
+            "owned": [mon.template.id for mon in mons],
+            "levels": [mon.level for mon in mons],
+            "money": player.money,
+        }
+    except Exception as e:
+        return path, False, f"{type(e).__name__}: {e}"
+
+
+def _find(paths, extension: str):
+    '''
+    Every file in paths, searching directories, as (path, path relative to what was given).
+    '''
+    for path in paths:
+        if os.path.isdir(path):
+            for directory, _, names in os.walk(path):
+                for name in sorted(names):
+                    if name.endswith(extension):
+                        full = os.path.join(directory, name)
+                        yield full, os.path.relpath(full, path)
+        else:
+            yield path, os.path.basename(path)
+
+
+def _jobs(paths, extension: str, out_dir, out_extension):
+    for path, relative in _find(paths, extension):
+        if out_dir is None:
+            yield path, None
+        else:
+            yield path, os.path.join(out_dir, os.path.splitext(relative)[0] + out_extension)
+
+
+def _print_stats(results):
+    players = 0
+    seen = {}
+    caught = {}
+    owned = {}
+    levels = []
+    money = 0
+    for stats in results:
+        players += 1
+        for i in stats["seen"]:
+            seen[i] = seen.get(i, 0) + 1
+        for i in stats["caught"]:
+            caught[i] = caught.get(i, 0) + 1
+        for i in set(stats["owned"]):
+            owned[i] = owned.get(i, 0) + 1
+        levels += stats["levels"]
+        money += stats["money"]
+    if not players:
+        print("No saves")
+        return
+    mons_list = _game["mons"].mons_list
+    dex = [len(stats["caught"]) for stats in results]
+    print(f"{players} players, badgedex {sum(dex) / players:.1f}/{len(mons_list)} on average "
+          f"({min(dex)} to {max(dex)}), {money // players} monies on average")
+    if levels:
+        print(f"{len(levels)} mons, level {sum(levels) / len(levels):.1f} on average, {max(levels)} at most")
+    print(f"{'id':>3} {'name':<20} {'seen':>6} {'caught':>6} {'owned':>6}")
+    for i in range(len(mons_list)):
+        print(f"{i:>3} {mons_list[i].name:<20} {seen.get(i, 0):>6} {caught.get(i, 0):>6} {owned.get(i, 0):>6}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Check and convert Badgemon save files.")
+    parser.add_argument("command", choices=("validate", "dump", "encode", "migrate", "stats"))
+    parser.add_argument("paths", nargs="+")
+    parser.add_argument("-o", "--out", help="Directory to write to, keeping the layout of the input")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Worker processes (default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    if args.command in ("encode", "migrate") and args.out is None:
+        parser.error(f"{args.command} needs -o")
+    work = {
+        "validate": (_validate, ".dat", None),
+        "dump": (_dump, ".dat", ".json"),
+        "encode": (_encode, ".json", ".dat"),
+        "migrate": (_migrate, ".dat", ".dat"),
+        "stats": (_stats, ".dat", None),
+    }
+    worker, extension, out_extension = work[args.command]
+    jobs = _jobs(args.paths, extension, args.out if out_extension else None, out_extension)
+
+    failed = 0
+    stats = []
+    with Pool(args.jobs, _init_worker) as pool:
+        for path, ok, result in pool.imap(worker, jobs, chunksize=8):
+            if not ok:
+                failed += 1
+                print(f"{path}: {result}", file=sys.stderr)
+            elif args.command == "stats":
+                stats.append(result)
+            elif args.command == "dump" and args.out is None:
+                print(result)
+            else:
+                print(f"{path}: {result}")
+        if args.command == "stats":
+            _init_worker_quietly()
+            _print_stats(stats)
+    return 1 if failed else 0
+
+
+def _init_worker_quietly():
+    # _print_stats needs the mon names here too, but stdout has to stay where it is
+    stdout = sys.stdout
+    _init_worker()
+    sys.stdout = stdout
+
+
+if __name__ == "__main__":
+    sys.exit(main())
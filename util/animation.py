@@ -6,6 +6,9 @@ if _sys_implementation.name != "micropython":
     from typing import List, Tuple
 
 class Animation:
+    # A dropped frame would show while this plays (e.g. a fade), so the GC waits for it, see util/gc_scheduler.py
+    critical = False
+
     def __init__(self, length: int=1000, infinite=False) -> None:
         assert(length >= 0)
         self._next: List["Animation"] = []
@@ -201,15 +204,69 @@ class AnimationWait(Animation):
 def lerp(start:float=0, end:float=1, time:float=0):
     return (end*time) + (start*(1-time))
 
+TABLE_STEPS = 64
+
+def make_table(fun: callable, steps: int=TABLE_STEPS) -> List[float]:
+    '''
+    Samples fun at steps+1 evenly spaced points between 0 and 1, so the curve can be looked up
+    every frame instead of being recalculated.
+    '''
+    return [fun(i / steps) for i in range(steps + 1)]
+
+def sample(table: List[float], x: float) -> float:
+    '''
+    Looks x up in a table from make_table, linearly interpolating between the two nearest points.
+    x is clamped between 0 and 1.
+    '''
+    if x <= 0:
+        return table[0]
+    last = len(table) - 1
+    if x >= 1:
+        return table[last]
+    x *= last
+    i = int(x)
+    a = table[i]
+    return a + (table[i+1] - a) * (x - i)
+
+# Matches the old "move 20% closer every 10ms" dialog easing, normalised to finish at 1.
+EASE_OUT = make_table(lambda x: (1 - math.pow(0.01, x)) / 0.99)
+
+def _sstep_curve(x: float) -> float:
+    return x * x * (3.0 - 2.0 * x)
+
+def _faster_curve(x: float) -> float:
+    return x * x * 0.5 * (3.0 - x)
+
+def _slower_curve(x: float) -> float:
+    x += 1
+    return (x * x * 0.5 * (3.0 - x)) - 1
+
+SSTEP = make_table(_sstep_curve)
+FASTER = make_table(_faster_curve)
+SLOWER = make_table(_slower_curve)
+# One full turn of sine, so angles are given in turns rather than radians.
+SIN = make_table(lambda x: math.sin(x * math.tau))
+
 def sstep(start:float=0, end:float=1, x:float=0):
-    return lerp(start, end, x * x * (3.0 - 2.0 * x))
+    return lerp(start, end, sample(SSTEP, x))
 
 def faster(start:float=0, end:float=1, x:float=0):
-    return lerp(start, end, x * x * 0.5 * (3.0 - x))
+    return lerp(start, end, sample(FASTER, x))
 
 def slower(start:float=0, end:float=1, x:float=0):
-    x += 1
-    return lerp(start, end, (x * x * 0.5 * (3.0 - x)) - 1)
+    return lerp(start, end, sample(SLOWER, x))
+
+def sin_turns(x: float) -> float:
+    '''
+    Sine of x turns (x*tau radians), from the SIN table.
+    '''
+    return sample(SIN, x % 1.0)
+
+def cos_turns(x: float) -> float:
+    '''
+    Cosine of x turns (x*tau radians), from the SIN table.
+    '''
+    return sample(SIN, (x + 0.25) % 1.0)
 
 def scaled_hash_without_sine(start,end,p):
     return lerp(start,end,hash_without_sine(lerp(start,end*100,p)))
@@ -257,7 +314,7 @@ class AnimSin(AnimCycle):
     Repeats the given animation forever, with a sine-wave like pattern
     '''
     def _fun(self, time: float) -> float:
-        return math.sin(time*math.tau)
+        return sin_turns(time)
 
 class EditorAnim(Animation):
     '''
@@ -365,6 +422,15 @@ class AnimationScheduler:
             local_time = (self._time - start) / anim._length
             anim._update(local_time)
 
+    def critical_running(self) -> bool:
+        '''
+        Whether any animation that's playing is critical.
+        '''
+        for _, anim in self._active:
+            if anim.critical:
+                return True
+        return False
+
     def trigger(self, anim: Animation) -> None:
         '''
         Starts an animation. The animation will be updated every frame if the app is foregrounded.
@@ -389,6 +455,14 @@ class AnimationScheduler:
             index += 1
         self._event_stream.insert(index,(end,anim))
 
+    def cancel(self, anim: Animation) -> None:
+        '''
+        Stops an animation without ending it, so nothing it triggers or ends will run.
+        Used to restart an animation that is already playing.
+        '''
+        self._active[:] = [i for i in self._active if i[1] is not anim]
+        self._event_stream[:] = [i for i in self._event_stream if i[1] is not anim]
+
     def kill_animation(self) -> None:
         '''
         Stops all animations immediately.
@@ -0,0 +1,406 @@
+'''
+Benchmarks for the hot paths. Nothing in the app imports this, run it from the REPL instead, e.g.
+
+    from apps.analogue_stick_badgemon.util import bench
+    bench.curves()
+
+Times are in microseconds for the whole run.
+'''
+import gc
+import math
+
+from ..game import constants
+from ..util import animation
+from ..util import static_random
+from ..util.misc import ticks_us, ticks_diff
+
+def _time(fun, n: int) -> int:
+    start = ticks_us()
+    for i in range(n):
+        fun(i / n)
+    return ticks_diff(ticks_us(), start)
+
+def _max_error(fun, reference, n: int) -> float:
+    worst = 0.0
+    for i in range(n + 1):
+        worst = max(worst, abs(fun(i / n) - reference(i / n)))
+    return worst
+
+def _report(name: str, fun, reference, n: int):
+    print(f"{name}: table {_time(fun, n)}us, maths {_time(reference, n)}us, max error {_max_error(fun, reference, n)}")
+
+def curves(n: int=1000):
+    '''
+    Compares the table driven curves in util.animation with calculating them directly.
+    '''
+    sample = animation.sample
+    _report("sstep", lambda x: sample(animation.SSTEP, x), animation._sstep_curve, n)
+    _report("faster", lambda x: sample(animation.FASTER, x), animation._faster_curve, n)
+    _report("slower", lambda x: sample(animation.SLOWER, x), animation._slower_curve, n)
+    _report("ease out", lambda x: sample(animation.EASE_OUT, x), lambda x: (1 - math.pow(0.01, x)) / 0.99, n)
+    _report("sin", animation.sin_turns, lambda x: math.sin(x * math.tau), n)
+    _report("cos", animation.cos_turns, lambda x: math.cos(x * math.tau), n)
+
+def _mem_alloc() -> int:
+    try:
+        return gc.mem_alloc()
+    except AttributeError:
+        return 0
+
+def rng(n: int=10000, buckets: int=16):
+    '''
+    Speed and quality of util.static_random, against the float hash generator it used to use.
+    Quality is a chi-squared test of randrange(0, buckets) over n rolls. With 16 buckets,
+    anything under about 30 is fine (p = 0.01), far above that means the rolls are uneven.
+    '''
+    gc.collect()
+    alloc = _mem_alloc()
+    start = ticks_us()
+    state = 0
+    for _ in range(n):
+        static_random.hash_without_sine(state)
+        state = (state + 1) % (2**24)
+    old = ticks_diff(ticks_us(), start)
+    old_alloc = _mem_alloc() - alloc
+
+    gc.collect()
+    alloc = _mem_alloc()
+    start = ticks_us()
+    for _ in range(n):
+        static_random.getrandbits(24)
+    new = ticks_diff(ticks_us(), start)
+    new_alloc = _mem_alloc() - alloc
+    print(f"24 random bits: xorshift {new}us {new_alloc}B, old float hash {old}us {old_alloc}B")
+
+    start = ticks_us()
+    for _ in range(n):
+        static_random.random()
+    print(f"random: {ticks_diff(ticks_us(), start)}us")
+
+    start = ticks_us()
+    for _ in range(n):
+        static_random.getrandbits(8)
+    print(f"getrandbits(8): {ticks_diff(ticks_us(), start)}us")
+
+    start = ticks_us()
+    for _ in range(n):
+        static_random.randrange(0, 100)
+    print(f"randrange(0, 100): {ticks_diff(ticks_us(), start)}us")
+
+    counts = [0] * buckets
+    for _ in range(n):
+        counts[static_random.randrange(0, buckets)] += 1
+    expected = n / buckets
+    chi2 = 0.0
+    for c in counts:
+        chi2 += (c - expected) * (c - expected) / expected
+    print(f"chi-squared over {buckets} buckets: {chi2}")
+
+    ones = 0
+    for _ in range(n):
+        ones += static_random.getrandbits(1)
+    print(f"bit balance: {ones / n} (should be close to 0.5)")
+
+def encounters(n: int=10000):
+    '''
+    Alias table encounter rolls against the linear scan over cumulative weights they replaced,
+    plus how far the rolled frequencies are from the weights.
+    '''
+    from ..game import mons
+    weights = mons.template_weights()
+    cum = 0
+    cum_weights = []
+    for weight in weights:
+        cum += weight
+        cum_weights.append(cum)
+
+    start = ticks_us()
+    for _ in range(n):
+        value = static_random.randrange(0, cum)
+        i = 0
+        while cum_weights[i] < value:
+            i += 1
+    old = ticks_diff(ticks_us(), start)
+
+    table = mons.get_encounter_table()
+    start = ticks_us()
+    for _ in range(n):
+        table.pick()
+    print(f"{len(table)} mons: alias table {ticks_diff(ticks_us(), start)}us, linear scan {old}us")
+
+    counts = {}
+    for _ in range(n):
+        mon = table.pick()
+        counts[mon] = counts.get(mon, 0) + 1
+    chi2 = 0.0
+    for mon, weight in enumerate(weights):
+        expected = n * weight / cum
+        if expected:
+            chi2 += (counts.get(mon, 0) - expected) ** 2 / expected
+    print(f"chi-squared over {len(table)} mons: {chi2} (around {len(table) - 1} is fine)")
+
+class _Discard:
+    async def write(self, text: str):
+        pass
+
+def battles(n: int=50):
+    '''
+    Plays n CPU against CPU battles headlessly, once with events dropped and once with them rendered to text
+    (which is what the UI pays for), and compares the time taken.
+    '''
+    import asyncio
+    from ..game import battle_events, mons, player
+
+    def make(name: str, seed: int) -> player.Cpu:
+        rng = static_random.Random(seed)
+        team = [mons.Mon(mons.mons_list[rng.randbelow(len(mons.mons_list))], 20, rng=rng) for _ in range(3)]
+        return player.Cpu(name, team, [], {})
+
+    async def run(sink) -> int:
+        from ..game.battle_main import Battle
+        sides = [(make("A", seed), make("B", seed + n)) for seed in range(n)]
+        start = ticks_us()
+        for seed in range(n):
+            await Battle(sides[seed][0], sides[seed][1], None, sink, seed).run()
+        return ticks_diff(ticks_us(), start)
+
+    dropped = asyncio.run(run(battle_events.EventSink()))
+    text = asyncio.run(run(battle_events.NewsSink(_Discard())))
+    print(f"{n} battles: events dropped {dropped}us, rendered to text {text}us")
+
+def ai(n: int=50, budget_us: int=0):
+    '''
+    SearchCpu against the random Cpu, over n battles with the same teams, swapping sides each time.
+    budget_us is the search time per decision, 0 for game.ai's default.
+    '''
+    import asyncio
+    from ..game import ai as game_ai, mons, player
+    from ..game.battle_main import Battle
+
+    def team(seed: int) -> list:
+        rng = static_random.Random(seed)
+        return [mons.Mon(mons.mons_list[rng.randbelow(len(mons.mons_list))], 20, rng=rng) for _ in range(3)]
+
+    async def play() -> int:
+        wins = 0
+        for seed in range(n):
+            smart = game_ai.SearchCpu("search", team(seed), [], {}, budget_us=budget_us or game_ai.BUDGET_US)
+            dumb = player.Cpu("random", team(seed), [], {})
+            if seed & 1:
+                battle = Battle(smart, dumb, None, None, seed)
+            else:
+                battle = Battle(dumb, smart, None, None, seed)
+            if await battle.run() is smart:
+                wins += 1
+        return wins
+
+    start = ticks_us()
+    wins = asyncio.run(play())
+    print(f"search won {wins}/{n} against random, {ticks_diff(ticks_us(), start)}us")
+
+    them = team(1)[0]
+    me = team(1)[1]
+    searcher = game_ai.Searcher(me, them, budget_us or game_ai.BUDGET_US)
+    start = ticks_us()
+    searcher.best_slot(game_ai.SearchState.from_mons(me, them))
+    print(f"one decision: {ticks_diff(ticks_us(), start)}us, depth {searcher.depth}, {searcher.nodes} nodes")
+
+def _float_stats(mon):
+    # Mon.calculate_stats as it was, in floats
+    for i in range(6):
+        base = mon.level + 10 if i == 0 else 5
+        mon.stats[i] = math.floor(
+            ((2 * mon.template.base_stats[i] + mon.ivs[i] + math.floor(mon.evs[i] / 4)) * mon.level) / 100
+        ) + base
+
+def stats(n: int=200):
+    '''
+    Loading a case of n mons (n < 256), and recalculating all their stats, against the old float maths.
+    '''
+    from ..game import mons, player
+
+    rng = static_random.Random(n)
+    case = []
+    for i in range(n):
+        # HP is saved as a byte, so keep levels low enough to fit
+        mon = mons.Mon(mons.mons_list[i % len(mons.mons_list)], 1 + rng.randbelow(50), rng=rng)
+        mon.evs = [rng.randbelow(256) for _ in range(6)]
+        case.append(mon)
+    data = player.Player("bench", case[:6], case, {}).serialise()
+
+    gc.collect()
+    start = ticks_us()
+    player.Player.deserialise(data)
+    print(f"load {n} mon case: {ticks_diff(ticks_us(), start)}us")
+
+    start = ticks_us()
+    for mon in case:
+        _float_stats(mon)
+    old = ticks_diff(ticks_us(), start)
+    expected = [mon.stats[:] for mon in case]
+
+    start = ticks_us()
+    mons.calculate_stats(case)
+    print(f"stats for {n} mons: batch {ticks_diff(ticks_us(), start)}us, floats {old}us")
+    if [mon.stats for mon in case] != expected:
+        print("stats don't match the old maths!")
+
+def _float_catch_rate(mon, ball: float):
+    # calculation.get_catch_rate as it was, in floats
+    three = (3 * mon.stats[0])
+    base = (three - (2 * mon.hp)) / three
+    base *= mon.template.catch_rate
+    base *= ball
+    base *= constants.catch_table[mon.status]
+    base = min(max(base, 0.0), 1.0)
+    return base, 1048560 / math.pow(65280 / base, 0.25)
+
+def _float_experience(mon, target) -> int:
+    # calculation.get_experience as it was, in floats
+    return int(((mon.template.base_exp * target.level) / 5)
+               * math.pow((2 * target.level + 10) / (target.level + mon.level + 10), 2.5) + 1)
+
+def catching(n: int=1000):
+    '''
+    Checks calculation's integer exp and catch maths against the float formulas they replaced, over every
+    level pair up to 100 and every HP, status and ball for a spread of mons, and times n of each.
+    '''
+    from ..game import calculation, mons
+
+    class _Mon:
+        pass
+    user = _Mon()
+    target = _Mon()
+    user.template = mons.mons_list[0]
+    worst = 0
+    for user.level in range(1, 101):
+        for target.level in range(1, 101):
+            worst = max(worst, abs(_float_experience(user, target) - calculation.get_experience(user, target)))
+    print(f"exp: at most {worst} from the float formula")
+
+    worst = 0.0
+    for level in (5, 20, 50, 100):
+        mon = mons.Mon(mons.mons_list[level % len(mons.mons_list)], level)
+        for mon.hp in range(1, mon.stats[0] + 1):
+            for mon.status in range(len(constants.catch_table)):
+                for ball in (1, 1.5, 2):
+                    old = _float_catch_rate(mon, ball)[1]
+                    base, new = calculation.get_catch_rate(mon, ball)
+                    worst = max(worst, abs(old - new))
+    print(f"catch threshold: at most {worst} out of 65536 from the float formula")
+
+    mon = mons.Mon(mons.mons_list[0], 30)
+    start = ticks_us()
+    for _ in range(n):
+        _float_catch_rate(mon, 1.5)
+        _float_experience(mon, mon)
+    old = ticks_diff(ticks_us(), start)
+    start = ticks_us()
+    for _ in range(n):
+        calculation.get_catch_rate(mon, 1.5)
+        calculation.get_experience(mon, mon)
+    print(f"{n} catch rates and exp: integer {ticks_diff(ticks_us(), start)}us, floats {old}us")
+
+def startup():
+    '''
+    What starting the app costs: importing the scene manager (and through it the game data), then each scene's
+    module the first time it's switched to. Importing every scene up front, as it used to, costs the total.
+    Scene and game modules are dropped and imported fresh, so run this from a clean REPL, not with the app running.
+    '''
+    import sys
+    package = __name__.rsplit('.', 2)[0]
+    for name in list(sys.modules):
+        if name.startswith(package + ".scenes.") or name.startswith(package + ".game."):
+            del sys.modules[name]
+
+    gc.collect()
+    alloc = _mem_alloc()
+    start = ticks_us()
+    scene_manager = __import__("scenes.scene_manager", globals(), None, ("SCENE_LIST",), 2)
+    took = ticks_diff(ticks_us(), start)
+    gc.collect()
+    print(f"scene manager: {took}us, {_mem_alloc() - alloc} bytes")
+
+    registry = scene_manager.SceneRegistry(scene_manager.SCENE_LIST._entries)
+    total_time = 0
+    total_alloc = 0
+    for index in range(len(registry)):
+        gc.collect()
+        alloc = _mem_alloc()
+        start = ticks_us()
+        scene_class = registry[index]
+        took = ticks_diff(ticks_us(), start)
+        gc.collect()
+        alloc = _mem_alloc() - alloc
+        total_time += took
+        total_alloc += alloc
+        print(f"  {index} {scene_class.__name__}: {took}us, {alloc} bytes")
+    print(f"all scenes: {total_time}us, {total_alloc} bytes")
+
+def data():
+    '''
+    Importing the move and mon tables, which now only costs their packed bytes, then decoding every mon
+    (and every move they learn), which is what building the lists at import used to cost on top.
+    Game modules are dropped and imported fresh, so run this from a clean REPL, not with the app running.
+    '''
+    import sys
+    package = __name__.rsplit('.', 2)[0]
+    for name in list(sys.modules):
+        if name.startswith(package + ".game."):
+            del sys.modules[name]
+
+    gc.collect()
+    alloc = _mem_alloc()
+    start = ticks_us()
+    mons = __import__("game.mons", globals(), None, ("mons_list",), 2)
+    took = ticks_diff(ticks_us(), start)
+    gc.collect()
+    print(f"import: {took}us, {_mem_alloc() - alloc} bytes")
+
+    alloc = _mem_alloc()
+    start = ticks_us()
+    mons.mons_list[0]
+    took = ticks_diff(ticks_us(), start)
+    gc.collect()
+    print(f"first mon: {took}us, {_mem_alloc() - alloc} bytes")
+
+    alloc = _mem_alloc()
+    start = ticks_us()
+    for _ in mons.mons_list:
+        pass
+    took = ticks_diff(ticks_us(), start)
+    gc.collect()
+    print(f"every mon: {took}us, {_mem_alloc() - alloc} bytes")
+
+def saves(n: int=100):
+    '''
+    Serialising and loading a save with n mons in the case (n < 256), through the schemas in util/schema.py.
+    Allocations count everything allocated along the way, garbage included, as collection is off while timing.
+    '''
+    from ..game import mons, game_context
+
+    rng = static_random.Random(n)
+    context = game_context.GameContext()
+    for i in range(n):
+        # HP is saved as a byte, so keep levels low enough to fit
+        context.player.badgemon_case.append(mons.Mon(mons.mons_list[i % len(mons.mons_list)], 1 + rng.randbelow(50),
+                                                     rng=rng))
+    context.player.badgemon = context.player.badgemon_case[:6]
+
+    gc.collect()
+    gc.disable()
+    try:
+        alloc = _mem_alloc()
+        start = ticks_us()
+        data = context.serialise()
+        took = ticks_diff(ticks_us(), start)
+        print(f"serialise {len(data)} bytes: {took}us, {_mem_alloc() - alloc} bytes allocated")
+
+        gc.collect()
+        alloc = _mem_alloc()
+        start = ticks_us()
+        game_context.GameContext.load(data)
+        took = ticks_diff(ticks_us(), start)
+        print(f"load: {took}us, {_mem_alloc() - alloc} bytes allocated")
+    finally:
+        gc.enable()
@@ -1,27 +1,70 @@
 import asyncio
 import display
 import gc
-import math
 
 from sys import implementation as _sys_implementation
 if _sys_implementation.name != "micropython":
     from typing import Callable, List, Tuple, Union
-    ChoiceTree = Tuple[str, List[Tuple[str, Union['ChoiceTree', Callable]]]]
+    ChoiceTree = Tuple[str, List[Tuple[str, Union['ChoiceTree', 'Submenu', Callable]]]]
 from system.eventbus import eventbus
 from events.input import ButtonDownEvent, BUTTON_TYPES
 from app import App
 
 from ctx import Context
 from ..util.misc import *
+from ..util.animation import AnimationScheduler
+from ..util.tween import Tween
+
+
+class Submenu:
+    '''
+    A choice whose tree is only built, by build(*args), when it's entered. build can also give a callable, which is
+    then chosen like any other. What's built is kept for the next time, for as long as the Submenu is.
+    '''
+    def __init__(self, build: Callable, *args):
+        self._build = build
+        self._args = args
+        self._tree = None
+
+    def expand(self) -> Union[ChoiceTree, Callable]:
+        if self._tree is None:
+            self._tree = self._build(*self._args)
+        return self._tree
 
 
 class ChoiceDialog:
     def _calc_sizes(self, ctx):
-        self._sizes = [shrink_until_fit(ctx, choice[0], 150, 30) for choice in self._current_tree[1]]
-    
+        '''
+        Measures the rows of the current tree, and builds a prefix sum of their heights.
+        Layouts are cached per tree, and only thrown away by set_choices.
+        '''
+        layout = self._layouts.get(id(self._current_tree))
+        if layout is None:
+            sizes = [shrink_until_fit(ctx, choice[0], 150, 30) for choice in self._current_tree[1]]
+            offsets = [0]
+            for size in sizes:
+                offsets.append(offsets[-1] + size)
+            layout = (sizes, offsets)
+            self._layouts[id(self._current_tree)] = layout
+        self._sizes, self._offsets = layout
+
     def _get_pos(self, index):
-        return sum(self._sizes[0:index])
-            
+        return self._offsets[index]
+
+    def _first_visible(self, top):
+        '''
+        Binary search for the first row whose position is at or below "top".
+        '''
+        lo = 0
+        hi = len(self._sizes)
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if self._offsets[mid] < top:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
     def __init__(self, app: App, choices: ChoiceTree=("",[]), no_exit = False):
         self._tree = choices
         self._app = app
@@ -33,8 +76,12 @@ class ChoiceDialog:
         self._selected = 0
         self._selected_visually = 0
         self._opened_amount = 0.0
+        self._opener = Tween(app, self._set_opened_amount, on_end=self._on_transition_end)
+        self._scroll = Tween(app, self._set_selected_visually)
         self._no_exit = no_exit
         self._sizes = []
+        self._offsets = [0]
+        self._layouts = {}
         self.opened_event = asyncio.Event()
         self.closed_event = asyncio.Event()
         self.closed_event.set()
@@ -60,51 +107,51 @@ class ChoiceDialog:
         self._cleanup()
         await self.closed_event.wait()
 
+    def choices(self) -> ChoiceTree:
+        return self._tree
+
     def set_choices(self, choices: ChoiceTree=(None, []), no_exit = False):
         self._tree = choices
+        self._layouts = {}
         if self._state != "CLOSED":
             self._previous_trees = []
             self._current_tree = self._tree
             self._selected = 0
-            self._selected_visually = 0
+            self._scroll.jump(0)
         self._no_exit = no_exit
         if no_exit:
             self.open()
 
+    def _set_opened_amount(self, x):
+        self._opened_amount = x
+
+    def _set_selected_visually(self, x):
+        self._selected_visually = x
+
+    def _on_transition_end(self):
+        if self._state == "OPENING":
+            self._state = "OPEN"
+            self.opened_event.set()
+        elif self._state == "CLOSING":
+            self._state = "CLOSED"
+            self._open = False
+            self.closed_event.set()
+
     def update(self, delta: float):
         if self.is_open():
             if self._state == "CLOSED":
                 self._previous_trees = []
                 self._current_tree = self._tree
                 self._selected = 0
-                self._selected_visually = 0
+                self._scroll.jump(0)
                 self._state = "OPENING"
                 self.closed_event.clear()
                 self.opened_event.clear()
-                self._opened_amount = 0.0
+                self._opener.jump(0.0)
+                self._opener.to(1.0)
                 eventbus.on(ButtonDownEvent, self._handle_buttondown, self._app)
-            if self._state == "OPENING":
-                if self._opened_amount > 0.99:
-                    self._opened_amount = 1.0
-                    self._state = "OPEN"
-                    self.opened_event.set()
-                    return
-                weight = math.pow(0.8, (delta/10))
-                self._opened_amount = (self._opened_amount * (weight)) + (1-weight)
-            elif self._state == "CLOSING":
-                if self._opened_amount < 0.01:
-                    self._opened_amount = 0.0
-                    self._state = "CLOSED"
-                    self._open = False
-                    self.closed_event.set()
-                    return
-                weight = math.pow(0.8, (delta/10))
-                self._opened_amount = self._opened_amount * weight
-            if self._sizes:
-                ypos = self._get_pos(self._selected)
-                if self._selected_visually != ypos:
-                    weight = math.pow(0.8, (delta/10))
-                    self._selected_visually = (self._selected_visually * (weight)) + (ypos * (1-weight))
+            if self._sizes and self._selected < len(self._sizes):
+                self._scroll.to(self._get_pos(self._selected))
 
     def _draw_focus_plane(self, ctx: Context, width: float):
         ctx.rgba(0.3, 0.3, 0.3, 0.8).rectangle((-80)*width, -120, (160)*width, 240).fill()
@@ -138,14 +185,13 @@ class ChoiceDialog:
                 self._draw_text(ctx, current_header, -80, False, header=True)
             ctx.rectangle((-80)*self._opened_amount, -60, (160)*self._opened_amount, 180).clip()
             self._calc_sizes(ctx)
-            for i, choice in enumerate(self._current_tree[1]):
-                ctx.font_size = self._sizes[i]
-                ypos = self._get_pos(i)-self._selected_visually
-                if ypos < -80:
-                    continue
+            choices = self._current_tree[1]
+            for i in range(self._first_visible(self._selected_visually - 80), len(choices)):
+                ypos = self._offsets[i]-self._selected_visually
                 if ypos > 120:
                     break
-                self._draw_text(ctx, choice[0], ypos, self._selected == i)
+                ctx.font_size = self._sizes[i]
+                self._draw_text(ctx, choices[i][0], ypos, self._selected == i)
             ctx.restore()
 
     def _handle_buttondown(self, event: ButtonDownEvent):
@@ -156,6 +202,8 @@ class ChoiceDialog:
                 self._selected = (self._selected + 1 + len(self._current_tree[1])) % len(self._current_tree[1])
             if BUTTON_TYPES["CONFIRM"] in event.button or BUTTON_TYPES["RIGHT"] in event.button:
                 c = self._current_tree[1][self._selected][1]
+                if isinstance(c, Submenu):
+                    c = c.expand()
                 if callable(c):
                     c()
                     self._cleanup()
@@ -177,9 +225,11 @@ class ChoiceDialog:
         self._state = "CLOSING"
         self.closed_event.clear()
         self.opened_event.clear()
+        self._opener.to(0.0)
 
 class ChoiceExample(App):
     def __init__(self):
+        self._animation_scheduler = AnimationScheduler()
         self._choice = ChoiceDialog(
             app=self,
             choices=("Choice Test",[("thing 1", lambda a: a._set_answer("1")),
@@ -199,6 +249,7 @@ class ChoiceExample(App):
 
     def update(self, delta: float):
         print(f"ANSWER: {self.answer}")
+        self._animation_scheduler.update(delta)
         self._choice.update(delta)
 
     async def background_update(self):
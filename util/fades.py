@@ -1,11 +1,12 @@
-import math
 from sys import implementation as _sys_implementation
 if _sys_implementation.name != "micropython":
     from typing import Tuple
-from ..util.animation import Animation, lerp
+from ..util.animation import Animation, lerp, sin_turns, cos_turns
 from ctx import Context
 
 class FadeToShade(Animation):
+    critical = True
+
     def __init__(self, colour: Tuple[float,float,float], fadein = False, *args, **kwargs) -> None:
         self._colour = colour
         self._fade = 0
@@ -38,13 +39,17 @@ class FadeToShade(Animation):
     def draw(self, ctx: Context):
         ctx.rgba(*self._colour, self._fade).rectangle(-120,-120,240,240).fill()
 
+# Where each of the 8 wedges starts, these never move.
+_SPOKES = [(140*cos_turns(i/8), 140*sin_turns(i/8)) for i in range(8)]
+
 class BattleFadeToShade(FadeToShade):
     def draw(self, ctx: Context):
         ctx.rgb(*self._colour)
         for i in range(8):
+            spoke = _SPOKES[i]
+            turns = (i+self._fade)/8
             ctx.move_to(0,0)
-            ctx.line_to(140*math.cos(math.pi/4*(i)),
-                     140*math.sin(math.pi/4*(i)))
-            ctx.line_to(140*math.cos(math.pi/4*(i+self._fade)),
-                     140*math.sin(math.pi/4*(i+self._fade)))
+            ctx.line_to(spoke[0], spoke[1])
+            ctx.line_to(140*cos_turns(turns),
+                     140*sin_turns(turns))
             ctx.fill()
\ No newline at end of file
@@ -0,0 +1,125 @@
+import gc
+from sys import implementation as _sys_implementation
+
+from ..util.misc import ticks_us, ticks_diff
+
+# How long a frame has, in microseconds. Collections only run in what's left of it once the frame is drawn.
+FRAME_BUDGET_US = 33000
+# Collect once this many bytes have been allocated since the last collection.
+ALLOC_THRESHOLD = 16 * 1024
+# Past this many, collect even without the time for it (but still not during a critical animation),
+# rather than leave it for the allocator to do at a worse moment.
+URGENT_THRESHOLD = 4 * ALLOC_THRESHOLD
+# What a collection is assumed to cost until one has been timed.
+INITIAL_COST_US = 5000
+
+def _mem_alloc() -> int:
+    try:
+        return gc.mem_alloc()
+    except AttributeError:
+        return 0
+
+class GcScheduler:
+    '''
+    Runs the garbage collector when it'll be least noticed, instead of whenever an allocation happens to trigger it.
+
+    Automatic collection is switched off for the whole interpreter, not just this app, so it's only off while the app
+    is working on a frame: SceneManager pauses it as update and draw start, and resumes it as they finish, however
+    they finish. Between frames, and whenever the app's in the background or has stopped, it's back on. SceneManager
+    calls idle at the end of every frame, which collects once ALLOC_THRESHOLD bytes have been allocated, as long as
+    what's left of FRAME_BUDGET_US covers what collections have been taking, and no critical animation (like a fade)
+    is playing. A collection can't be split up, so this is at most one per frame, and only when it should fit.
+
+    With a profiler, it counts "gc runs" and "gc us", and the frames it waited for time ("gc deferred") or for a
+    critical animation to finish ("gc held").
+    '''
+    def __init__(self, animation_scheduler=None, profiler=None):
+        self._animations = animation_scheduler
+        self._profiler = profiler
+        self._holds = 0
+        self._baseline = _mem_alloc()
+        self._running = False
+        self.cost_us = INITIAL_COST_US
+        self.runs = 0
+
+    def start(self):
+        # Only on the badge: on desktop mem_alloc isn't there to go by, so CPython's own collector is left alone.
+        if _sys_implementation.name != "micropython":
+            return
+        self._running = True
+        self.collect()
+
+    def stop(self):
+        if self._running:
+            gc.enable()
+            self._running = False
+
+    def pause(self):
+        '''
+        Switches automatic collection off until resume, for the frame that's starting.
+        '''
+        if self._running:
+            gc.disable()
+
+    def resume(self):
+        if self._running:
+            gc.enable()
+
+    def hold(self):
+        '''
+        Keeps collections off until release, for anything that can't afford a dropped frame but isn't an animation.
+        '''
+        self._holds += 1
+
+    def release(self):
+        if self._holds > 0:
+            self._holds -= 1
+
+    def _held(self) -> bool:
+        if self._holds:
+            return True
+        return self._animations is not None and self._animations.critical_running()
+
+    def collect(self) -> int:
+        '''
+        Collects now, e.g. while the screen is faded out between scenes.
+        :return: How long it took, in microseconds.
+        '''
+        start = ticks_us()
+        gc.collect()
+        took = ticks_diff(ticks_us(), start)
+        # Smoothed, but rising straight away, so one quick collection doesn't hide how slow they can be
+        if took > self.cost_us:
+            self.cost_us = took
+        else:
+            self.cost_us = (self.cost_us * 3 + took) >> 2
+        self._baseline = _mem_alloc()
+        self.runs += 1
+        if self._profiler is not None:
+            self._profiler.count("gc runs")
+            self._profiler.count("gc us", took)
+        return took
+
+    def idle(self, frame_start: int):
+        '''
+        Collects if it's due and there's time left in the frame that started at frame_start (from ticks_us).
+        '''
+        if not self._running:
+            return
+        allocated = _mem_alloc() - self._baseline
+        if allocated < 0:
+            # The allocator had to collect by itself
+            self._baseline = _mem_alloc()
+            return
+        if allocated < ALLOC_THRESHOLD:
+            return
+        if self._held():
+            if self._profiler is not None:
+                self._profiler.count("gc held")
+            return
+        left = FRAME_BUDGET_US - ticks_diff(ticks_us(), frame_start)
+        if left < self.cost_us and allocated < URGENT_THRESHOLD:
+            if self._profiler is not None:
+                self._profiler.count("gc deferred")
+            return
+        self.collect()
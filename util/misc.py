@@ -3,6 +3,17 @@ from ..config import ASSET_PATH
 import sys
 import os
 
+try:
+    from time import ticks_us, ticks_diff
+except ImportError:
+    from time import perf_counter
+
+    def ticks_us():
+        return int(perf_counter() * 1000000)
+
+    def ticks_diff(a, b):
+        return a - b
+
 def ctx_line(self: Context, x: float, y: float, x2: float, y2: float):
     return self.move_to(x,y).line_to(x2,y2)
 
@@ -30,6 +41,28 @@ def draw_mon(ctx: Context, monIndex: int, x: float, y: float, flipx: bool, flipy
     ctx.translate(-x,-y)
     ctx.scale(xscale,yscale)
 
+class OverlaySlot:
+    '''
+    A fixed entry in app.overlays that draws whatever is currently put in it.
+    Showing or hiding something is O(1), and never resizes the overlay list.
+    '''
+    def __init__(self):
+        self.overlay = None
+
+    def show(self, overlay):
+        self.overlay = overlay
+
+    def hide(self, overlay):
+        '''
+        Stops drawing overlay, if it is the one being shown.
+        '''
+        if self.overlay is overlay:
+            self.overlay = None
+
+    def draw(self, ctx: Context):
+        if self.overlay is not None:
+            self.overlay.draw(ctx)
+
 def dump_exception(e: Exception):
     if sys.implementation.name == "micropython":
         sys.print_exception(e)
@@ -0,0 +1,127 @@
+import gc
+from sys import implementation as _sys_implementation
+
+from ctx import Context
+from ..util.misc import ticks_us, ticks_diff
+
+# Upper edge of each frame time bucket in microseconds. The last bucket catches everything slower.
+BUCKETS = (8000, 16000, 33000, 50000, 100000)
+BUCKET_NAMES = ("<8", "<16", "<33", "<50", "<100", "100+")
+# How many frames the histogram covers.
+WINDOW = 120
+# How often (in frames) the summary is logged, when logging is on.
+LOG_EVERY = 300
+
+def _mem_alloc() -> int:
+    try:
+        return gc.mem_alloc()
+    except AttributeError:
+        return 0
+
+class NullProfiler:
+    '''
+    Stands in for FrameProfiler when PROFILE is off, so the frame loop times itself the same way either way, for
+    the cost of a few empty calls.
+    '''
+    def start(self) -> int:
+        return 0
+
+    def stop(self, name: str, start: int):
+        pass
+
+    def draw(self, ctx: Context):
+        pass
+
+    def end_frame(self):
+        pass
+
+class FrameProfiler:
+    '''
+    Opt-in frame timing, switched on with PROFILE in config.py.
+
+    SceneManager times each part of the frame with start/stop, then calls end_frame once the frame is drawn.
+    Sections are named "<part> <update/draw>", e.g. "scene draw". Anything else that wants to report
+    stats can use count. Allocations are the change in gc.mem_alloc() between frames, and a drop in
+    it is counted as a collection. The profiler's own drawing is timed too, as "profiler draw", so it's
+    part of the frame time (the overlay shows the previous frame's, as it's drawn before its own time is taken).
+    '''
+    def __init__(self, log: bool = _sys_implementation.name != "micropython"):
+        self._log = log
+        self.sections = {}
+        self.counters = {}
+        self.frames = 0
+        self.frame_us = 0
+        self.alloc = 0
+        self.gc_count = 0
+        self._last_alloc = _mem_alloc()
+        # Bucket of each frame in the window, 255 for frames that haven't happened yet.
+        self._window = bytearray(b'\xff' * WINDOW)
+        self._window_pos = 0
+        self.histogram = [0] * (len(BUCKETS) + 1)
+
+    def start(self) -> int:
+        return ticks_us()
+
+    def stop(self, name: str, start: int):
+        self.sections[name] = ticks_diff(ticks_us(), start)
+
+    def count(self, name: str, n: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def end_frame(self):
+        self.frames += 1
+        total = 0
+        for us in self.sections.values():
+            total += us
+        self.frame_us = total
+
+        alloc = _mem_alloc()
+        if alloc < self._last_alloc:
+            self.gc_count += 1
+            self.alloc = alloc
+        else:
+            self.alloc = alloc - self._last_alloc
+        self._last_alloc = alloc
+
+        bucket = 0
+        while bucket < len(BUCKETS) and total >= BUCKETS[bucket]:
+            bucket += 1
+        old = self._window[self._window_pos]
+        if old != 255:
+            self.histogram[old] -= 1
+        self._window[self._window_pos] = bucket
+        self.histogram[bucket] += 1
+        self._window_pos = (self._window_pos + 1) % WINDOW
+
+        if self._log and self.frames % LOG_EVERY == 0:
+            print(self.summary())
+
+    def summary(self) -> str:
+        sections = " ".join(f"{name}: {us}us" for name, us in self.sections.items())
+        counters = " ".join(f"{name}: {n}" for name, n in self.counters.items())
+        histogram = " ".join(f"{name}ms: {n}" for name, n in zip(BUCKET_NAMES, self.histogram))
+        summary = (f"frame {self.frames}: {self.frame_us}us, {sections}, alloc: {self.alloc}B, gc: {self.gc_count}\n"
+                   f"  last {WINDOW} frames {histogram}")
+        if counters:
+            summary += f"\n  {counters}"
+        return summary
+
+    def draw(self, ctx: Context):
+        ctx.save()
+        ctx.font_size = 12
+        ctx.text_align = Context.LEFT
+        ctx.text_baseline = Context.MIDDLE
+        ctx.rgba(0, 0, 0, 0.6).rectangle(-85, -80, 170, 60).fill()
+        ctx.rgb(1, 1, 1)
+        ctx.move_to(-80, -72).text(f"{self.frame_us // 1000}ms {self.alloc}B gc {self.gc_count}")
+        y = -62
+        for part in ("anim", "dialogs", "scene", "overlays"):
+            update = self.sections.get(part + " update", 0)
+            draw = self.sections.get(part + " draw", 0)
+            ctx.move_to(-80, y).text(f"{part} {update // 1000}/{draw // 1000}ms")
+            y += 10
+        # One bar per bucket, fastest on the left
+        for i, n in enumerate(self.histogram):
+            height = (n * 40) // WINDOW
+            ctx.rectangle(40 + i * 7, -25 - height, 6, height).fill()
+        ctx.restore()
@@ -0,0 +1,46 @@
+from struct import calcsize, unpack_from
+
+from sys import implementation as _sys_implementation
+if _sys_implementation.name != "micropython":
+    from typing import Callable, Tuple
+
+
+def text(blob: bytes, offset: int, length: int) -> str:
+    return blob[offset:offset + length].decode()
+
+
+class RecordTable:
+    """
+    A read-only list of objects, packed into bytes as fixed size struct records (see tools/build_data.py).
+
+    An object is only built, by build(index, fields), the first time it's looked up, and is then kept, so looking
+     the same index up again gives the same object. Until then it costs nothing but its bytes.
+    """
+    def __init__(self, blob: bytes, fmt: str, build: Callable[[int, Tuple], object]):
+        self._blob = blob
+        self._fmt = fmt
+        self._size = calcsize(fmt)
+        self._build = build
+        self._items = [None] * (len(blob) // self._size)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index: int):
+        item = self._items[index]
+        if item is None:
+            if index < 0:
+                index += len(self._items)
+            item = self._build(index, self.record(index))
+            self._items[index] = item
+        return item
+
+    def __iter__(self):
+        for index in range(len(self._items)):
+            yield self[index]
+
+    def record(self, index: int) -> Tuple:
+        """
+        The raw fields of the record at index, without building anything.
+        """
+        return unpack_from(self._fmt, self._blob, index * self._size)
@@ -0,0 +1,107 @@
+import asyncio
+import os
+
+from sys import implementation as _sys_implementation
+if _sys_implementation.name != "micropython":
+    from typing import Callable, Union
+
+from ..util.misc import path_isdir
+
+# Bytes written between yields to the scheduler
+CHUNK = 512
+
+class SaveWriter:
+    '''
+    Writes the save in the background, so that nothing on screen waits on serialising it or on the flash.
+
+    request() can be called as often as is convenient. Requests that come in before or during a write are coalesced
+    into one more write, of the game as it is when that write starts. Writing waits until busy() is False (e.g. while
+    a fade plays), then goes to a temporary file in CHUNK byte pieces, yielding between them, and finally replaces the
+    save, so a write that's cut off leaves the old save whole. flush() writes straight away, for when the app stops.
+    '''
+    def __init__(self, directory: str, name: str, serialise: Callable[[], bytes],
+                 busy: Union[Callable[[], bool], None] = None):
+        self._directory = directory
+        self._path = directory + name
+        self._tmp_path = self._path + ".tmp"
+        self._serialise = serialise
+        self._busy = busy
+        self._pending = False
+        self._task = None
+        self._file = None
+        # Bumped by flush, so a cancelled write knows it's been replaced
+        self._generation = 0
+        self._done = asyncio.Event()
+        self._done.set()
+        self.writes = 0
+
+    def request(self):
+        self._pending = True
+        self._done.clear()
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(self._generation))
+
+    async def wait(self):
+        '''
+        Until everything requested so far has been written.
+        '''
+        await self._done.wait()
+
+    def _open(self):
+        if not path_isdir(self._directory):
+            os.mkdir(self._directory)
+        self._file = open(self._tmp_path, "wb")
+        return self._file
+
+    def _replace(self):
+        self._file.close()
+        self._file = None
+        os.rename(self._tmp_path, self._path)
+        self.writes += 1
+
+    async def _run(self, generation: int):
+        try:
+            while self._pending:
+                # Let whatever asked for the save finish its frame (and any fade) first
+                await asyncio.sleep(0)
+                while self._busy is not None and self._busy():
+                    await asyncio.sleep(0.05)
+                self._pending = False
+                data = memoryview(self._serialise())
+                f = self._open()
+                for i in range(0, len(data), CHUNK):
+                    f.write(data[i:i + CHUNK])
+                    await asyncio.sleep(0)
+                self._replace()
+        except OSError as e:
+            print(f"Couldn't save: {e}")
+        finally:
+            if self._generation == generation:
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                self._task = None
+                self._done.set()
+
+    def flush(self):
+        '''
+        Writes the save now, dropping any write that's in progress.
+        '''
+        self._generation += 1
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._pending = False
+        try:
+            self._open().write(self._serialise())
+            self._replace()
+        except OSError as e:
+            print(f"Couldn't save: {e}")
+        finally:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        self._done.set()
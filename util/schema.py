@@ -0,0 +1,344 @@
+from struct import calcsize, pack_into, unpack_from
+
+from sys import implementation as _sys_implementation
+if _sys_implementation.name != "micropython":
+    from typing import Callable, Dict, Sequence, Tuple
+
+
+class Int:
+    """
+    An unsigned integer, as one struct code: 'B', 'H', 'I' or 'Q'.
+    """
+    def __init__(self, code: str):
+        self.fmt = code
+        self.count = 1
+        self._limit = 1 << (8 * calcsize(code))
+
+    def check(self, value, name: str):
+        if not isinstance(value, int) or not 0 <= value < self._limit:
+            raise ValueError(f"{name}: {repr(value)} isn't a {self.fmt}")
+
+
+class Array:
+    """
+    A fixed number of unsigned integers, as a list.
+    """
+    def __init__(self, code: str, length: int):
+        self.fmt = f"{length}{code}"
+        self.count = length
+        self._item = Int(code)
+
+    def check(self, value, name: str):
+        if len(value) != self.count:
+            raise ValueError(f"{name}: {len(value)} items, not {self.count}")
+        for v in value:
+            self._item.check(v, name)
+
+
+class Bytes:
+    """
+    Raw bytes, after their length as prefix (a struct code).
+    """
+    fmt = None
+
+    def __init__(self, prefix: str = 'B'):
+        self._prefix = Int(prefix)
+        self._prefix_fmt = '<' + prefix
+        self._prefix_size = calcsize(prefix)
+
+    def check(self, value, name: str):
+        self._prefix.check(len(value), name)
+
+    def size(self, value) -> int:
+        return self._prefix_size + len(value)
+
+    def pack_into(self, buf, offset: int, value) -> int:
+        length = len(value)
+        pack_into(f"{self._prefix_fmt}{length}s", buf, offset, length, value)
+        return offset + self._prefix_size + length
+
+    def _span(self, buf, offset: int) -> Tuple[int, int]:
+        length = unpack_from(self._prefix_fmt, buf, offset)[0]
+        offset += self._prefix_size
+        if offset + length > len(buf):
+            raise ValueError(f"{length} bytes needed, only {len(buf) - offset} left")
+        return offset, offset + length
+
+    def unpack_from(self, buf, offset: int):
+        start, end = self._span(buf, offset)
+        return bytes(buf[start:end]), end
+
+
+class Str(Bytes):
+    """
+    UTF-8 text, after its length in bytes.
+    """
+    def check(self, value, name: str):
+        if not isinstance(value, str):
+            raise ValueError(f"{name}: {repr(value)} isn't text")
+        super().check(value.encode(), name)
+
+    def size(self, value) -> int:
+        return super().size(value.encode())
+
+    def pack_into(self, buf, offset: int, value) -> int:
+        return super().pack_into(buf, offset, value.encode())
+
+    def unpack_from(self, buf, offset: int):
+        start, end = self._span(buf, offset)
+        return str(buf[start:end], "utf-8"), end
+
+
+class ListOf:
+    """
+    Any number of items (each a field or a Schema), as a list, after how many there are.
+    """
+    fmt = None
+
+    def __init__(self, item, prefix: str = 'B'):
+        self._item = item
+        self._count = Int(prefix)
+        self._count_fmt = '<' + prefix
+        self._count_size = calcsize(prefix)
+        # Items that are struct codes get packed and unpacked with one call each
+        self._item_fmt = None if item.fmt is None else '<' + item.fmt
+        self._item_size = 0 if item.fmt is None else calcsize(self._item_fmt)
+        self._item_count = 0 if item.fmt is None else item.count
+        self._single = isinstance(item, Int)
+        # The format for each number of items, as they're needed
+        self._formats = {}
+
+    def _items_fmt(self, count: int) -> str:
+        fmt = self._formats.get(count)
+        if fmt is None:
+            fmt = '<' + self._item_fmt[1:] * count
+            self._formats[count] = fmt
+        return fmt
+
+    def check(self, value, name: str):
+        self._count.check(len(value), name)
+        for i, v in enumerate(value):
+            self._item.check(v, f"{name}[{i}]")
+
+    def size(self, value) -> int:
+        if self._item_fmt is not None:
+            return self._count_size + len(value) * self._item_size
+        size = self._count_size
+        item_size = self._item.size
+        for v in value:
+            size += item_size(v)
+        return size
+
+    def pack_into(self, buf, offset: int, value) -> int:
+        pack_into(self._count_fmt, buf, offset, len(value))
+        offset += self._count_size
+        if self._item_fmt is not None:
+            # All the items in one call
+            if not self._single:
+                value = [x for v in value for x in v]
+            pack_into(self._items_fmt(len(value) // self._item_count), buf, offset, *value)
+            return offset + len(value) // self._item_count * self._item_size
+        item_pack_into = self._item.pack_into
+        for v in value:
+            offset = item_pack_into(buf, offset, v)
+        return offset
+
+    def unpack_from(self, buf, offset: int):
+        count = unpack_from(self._count_fmt, buf, offset)[0]
+        offset += self._count_size
+        items = []
+        if self._item_fmt is not None:
+            flat = unpack_from(self._items_fmt(count), buf, offset)
+            offset += count * self._item_size
+            if self._single:
+                return list(flat), offset
+            n = self._item_count
+            for i in range(0, len(flat), n):
+                items.append(flat[i:i + n])
+            return items, offset
+        item_unpack_from = self._item.unpack_from
+        for _ in range(count):
+            item, offset = item_unpack_from(buf, offset)
+            items.append(item)
+        return items, offset
+
+
+class Sized:
+    """
+    A Schema, after its length in bytes, so that what reads it can tell it's all there (and nothing else is).
+    """
+    fmt = None
+
+    def __init__(self, schema: 'Schema', prefix: str = 'B'):
+        self._schema = schema
+        self._length = Int(prefix)
+        self._length_fmt = '<' + prefix
+        self._length_size = calcsize(prefix)
+
+    def check(self, value, name: str):
+        self._schema.check(value, name)
+        self._length.check(self._schema.size(value), name)
+
+    def size(self, value) -> int:
+        return self._length_size + self._schema.size(value)
+
+    def pack_into(self, buf, offset: int, value) -> int:
+        end = self._schema.pack_into(buf, offset + self._length_size, value)
+        pack_into(self._length_fmt, buf, offset, end - offset - self._length_size)
+        return end
+
+    def unpack_from(self, buf, offset: int):
+        length = unpack_from(self._length_fmt, buf, offset)[0]
+        offset += self._length_size
+        value, end = self._schema.unpack_from(buf, offset)
+        if end != offset + length:
+            raise ValueError(f"{self._schema.name} is {end - offset} bytes, but was saved as {length}")
+        return value, end
+
+
+U8 = Int('B')
+U16 = Int('H')
+U32 = Int('I')
+U64 = Int('Q')
+
+
+class Schema:
+    """
+    The layout of a record in bytes, declared as (name, field) pairs. Records are tuples of values in the same order,
+     which the classes being saved make and take (see e.g. Mon.serialise).
+
+    When the schema's made, it generates its own size, pack_into and unpack_from functions, written out field by
+     field, with neighbouring fixed size fields (Int and Array) run together into one struct format, so each run is
+     a single pack_into or unpack_from call. pack works out the size first and packs into one bytearray, and
+     unpack_from reads in place from offsets, so neither builds up or slices out intermediate bytes. Everything is
+     little-endian, with no padding.
+
+    A schema is also a field itself, to go in a ListOf or Sized.
+    """
+    def __init__(self, name: str, *fields: Tuple[str, object]):
+        self.name = name
+        self.names = tuple(field_name for field_name, _ in fields)
+        self._fields = tuple(field for _, field in fields)
+        self.count = len(self._fields)
+        # Runs of fixed size fields, as (start, end, fmt, size)
+        runs = []
+        start = None
+        for i, field in enumerate(self._fields + (None,)):
+            if isinstance(field, (Int, Array)):
+                if start is None:
+                    start = i
+            elif start is not None:
+                fmt = '<' + ''.join(f.fmt for f in self._fields[start:i])
+                runs.append((start, i, fmt, calcsize(fmt)))
+                start = None
+        # A schema that's one run of Ints is itself fixed size, for a ListOf to pack with one call per item
+        if len(runs) == 1 and runs[0][:2] == (0, len(self._fields)) and \
+                all(isinstance(f, Int) for f in self._fields):
+            self.fmt = runs[0][2][1:]
+        else:
+            self.fmt = None
+        self._generate(runs)
+
+    def _generate(self, runs):
+        fixed = 0
+        size = []
+        pack = ["def pack_into(buf, o, v):"]
+        unpack = ["def unpack_from(buf, o):"]
+        run_at = {run[0]: run for run in runs}
+        i = 0
+        while i < len(self._fields):
+            if i in run_at:
+                start, end, fmt, run_size = run_at[i]
+                fixed += run_size
+                args = []
+                reads = []
+                j = 0
+                for k in range(start, end):
+                    field = self._fields[k]
+                    if isinstance(field, Int):
+                        args.append(f"v[{k}]")
+                        reads.append(f" v{k} = t[{j}]")
+                    else:
+                        args += [f"v[{k}][{n}]" for n in range(field.count)]
+                        items = ", ".join("t[" + str(j + n) + "]" for n in range(field.count))
+                        reads.append(f" v{k} = [{items}]")
+                    j += field.count
+                args = ", ".join(args)
+                pack.append(f" _pack_into('{fmt}', buf, o, {args})")
+                pack.append(f" o += {run_size}")
+                unpack.append(f" t = _unpack_from('{fmt}', buf, o)")
+                unpack += reads
+                unpack.append(f" o += {run_size}")
+                i = end
+            else:
+                size.append(f"f{i}.size(v[{i}])")
+                pack.append(f" o = f{i}.pack_into(buf, o, v[{i}])")
+                unpack.append(f" v{i}, o = f{i}.unpack_from(buf, o)")
+                i += 1
+        pack.append(" return o")
+        values = "".join("v" + str(k) + ", " for k in range(len(self._fields)))
+        unpack.append(f" return ({values}), o")
+        size = " + ".join([str(fixed)] + size)
+        source = "\n".join([f"def size(v):\n return {size}"] + pack + unpack)
+        namespace = {"_pack_into": pack_into, "_unpack_from": unpack_from}
+        for k, field in enumerate(self._fields):
+            namespace[f"f{k}"] = field
+        exec(source, namespace)
+        # These take the place of methods, so calling them doesn't go through self
+        self.size = namespace["size"]
+        self.pack_into = namespace["pack_into"]
+        self.unpack_from = namespace["unpack_from"]
+
+    def check(self, values: Sequence, name: str = None):
+        """
+        Raises ValueError unless values fit this schema.
+        """
+        name = self.name if name is None else name
+        if len(values) != len(self._fields):
+            raise ValueError(f"{name}: {len(values)} values for {len(self._fields)} fields")
+        for field_name, field, value in zip(self.names, self._fields, values):
+            field.check(value, f"{name}.{field_name}")
+
+    def pack(self, values: Sequence, offset: int = 0) -> bytearray:
+        """
+        :param offset: Bytes to leave free at the start, e.g. for a header.
+        """
+        buf = bytearray(offset + self.size(values))
+        self.pack_into(buf, offset, values)
+        return buf
+
+    def unpack(self, buf, offset: int = 0) -> tuple:
+        """
+        The record in buf at offset. (unpack_from(buf, offset) also gives the offset after it.)
+        """
+        return self.unpack_from(memoryview(buf), offset)[0]
+
+
+class Versions:
+    """
+    Every version there's been of a schema, and how to bring records up from each one to the next.
+
+    upgrades[v] takes a record of version v and gives one of version v + 1. Versions without a layout change can
+     share a schema. Each upgraded record is checked against its new version's schema, so a step that gets the
+     layout wrong fails as it runs, instead of leaving bad bytes to be written back.
+    """
+    def __init__(self, schemas: Dict[int, Schema], upgrades: Dict[int, Callable[[tuple], tuple]]):
+        self.schemas = schemas
+        self.upgrades = upgrades
+        self.latest = max(schemas)
+        for version in schemas:
+            if version != self.latest and (version not in upgrades or version + 1 not in schemas):
+                raise ValueError(f"no upgrade from version {version}")
+
+    def unpack(self, version: int, buf, offset: int = 0) -> tuple:
+        """
+        Reads a record saved as version, and upgrades it to the latest.
+        """
+        if version not in self.schemas:
+            raise ValueError(f"unknown version {version}")
+        values = self.schemas[version].unpack(buf, offset)
+        while version != self.latest:
+            values = self.upgrades[version](values)
+            version += 1
+            self.schemas[version].check(values)
+        return values
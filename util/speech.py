@@ -1,11 +1,12 @@
 import asyncio
-import math
 
 from system.eventbus import eventbus
 from events.input import ButtonDownEvent
 from app import App
 
 from ctx import Context
+from ..util.animation import AnimationScheduler
+from ..util.tween import Tween
 
 MAX_LINE_WIDTH = 200
 BOX_WIDTH = 200
@@ -21,6 +22,8 @@ class SpeechDialog:
         self._current_line = 1.0
         self._current_line_visually = 1.0
         self._opened_amount = 0.0
+        self._opener = Tween(app, self._set_opened_amount, on_end=self._on_transition_end)
+        self._scroll = Tween(app, self._set_current_line_visually, 1.0)
         self._ready_event = asyncio.Event()
         self._ready_event.set()
         self._stay_open = False
@@ -49,46 +52,39 @@ class SpeechDialog:
         self._speech = speech
         self._lines = []
         self._current_line = 1.0
-        self._current_line_visually = 1.0
+        self._scroll.jump(1.0)
 
     def _goto_start(self):
         if len(self._lines) < 2:
             self._current_line = 0.0
-            self._current_line_visually = 0.0
         elif len(self._lines) == 2:
             self._current_line = 0.5
-            self._current_line_visually = 0.5
         else:
             self._current_line = 1.0
-            self._current_line_visually = 1.0
+        self._scroll.jump(self._current_line)
+
+    def _set_opened_amount(self, x):
+        self._opened_amount = x
+
+    def _set_current_line_visually(self, x):
+        self._current_line_visually = x
+
+    def _on_transition_end(self):
+        if self._state == "OPENING":
+            self._state = "OPEN"
+        elif self._state == "CLOSING":
+            self._state = "CLOSED"
+            self._open = False
+            self._lines = []
+            self._ready_event.set()
 
     def update(self, delta: float):
-        if self.is_open():
-            if self._state == "CLOSED":
-                self._state = "OPENING"
-                self._opened_amount = 0.0
-                self._goto_start()
-                eventbus.on(ButtonDownEvent, self._handle_buttondown, self._app)
-            if self._state == "OPENING":
-                if self._opened_amount > 0.99:
-                    self._opened_amount = 1.0
-                    self._state = "OPEN"
-                    return
-                weight = math.pow(0.8, (delta/10))
-                self._opened_amount = (self._opened_amount * (weight)) + (1-weight)
-            elif self._state == "CLOSING":
-                if self._opened_amount < 0.01:
-                    self._opened_amount = 0.0
-                    self._state = "CLOSED"
-                    self._open = False
-                    self._lines = []
-                    self._ready_event.set()
-                    return
-                weight = math.pow(0.8, (delta/10))
-                self._opened_amount = self._opened_amount * weight
-            if self._current_line_visually != self._current_line:
-                weight = math.pow(0.8, (delta/10))
-                self._current_line_visually = (self._current_line_visually * (weight)) + (self._current_line * (1-weight))
+        if self.is_open() and self._state == "CLOSED":
+            self._state = "OPENING"
+            self._opener.jump(0.0)
+            self._opener.to(1.0)
+            self._goto_start()
+            eventbus.on(ButtonDownEvent, self._handle_buttondown, self._app)
 
     def _draw_focus_plane(self, ctx: Context, height: float):
         ctx.rgba(0.3, 0.3, 0.3, 0.8).rectangle(-120, (-BOX_HEIGHT)*height, 240, (BOX_HEIGHT*2)*height).fill()
@@ -138,13 +134,16 @@ class SpeechDialog:
                 return
             else:
                 self._current_line += 1
+                self._scroll.to(self._current_line)
 
     def _cleanup(self):
         eventbus.remove(ButtonDownEvent, self._handle_buttondown, self._app)
         self._state = "CLOSING"
+        self._opener.to(0.0)
 
 class SpeechExample(App):
     def __init__(self):
+        self._animation_scheduler = AnimationScheduler()
         self._speech = SpeechDialog(
             app=self,
             speech="Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore et dolore magna aliqua. Ut enim ad minim veniam, quis nostrud exercitation ullamco laboris nisi ut aliquip ex ea commodo consequat. Duis aute irure dolor in reprehenderit in voluptate velit esse cillum dolore eu fugiat nulla pariatur. Excepteur sint occaecat cupidatat non proident, sunt in culpa qui officia deserunt mollit anim id est laborum."
@@ -155,6 +154,7 @@ class SpeechExample(App):
         self._speech.open()
 
     def update(self, delta: float):
+        self._animation_scheduler.update(delta)
         self._speech.update(delta)
 
     def _draw_background(self, ctx: Context):
@@ -10,32 +10,103 @@ def hash_without_sine(p:float):
     p *= p + p
     return p - math.trunc(p)
 
-state = 0
+def _bit_length(n):
+    k = 0
+    while n:
+        n >>= 1
+        k += 1
+    return k
 
-def new_state():
-    global state
-    state = int(random()*(2**24))
+class Random:
+    '''
+    An independent random stream. Streams don't share state, so rolling on one never changes what
+    another rolls, e.g. cosmetic animation rolls can't change the outcome of a battle.
+    The same seed always gives the same rolls, which is what makes battles replayable.
+
+    xorshift32 (13, 17, 5), with the state kept as two 16 bit halves.
+    This way every intermediate value is a small int on micropython, so rolling never allocates.
+    '''
+    def __init__(self, seed=0):
+        self._hi = 0
+        self._lo = 1
+        self.seed(seed)
+
+    def seed(self, s):
+        s = int(s)
+        self._hi = (s >> 16) & 0xFFFF
+        self._lo = s & 0xFFFF
+        if self._hi == 0 and self._lo == 0:
+            self._lo = 1
+        # Close seeds (like consecutive times) start out correlated, so mix them a bit first.
+        for _ in range(8):
+            self.getrandbits(0)
+
+    def fork(self) -> 'Random':
+        '''
+        A new stream, seeded from this one.
+        '''
+        return Random(self.getrandbits(30))
 
-def set_state(s):
-    global state
-    state = int(s) % (2**24)
+    def getrandbits(self, n):
+        if n > 30:
+            return (self.getrandbits(n - 30) << 30) | self.getrandbits(30)
+        hi = self._hi
+        lo = self._lo
+        # x ^= x << 13
+        hi ^= ((hi << 13) | (lo >> 3)) & 0xFFFF
+        lo ^= (lo << 13) & 0xFFFF
+        # x ^= x >> 17
+        lo ^= hi >> 1
+        # x ^= x << 5
+        hi ^= ((hi << 5) | (lo >> 11)) & 0xFFFF
+        lo ^= (lo << 5) & 0xFFFF
+        self._hi = hi
+        self._lo = lo
+        return ((hi << 14) | (lo >> 2)) >> (30 - n)
 
-set_state(time.time())
+    def random(self):
+        return self.getrandbits(24) / 16777216
 
-def random():
-    global state
-    r = hash_without_sine(state)
-    state = (state + 1) % (2**24)
-    return r
+    def randbelow(self, n):
+        '''
+        A number from 0 to n-1, all equally likely. Rejects out of range rolls rather than using modulo,
+        so there is no bias towards low numbers.
+        '''
+        k = _bit_length(n - 1)
+        r = self.getrandbits(k)
+        while r >= n:
+            r = self.getrandbits(k)
+        return r
 
-def getrandbits(n):
-    return int(random()*(2**n))
+    def randrange(self, start, end):
+        '''
+        A number from start to end-1. Returns start if the range is empty.
+        '''
+        if end <= start:
+            return start
+        return start + self.randbelow(end - start)
 
-def randrange(start, end):
-    return int((random()*(end-start))+start)
+    def randint(self, start, end):
+        return self.randrange(start, end)
 
-def randint(start, end):
-    return randrange(start, end)
+    def choice(self, choices):
+        return choices[self.randbelow(len(choices))]
+
+# Used by anything that doesn't have its own stream.
+default = Random(time.time())
+# Purely visual rolls, like which insult Slander shows.
+cosmetic = default.fork()
+# Wild encounters: which mon, what level, its IVs and moves.
+encounter = default.fork()
+
+def new_state():
+    default.seed(default.getrandbits(30))
 
-def choice(choices):
-    return choices[int(random()*len(choices))]
\ No newline at end of file
+set_state = default.seed
+fork = default.fork
+getrandbits = default.getrandbits
+random = default.random
+randbelow = default.randbelow
+randrange = default.randrange
+randint = default.randint
+choice = default.choice
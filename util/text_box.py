@@ -1,5 +1,4 @@
 import asyncio
-import math
 
 from ..scenes.scene import Scene
 from system.eventbus import eventbus
@@ -9,6 +8,7 @@ import time
 
 from ctx import Context
 from ..util.misc import *
+from ..util.tween import Tween
 
 VALID_CHAR = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 SPECIAL_CHAR = 2
@@ -25,6 +25,8 @@ class TextDialog:
         self._selected = 0
         self._selected_visually = 0
         self._opened_amount = 0.0
+        self._opener = Tween(app, self._set_opened_amount, on_end=self._on_transition_end)
+        self._scroll = Tween(app, self._set_selected_visually)
         self._no_exit = no_exit
         self.opened_event = asyncio.Event()
         self.closed_event = asyncio.Event()
@@ -59,39 +61,38 @@ class TextDialog:
         if self._state != "CLOSED":
             self.result = ""
             self._selected = 0
-            self._selected_visually = 0
+            self._scroll.jump(0)
         self._no_exit = no_exit
         if no_exit:
             self.open()
 
+    def _set_opened_amount(self, x):
+        self._opened_amount = x
+
+    def _set_selected_visually(self, x):
+        self._selected_visually = x
+
+    def _on_transition_end(self):
+        if self._state == "OPENING":
+            self._state = "OPEN"
+            self.opened_event.set()
+        elif self._state == "CLOSING":
+            self._state = "CLOSED"
+            self._open = False
+            self.closed_event.set()
+
     def update(self, delta: float):
         if self.is_open():
             if self._state == "CLOSED":
                 self._selected = 0
-                self._selected_visually = 0
+                self._scroll.jump(0)
                 self._state = "OPENING"
                 self.closed_event.clear()
                 self.opened_event.clear()
-                self._opened_amount = 0.0
+                self._opener.jump(0.0)
+                self._opener.to(1.0)
                 eventbus.on(ButtonDownEvent, self._handle_buttondown, self._app)
-            if self._state == "OPENING":
-                if self._opened_amount > 0.99:
-                    self._opened_amount = 1.0
-                    self._state = "OPEN"
-                    self.opened_event.set()
-                    return
-                weight = math.pow(0.8, (delta/10))
-                self._opened_amount = (self._opened_amount * (weight)) + (1-weight)
-            elif self._state == "CLOSING":
-                if self._opened_amount < 0.01:
-                    self._opened_amount = 0.0
-                    self._state = "CLOSED"
-                    self._open = False
-                    self.closed_event.set()
-                    return
-                weight = math.pow(0.8, (delta/10))
-                self._opened_amount = self._opened_amount * weight
-            else:
+            elif self._state == "OPEN":
                 if self._app._button_states.get(BUTTON_TYPES["DOWN"]):
                     if time.ticks_diff(time.ticks_ms(), self._time_since_down) > 300:
                         self._selected = (self._selected + 1 + len(VALID_CHAR)+SPECIAL_CHAR) % (len(VALID_CHAR)+SPECIAL_CHAR)
@@ -100,10 +101,7 @@ class TextDialog:
                     if time.ticks_diff(time.ticks_ms(), self._time_since_up) > 300:
                         self._selected = (self._selected - 1 + len(VALID_CHAR)+SPECIAL_CHAR) % (len(VALID_CHAR)+SPECIAL_CHAR)
                         self._time_since_up = time.ticks_add(self._time_since_up, 80)
-                ypos = self._selected * 30
-                if self._selected_visually != ypos:
-                    weight = math.pow(0.8, (delta/10))
-                    self._selected_visually = (self._selected_visually * (weight)) + (ypos * (1-weight))
+                self._scroll.to(self._selected * 30)
 
     def _draw_focus_plane(self, ctx: Context, width: float):
         ctx.rgba(0.3, 0.3, 0.3, 0.8).rectangle((-80)*width, -120, (160)*width, 240).fill()
@@ -182,6 +180,7 @@ class TextDialog:
         self._state = "CLOSING"
         self.closed_event.clear()
         self.opened_event.clear()
+        self._opener.to(0.0)
 
     def get_answer(self, default = ""):
         ans = self.result.strip()
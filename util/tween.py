@@ -0,0 +1,60 @@
+from ..util.animation import EditorAnim, EASE_OUT, lerp, sample
+from app import App
+
+from sys import implementation as _sys_implementation
+if _sys_implementation.name != "micropython":
+    from typing import List
+
+class Tween(EditorAnim):
+    '''
+    Moves a value towards a target over "length" ms, following an easing table from util.animation.
+    Calling "to" while it is playing restarts it from wherever the value currently is, so it can
+    chase a moving target (like a scrolling selection). Runs on the app's animation scheduler,
+    so it is frame rate independent.
+    '''
+    def __init__(self, app: App, editor: callable, value: float=0.0, length: int=200,
+                 table: List[float]=EASE_OUT, on_end: callable=None) -> None:
+        self._app = app
+        self._table = table
+        self._on_end = on_end
+        self.value = value
+        super().__init__(editor, value, value, length)
+
+    def _fun(self, start: float, end: float, time: float):
+        self.value = lerp(start, end, sample(self._table, time))
+        return self.value
+
+    def on_anim_end(self) -> None:
+        self.value = self._end
+        super().on_anim_end()
+        if self._on_end is not None:
+            self._on_end()
+
+    def _stop(self):
+        if self._started and not self._ended:
+            self._app._animation_scheduler.cancel(self)
+        self.reset()
+
+    def to(self, target: float):
+        '''
+        Starts moving towards target. Does nothing if already heading there,
+        and calls on_end straight away if already there.
+        '''
+        if target == self._end and self._started:
+            if self._ended and self._on_end is not None:
+                self._on_end()
+            return
+        self._stop()
+        self._start = self.value
+        self._end = target
+        self._app._animation_scheduler.trigger(self)
+
+    def jump(self, value: float):
+        '''
+        Stops the tween and sets the value immediately. on_end is not called.
+        '''
+        self._stop()
+        self.value = value
+        self._start = value
+        self._end = value
+        self._editor(value)
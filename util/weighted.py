@@ -0,0 +1,52 @@
+from ..util import static_random as random
+
+from sys import implementation as _sys_implementation
+if _sys_implementation.name != "micropython":
+    from typing import Any, List, Tuple
+
+class AliasTable:
+    '''
+    Picks an item with probability proportional to its weight, in constant time however many items there are.
+    Walker's alias method: every column holds its own item up to "prob" out of "total", and the rest of the
+    column belongs to "alias". A pick is a single roll, split into the column and the height within it.
+    Weights are ints and everything stays integer, so building and picking don't allocate floats.
+    '''
+    def __init__(self, entries: List[Tuple[Any, int]]):
+        self.items = [item for item, weight in entries if weight > 0]
+        weights = [weight for item, weight in entries if weight > 0]
+        n = len(weights)
+        self.total = sum(weights)
+        if n == 0:
+            raise ValueError("AliasTable needs at least one positive weight")
+        # Everything is scaled by n, so a column that is exactly full holds "total".
+        scaled = [weight * n for weight in weights]
+        self.prob = [self.total] * n
+        self.alias = list(range(n))
+        small = [i for i in range(n) if scaled[i] < self.total]
+        large = [i for i in range(n) if scaled[i] >= self.total]
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            # The large item tops up the small column, and keeps whatever is left over.
+            scaled[l] += scaled[s] - self.total
+            if scaled[l] < self.total:
+                small.append(l)
+            else:
+                large.append(l)
+        # Whatever is left over is exactly full, which prob already says.
+        self._range = n * self.total
+        self._bits = random._bit_length(self._range - 1)
+
+    def __len__(self):
+        return len(self.items)
+
+    def pick(self, rng: random.Random = random.default):
+        r = rng.getrandbits(self._bits)
+        while r >= self._range:
+            r = rng.getrandbits(self._bits)
+        i, height = divmod(r, self.total)
+        if height < self.prob[i]:
+            return self.items[i]
+        return self.items[self.alias[i]]